@@ -0,0 +1,79 @@
+"""
+    Measures wall time of full-layer operations on a 10 x 10 mm chip
+for flat regions and for deep regions with different
+`BOOLEAN_ENGINE.THREADS` values.
+    Chip ground plane has a grid of pinning holes and a set of
+meandering coplanar gaps erased from it. Timed operations are
+subtraction of the holes and gaps from the ground plane, merge and
+sizing (as in overetching compensation).
+"""
+import os
+import time
+
+import pya
+from pya import Region, Box
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib._PROG_SETTINGS import BOOLEAN_ENGINE
+from classLib.baseClasses import full_layer_boolean, engine_region
+
+
+def chip_regions(chip_size=10e6, holes_step=50e3, hole_size=4e3):
+    ground = Region(Box(0, 0, chip_size, chip_size))
+    empty = Region()
+    holes_n = int(chip_size / holes_step)
+    for i in range(holes_n):
+        for j in range(holes_n):
+            x = i * holes_step + holes_step / 2
+            y = j * holes_step + holes_step / 2
+            empty.insert(Box(x, y, x + hole_size, y + hole_size))
+    # coplanar gaps crossing the holes grid
+    for i in range(100):
+        y = (i + 0.5) * chip_size / 100
+        empty.insert(Box(0, y, chip_size, y + 6e3))
+        empty.insert(Box(0, y + 16e3, chip_size, y + 22e3))
+    return ground, empty
+
+
+def run_operations(ground, empty):
+    timings = {}
+    t = time.perf_counter()
+    full_layer_boolean(ground, empty, "-")
+    timings["subtract"] = time.perf_counter() - t
+
+    reg = engine_region(ground)
+    t = time.perf_counter()
+    reg.merge()
+    timings["merge"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    reg.size(500)
+    timings["size"] = time.perf_counter() - t
+    return timings
+
+
+def benchmark(threads_list=None):
+    """
+    Prints timings of full-layer operations in seconds.
+    """
+    if threads_list is None:
+        threads_list = sorted({1, 2, os.cpu_count() or 1})
+    modes = [(False, 1)] + [(True, threads) for threads in threads_list]
+    for deep_mode, threads in modes:
+        BOOLEAN_ENGINE.DEEP_MODE = deep_mode
+        BOOLEAN_ENGINE.THREADS = threads
+        ground, empty = chip_regions()
+        timings = run_operations(ground, empty)
+        mode_str = f"deep, {threads} threads" if deep_mode else "flat"
+        print(f"{mode_str}: " + ", ".join(
+            f"{key} {val:.2f} s" for key, val in timings.items()
+        ))
+    BOOLEAN_ENGINE.DEEP_MODE = False
+    BOOLEAN_ENGINE.THREADS = os.cpu_count() or 1
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
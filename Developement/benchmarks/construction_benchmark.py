@@ -0,0 +1,77 @@
+"""
+    Measures construction time of deep `ComplexBase` trees.
+    Resonator `EMResonatorTL3QbitWormRLTailXmonFork` consists of
+`CPWRLPath` and `Coil_type_1` objects that are in turn consist of
+`CPW`, `CPWArc` and `CPW2CPWArc` primitives. The resonator is also
+placed into `DPathCPW`-like environment by additional transformations,
+so it is a good representative of a nested design element.
+    Every element is measured with `GEOMETRY_CACHE` disabled and
+enabled.
+"""
+from math import pi
+import timeit
+
+import pya
+from pya import DPoint, DCplxTrans, Trans
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.baseClasses import GEOMETRY_CACHE
+from classLib.coplanars import CPWParameters, DPathCPW, Bridge1
+from classLib.shapes import Circle
+from classLib.resonators import EMResonatorTL3QbitWormRLTailXmonFork
+
+
+def build_resonator():
+    Z_res = CPWParameters(10e3, 6e3)
+    res = EMResonatorTL3QbitWormRLTailXmonFork(
+        Z_res, DPoint(1e6, 2e6), L_coupling=310e3,
+        L0=986e3, L1=114e3, r=60e3, N=3,
+        tail_shape="LRLRL", tail_turn_radiuses=60e3,
+        tail_segment_lengths=[100e3, 300e3, 100e3],
+        tail_turn_angles=[pi / 2, -pi / 2],
+        tail_trans_in=Trans.R270,
+        fork_x_span=200e3, fork_y_span=40e3,
+        fork_metal_width=15e3, fork_gnd_gap=10e3,
+        trans_in=DCplxTrans(1, 90, False, 0, 0)
+    )
+    return res
+
+
+def build_path():
+    Z0 = CPWParameters(20e3, 10e3)
+    pts = [DPoint(i * 500e3, (i % 2) * 500e3) for i in range(20)]
+    return DPathCPW(pts, Z0, 100e3, trans_in=DCplxTrans(1, 30, False, 0, 0))
+
+
+def build_bridges(n=200):
+    return [Bridge1(DPoint(i * 100e3, 0)) for i in range(n)]
+
+
+def build_circles(n=200):
+    return [Circle(DPoint(i * 100e3, 0), 10e3, n_pts=100) for i in range(n)]
+
+
+def benchmark(number=20):
+    """
+    Prints average construction time of elements in ms.
+    """
+    for cache_enabled in [False, True]:
+        GEOMETRY_CACHE.clear()
+        GEOMETRY_CACHE.enabled = cache_enabled
+        print(f"geometry cache enabled: {cache_enabled}")
+        for name, func in [("EMResonatorTL3QbitWormRLTailXmonFork",
+                            build_resonator),
+                           ("DPathCPW 20 points", build_path),
+                           ("200 x Bridge1", build_bridges),
+                           ("200 x Circle", build_circles)]:
+            t = timeit.timeit(func, number=number) / number
+            print(f"    {name}: {t * 1e3:.2f} ms")
+        print(f"    cache statistics: {GEOMETRY_CACHE.info()}")
+    GEOMETRY_CACHE.enabled = True
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,85 @@
+"""
+    Builds a grid of straight `CPW` lines interleaved with `CPWRLPath`
+meanders (elements composed of primitives) and finds clearance
+violations with `ElementIndex`. Index build and check times are printed.
+    Elements are placed so that only their ground gaps come closer than
+the clearance. Every such pair has to be reported whatever kinds of
+elements it consists of, since footprints of both kinds include gaps.
+"""
+import time
+from math import pi
+
+import pya
+from pya import DPoint, Trans
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.coplanars import CPWParameters, CPW, CPWRLPath
+from classLib.helpers.element_index import ElementIndex
+
+
+def build_index(rows_n=10, cols_n=10, clearance=20e3):
+    """
+    Returns index filled with elements and expected number of
+    violating pairs.
+    """
+    Z = CPWParameters(10e3, 6e3)
+    # gaps of the line and of the meander are closer than `clearance`,
+    # while metal of one element is farther than `clearance` from
+    # the gap of the other one
+    gaps_distance = clearance - Z.gap / 2
+    dx = Z.width + 2 * Z.gap + gaps_distance
+    index = ElementIndex()
+    for row in range(rows_n):
+        y = row * 1e6
+        for col in range(cols_n):
+            x = col * 1e6
+            index.insert(
+                f"cpw[{row}, {col}]",
+                CPW(start=DPoint(x, y), end=DPoint(x, y + 500e3),
+                    cpw_params=Z)
+            )
+            # meander with its first straight section `dx` to the
+            # right of the line that turns away from the line
+            index.insert(
+                f"path[{row}, {col}]",
+                CPWRLPath(DPoint(x + dx, y), "LRL", Z, 60e3,
+                          [500e3, 200e3], [-pi / 2], trans_in=Trans.R90)
+            )
+    # every line is too close to its meander only
+    return index, rows_n * cols_n
+
+
+def benchmark():
+    """
+    Prints timings of the clearance check and verifies that every
+    line-meander pair is reported.
+    """
+    clearance = 20e3
+    t = time.perf_counter()
+    index, violations_expected = build_index(clearance=clearance)
+    t_build = time.perf_counter() - t
+
+    t = time.perf_counter()
+    violations = index.clearance_violations(clearance)
+    t_check = time.perf_counter() - t
+
+    print(f"{len(index)} elements: "
+          f"build: {t_build * 1e3:.1f} ms, "
+          f"clearance check: {t_check * 1e3:.1f} ms, "
+          f"violations: {len(violations)} "
+          f"(expected {violations_expected})")
+    assert len(violations) == violations_expected
+
+    # footprint of the meander includes its gaps the same way as the
+    # footprint of the line does
+    cpw_fp = index.footprint("cpw[0, 0]")
+    path_fp = index.footprint("path[0, 0]")
+    assert cpw_fp.bbox().width() == 22000
+    assert path_fp.bbox().left == cpw_fp.bbox().right + 17000
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,73 @@
+"""
+    Measures startup and draw time of a `ChipDesign` subclass outside
+of KLayout GUI. Design module is loaded from file, first
+`ChipDesign` subclass found in it is instantiated, drawn and saved to
+a temporary GDS file.
+    Can be run by plain python interpreter with `klayout` package
+installed, e.g.
+    python headless_benchmark.py ../../Projects/Dmon/Design.py
+"""
+import os
+import sys
+import re
+import tempfile
+import time
+import importlib.util
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+if PROJECT_DIR not in sys.path:
+    sys.path.append(PROJECT_DIR)
+
+from classLib.chipDesign import ChipDesign, gui_available
+
+DEFAULT_DESIGN = os.path.join(PROJECT_DIR, "Projects", "Dmon", "Design.py")
+
+
+def load_design_class(design_path):
+    with open(design_path, encoding="utf-8") as file:
+        cls_name = re.search(r"class (\w+)\(ChipDesign\)",
+                             file.read()).group(1)
+    spec = importlib.util.spec_from_file_location("design_module",
+                                                  design_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, cls_name)
+
+
+def benchmark(design_path=DEFAULT_DESIGN):
+    """
+    Prints import, construction, draw and save timings in seconds.
+    """
+    print(f"GUI available: {gui_available()}")
+    timings = {}
+    t = time.perf_counter()
+    design_cls = load_design_class(design_path)
+    timings["import"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    design: ChipDesign = design_cls("testScript")
+    timings["init"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    design.draw()
+    design.show()
+    timings["draw"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    design.save_as_gds2(
+        os.path.join(tempfile.mkdtemp(), design_cls.__name__ + ".gds")
+    )
+    timings["save"] = time.perf_counter() - t
+
+    print(design_cls.__name__ + ": " + ", ".join(
+        f"{key} {val:.2f} s" for key, val in timings.items()
+    ))
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(sys.argv[1])
+    else:
+        benchmark()
@@ -0,0 +1,94 @@
+"""
+    Compares flat and hierarchical (`CellInstancer`) output of
+repeated elements. Grid of `Bridge1` elements is written into GDS
+file flat, as separate cell instances and as a single regular array
+instance. GDS file size, placement time and write time are
+printed for the ground-touching layer ("bridges_1" region) that
+consists of repeated geometry only.
+    Erasure of bridges' empty regions ("bridges_2" region) from the
+flat ground plane is timed separately, since the ground plane
+remains flat in both cases.
+"""
+import os
+import tempfile
+import time
+
+import pya
+from pya import DPoint, DVector, DCplxTrans, Region
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.chipDesign import CellInstancer, ChipDesign
+from classLib.coplanars import Bridge1
+
+
+def bridges_transs(nx, ny, step=100e3):
+    return [DCplxTrans(1, 0, False, i * step, j * step)
+            for i in range(nx) for j in range(ny)]
+
+
+def write_gds(layout, cell):
+    filename = os.path.join(tempfile.mkdtemp(), cell.name + ".gds")
+    t = time.perf_counter()
+    layout.write(filename)
+    dt = time.perf_counter() - t
+    return os.path.getsize(filename), dt
+
+
+def benchmark(nx=100, ny=100, step=100e3):
+    """
+    Prints GDS size and timings of flat and hierarchical output of
+    `nx` x `ny` bridges.
+    """
+    transs = bridges_transs(nx, ny, step)
+    prototype = Bridge1(DPoint(0, 0))
+    for mode in ["flat", "instances", "array"]:
+        layout = pya.Layout()
+        layout.dbu = 0.001
+        cell = layout.create_cell(mode)
+        layer_1 = layout.layer(pya.LayerInfo(1, 0))
+        layer_2 = layout.layer(pya.LayerInfo(2, 0))
+        region_1 = Region()
+        ground_2 = Region(pya.Box(-step, -step, nx * step, ny * step))
+
+        t = time.perf_counter()
+        if mode == "instances":
+            instancer = CellInstancer(cell)
+            instancer.place(prototype, transs, layer_1,
+                            region_id="bridges_1", dest=region_1)
+        elif mode == "array":
+            instancer = CellInstancer(cell)
+            instancer.place_array(prototype, DCplxTrans(), DVector(step, 0),
+                                  DVector(0, step), nx, ny, layer_1,
+                                  region_id="bridges_1", dest=region_1)
+        else:
+            ChipDesign._place_copies(prototype, transs, "bridges_1",
+                                     region_1)
+            cell.shapes(layer_1).insert(region_1)
+        t_place = time.perf_counter() - t
+
+        t = time.perf_counter()
+        if mode == "instances":
+            instancer.place(prototype, transs, layer_2,
+                            region_id="bridges_2", dest=ground_2)
+        elif mode == "array":
+            instancer.place_array(prototype, DCplxTrans(), DVector(step, 0),
+                                  DVector(0, step), nx, ny, layer_2,
+                                  region_id="bridges_2", dest=ground_2)
+        else:
+            ChipDesign._place_copies(prototype, transs, "bridges_2",
+                                     ground_2)
+        t_ground = time.perf_counter() - t
+
+        size, t_write = write_gds(layout, cell)
+        print(f"{mode}: "
+              f"{nx * ny} bridges, place: {t_place * 1e3:.1f} ms, "
+              f"write: {t_write * 1e3:.1f} ms, "
+              f"GDS size: {size / 1e3:.1f} kB, "
+              f"ground erase: {t_ground * 1e3:.1f} ms")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
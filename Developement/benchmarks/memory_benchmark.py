@@ -0,0 +1,105 @@
+"""
+    Measures peak memory consumption of the `Design8Q.draw()` from
+`Projects/8Q_Disp_Xmons/Design_fast/Design_fast.py`.
+    Besides peak RSS of the process, number of polygon vertices that are
+held by all design elements in their regions is reported. The latter number
+is platform independent and can be compared between library versions
+to check for geometry duplication along nested primitives trees.
+"""
+import os
+import sys
+import importlib.util
+import itertools
+
+import pya
+
+from classLib.baseClasses import ElementBase, ComplexBase
+
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+DESIGN_PATH = os.path.join(
+    PROJECT_ROOT, "Projects", "8Q_Disp_Xmons", "Design_fast",
+    "Design_fast.py"
+)
+
+
+def peak_rss_mb():
+    """
+    Returns peak resident set size of the current process in MB.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 2**20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # bytes on macOS, kilobytes on Linux
+        return peak / 2**20
+    return peak / 2**10
+
+
+def _vertices_n(region):
+    return sum(poly.num_points() for poly in region.each())
+
+
+def stored_vertices_n(element):
+    """
+    Counts polygon vertices that are stored in `element` regions and in
+    regions of all its primitives.
+    Aggregate regions of `ComplexBase` objects that are not
+    assembled yet are not counted.
+    """
+    if isinstance(element, ComplexBase):
+        if hasattr(element, "_metal_regions"):
+            # `_metal_regions` is `None` until aggregate is assembled
+            metal_regions = element._metal_regions or {}
+            empty_regions = element._empty_regions or {}
+        else:
+            # library versions with eagerly assembled aggregates
+            metal_regions = element.metal_regions
+            empty_regions = element.empty_regions
+        regions = itertools.chain(metal_regions.values(),
+                                  empty_regions.values())
+        vertices_n = sum(_vertices_n(reg) for reg in regions)
+        for primitive in element.primitives.values():
+            vertices_n += stored_vertices_n(primitive)
+        return vertices_n
+    elif isinstance(element, ElementBase):
+        regions = itertools.chain(element.metal_regions.values(),
+                                  element.empty_regions.values())
+        return sum(_vertices_n(reg) for reg in regions)
+    return 0
+
+
+def load_design_module():
+    spec = importlib.util.spec_from_file_location("Design_fast",
+                                                  DESIGN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def benchmark():
+    design_module = load_design_module()
+    rss_before = peak_rss_mb()
+    design = design_module.Design8Q("testScript")
+    design.draw()
+    rss_after = peak_rss_mb()
+
+    elements = itertools.chain(
+        design.resonators, design.xmons, design.squids,
+        design.test_squids, design.cpw_md_lines, design.cpw_fl_lines,
+        [design.cpwrl_ro_line1, design.cpwrl_ro_line2]
+    )
+    vertices_n = sum(stored_vertices_n(element) for element in elements)
+    print(f"peak RSS before draw: {rss_before:.1f} MB")
+    print(f"peak RSS after draw: {rss_after:.1f} MB")
+    print(f"vertices stored in design elements: {vertices_n}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
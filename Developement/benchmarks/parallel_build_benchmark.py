@@ -0,0 +1,71 @@
+"""
+    Measures construction time of independent design parts executed
+sequentially and by `ChipDesign.run_build_tasks()` in a process pool.
+Every task constructs a resonator together with its tail.
+    Has to be run outside of KLayout GUI, e.g.
+    python parallel_build_benchmark.py
+"""
+import os
+import sys
+import time
+from math import pi
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+if PROJECT_DIR not in sys.path:
+    sys.path.append(PROJECT_DIR)
+
+from pya import DPoint, DCplxTrans, Trans, Region
+
+from classLib.chipDesign import ChipDesign, BuildTask
+from classLib.coplanars import CPWParameters
+from classLib.resonators import EMResonatorTL3QbitWormRLTailXmonFork
+
+
+def build_resonators(origin, n=4):
+    Z_res = CPWParameters(10e3, 6e3)
+    placements = []
+    for i in range(n):
+        res = EMResonatorTL3QbitWormRLTailXmonFork(
+            Z_res, origin + DPoint(i * 800e3, 0), L_coupling=310e3,
+            L0=986e3, L1=114e3, r=60e3, N=3,
+            tail_shape="LRLRL", tail_turn_radiuses=60e3,
+            tail_segment_lengths=[100e3, 300e3, 100e3],
+            tail_turn_angles=[pi / 2, -pi / 2],
+            tail_trans_in=Trans.R270,
+            fork_x_span=200e3, fork_y_span=40e3,
+            fork_metal_width=15e3, fork_gnd_gap=10e3,
+            trans_in=DCplxTrans(1, 90, False, 0, 0)
+        )
+        placements.append(("region_ph", res))
+    return placements, res.end
+
+
+class BenchmarkDesign(ChipDesign):
+    def draw(self, design_params=None):
+        pass
+
+
+def benchmark(tasks_n=16, max_workers=None):
+    """
+    Prints build time for sequential and parallel execution and
+    checks that geometry is identical.
+    """
+    results = {}
+    for workers in [1, max_workers]:
+        design = BenchmarkDesign("testScript")
+        tasks = [BuildTask(build_resonators, DPoint(0, i * 3e6))
+                 for i in range(tasks_n)]
+        t = time.perf_counter()
+        design.run_build_tasks(tasks, max_workers=workers)
+        dt = time.perf_counter() - t
+        results[workers] = design.region_ph
+        print(f"max_workers={workers} (CPUs: {os.cpu_count()}): "
+              f"{tasks_n} tasks, {dt:.2f} s")
+    diff = results[1] ^ results[max_workers]
+    print(f"geometry is identical: {diff.is_empty()}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,49 @@
+"""
+    Compares `fill_holes` applied to polygons one by one with
+`pinning_holes` that selects cell array lattice by tiles.
+    Chip ground plane has a set of coplanar gaps erased from it.
+Wall time and number of holes are printed for both generators and for
+different numbers of threads.
+"""
+import os
+import time
+
+import pya
+from pya import Region, Box
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.helpers.pinning_grid import fill_holes, pinning_holes, \
+    PinningGrid
+
+
+def ground_region(chip_size=10e6, gaps_step=240e3, gap=30e3):
+    ground = Region(Box(0, 0, chip_size, chip_size))
+    for i in range(int(chip_size / gaps_step)):
+        x = 100e3 + i * gaps_step
+        ground -= Region(Box(x, 200e3, x + gap, chip_size - 200e3))
+    ground.merge()
+    return ground
+
+
+def benchmark(chip_size=10e6):
+    ground = ground_region(chip_size)
+    t = time.perf_counter()
+    filled = Region()
+    for poly in ground.each():
+        filled.insert(fill_holes(poly, d=40e3, width=15e3, height=15e3))
+    print(f"fill_holes by polygons: {time.perf_counter() - t:.2f} s, "
+          f"holes: {(ground - filled).count()}")
+
+    grid = PinningGrid(dx=40e3, dy=40e3, width=15e3, height=15e3)
+    for threads in sorted({1, os.cpu_count() or 1}):
+        t = time.perf_counter()
+        holes = pinning_holes(ground, grid, d=40e3, threads=threads)
+        print(f"pinning_holes, threads: {threads}, "
+              f"{time.perf_counter() - t:.2f} s, holes: {holes.count()}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,57 @@
+"""
+    Routes a coplanar line through a set of walls with `GridRouter` for
+several grid cell sizes. Rasterization and routing times together with
+the length of the resulting `DPathCPW` are printed.
+"""
+import time
+from math import pi
+
+import pya
+from pya import DPoint, DBox, Box, Region
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.coplanars import CPWParameters, DPathCPW
+from classLib.helpers import GridRouter
+
+
+def build_obstacles():
+    obstacles = Region()
+    obstacles.insert(Box(2000000, 0, 2100000, 8000000))
+    obstacles.insert(Box(4000000, 2000000, 4100000, 10000000))
+    obstacles.insert(Box(6000000, 0, 6100000, 8000000))
+    obstacles.insert(Box(7000000, 8500000, 9000000, 8600000))
+    return obstacles
+
+
+def benchmark():
+    """
+    Prints routing statistics for a set of grid cell sizes.
+    """
+    Z = CPWParameters(10e3, 6e3)
+    turn_radius = 60e3
+    chip_box = DBox(DPoint(0, 0), DPoint(10e6, 10e6))
+    obstacles = build_obstacles()
+    for cell_size in [50e3, 20e3, 10e3, 5e3]:
+        t = time.perf_counter()
+        router = GridRouter(obstacles, chip_box, cell_size=cell_size,
+                            clearance=20e3)
+        t_raster = time.perf_counter() - t
+
+        t = time.perf_counter()
+        pts = router.route(DPoint(500e3, 500e3), DPoint(9500e3, 9500e3), Z,
+                           turn_radius, start_angle=pi / 2, end_angle=0)
+        t_route = time.perf_counter() - t
+
+        line = DPathCPW(pts, Z, turn_radius)
+        print(f"grid {router.nx}x{router.ny}: "
+              f"raster: {t_raster * 1e3:.1f} ms, "
+              f"route: {t_route * 1e3:.1f} ms, "
+              f"turns: {len(pts) - 2}, "
+              f"length: {line.length() / 1e3:.1f} um")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,72 @@
+"""
+    Routes a coplanar line across a chip covered by hundreds or thousands
+of random rectangular obstacles with `GridRouter`. Routing time, number
+of turns and length of the route are printed for every set of
+obstacles. The densest set leaves no route at all, so the whole free
+area of the grid is searched before `None` is returned.
+"""
+import time
+import random
+from math import pi
+
+import pya
+from pya import DPoint, DBox, Box, Region
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.coplanars import CPWParameters, DPathCPW
+from classLib.helpers import GridRouter
+
+
+def build_obstacles(boxes_n, max_size=300e3, chip_size=10e6, keepout=700e3,
+                    seed=0):
+    """
+    Returns region of `boxes_n` random boxes at most `max_size` wide.
+    Boxes that overlap squares of `keepout` size at the opposite corners
+    of the chip are dropped, so terminals of the route are left free.
+    """
+    rnd = random.Random(seed)
+    obstacles = Region()
+    for _ in range(boxes_n):
+        w = rnd.uniform(0.2, 1) * max_size
+        h = rnd.uniform(0.2, 1) * max_size
+        x = rnd.uniform(0, chip_size - w)
+        y = rnd.uniform(0, chip_size - h)
+        if (x < keepout and y < keepout) or \
+                (x + w > chip_size - keepout and y + h > chip_size - keepout):
+            continue
+        obstacles.insert(Box(int(x), int(y), int(x + w), int(y + h)))
+    return obstacles
+
+
+def benchmark():
+    """
+    Prints routing statistics for sets of obstacles of increasing
+    density.
+    """
+    Z = CPWParameters(10e3, 6e3)
+    turn_radius = 60e3
+    chip_box = DBox(DPoint(0, 0), DPoint(10e6, 10e6))
+    for boxes_n, cell_size in [(300, 10e3), (1000, 10e3), (3000, 5e3)]:
+        router = GridRouter(build_obstacles(boxes_n), chip_box,
+                            cell_size=cell_size, clearance=20e3)
+
+        t = time.perf_counter()
+        pts = router.route(DPoint(300e3, 300e3), DPoint(9700e3, 9700e3), Z,
+                           turn_radius, start_angle=pi / 2, end_angle=0)
+        t_route = time.perf_counter() - t
+
+        stats = "no route"
+        if pts is not None:
+            line = DPathCPW(pts, Z, turn_radius)
+            stats = f"turns: {len(pts) - 2}, " \
+                    f"length: {line.length() / 1e3:.1f} um"
+        print(f"{boxes_n} boxes, grid {router.nx}x{router.ny}, "
+              f"blocked: {router.blocked.mean() * 100:.0f}%: "
+              f"route: {t_route * 1e3:.1f} ms, {stats}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
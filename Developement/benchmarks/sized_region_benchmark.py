@@ -0,0 +1,54 @@
+"""
+    Compares `sized_region` applied to the whole region with its tiled
+version for isotropic and anisotropic biases, including biases of
+different signs along `x` and `y`.
+    Region is a grid of rectangles and rotated pads with holes.
+Wall time of both versions and area of their xor are printed. Xor
+consists of slivers along tile boundaries, where diagonal edges are cut
+and cut points are rounded to the database grid. Xor area left after
+shrinking it by 1 nm has to be zero.
+"""
+import time
+
+import pya
+from pya import Region, Box, ICplxTrans
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.helpers import sized_region
+
+
+def test_region(size=4e6, step=200e3):
+    reg = Region()
+    n = int(size / step)
+    for i in range(n):
+        for j in range(n):
+            x, y = i * step, j * step
+            if (i + j) % 2:
+                reg.insert(Box(x, y, x + step / 2, y + 3 * step / 4))
+            else:
+                pad = Region(Box(-40e3, -40e3, 40e3, 40e3)) - \
+                      Region(Box(-10e3, -10e3, 10e3, 10e3))
+                reg += pad.transformed(ICplxTrans(1, 30, False, x, y))
+    return reg
+
+
+def benchmark(tile_size=500e3):
+    reg = test_region()
+    for dx, dy in [(3e3, 3e3), (3e3, 1e3), (3e3, -1e3), (-3e3, 1e3)]:
+        t = time.perf_counter()
+        whole = sized_region(reg, dx, dy)
+        t_whole = time.perf_counter() - t
+        t = time.perf_counter()
+        tiled = sized_region(reg, dx, dy, tile_size=tile_size)
+        t_tiled = time.perf_counter() - t
+        xor = whole ^ tiled
+        print(f"dx: {dx:.0f}, dy: {dy:.0f}, whole: {t_whole:.2f} s, "
+              f"tiled: {t_tiled:.2f} s, xor area: {xor.area()}, "
+              f"beyond rounding: {xor.sized(-1).area()}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
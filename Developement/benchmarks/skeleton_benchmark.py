@@ -0,0 +1,64 @@
+"""
+    Compares construction of resonators in usual and `SkeletonMode`.
+Construction time, length and bounding box of the resonator are
+printed for both modes.
+"""
+import time
+from math import pi
+
+import pya
+from pya import DPoint, DCplxTrans, Trans
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.baseClasses import GEOMETRY_CACHE, SkeletonMode
+from classLib.coplanars import CPWParameters
+from classLib.resonators import EMResonatorTL3QbitWormRLTailXmonFork
+
+
+def build_resonator(L1, r):
+    Z_res = CPWParameters(10e3, 6e3)
+    return EMResonatorTL3QbitWormRLTailXmonFork(
+        Z_res, DPoint(0, 0), L_coupling=310e3,
+        L0=986e3, L1=L1, r=r, N=3,
+        tail_shape="LRLRL", tail_turn_radiuses=r,
+        tail_segment_lengths=[100e3, 300e3, 100e3],
+        tail_turn_angles=[pi / 2, -pi / 2],
+        tail_trans_in=Trans.R270,
+        fork_x_span=200e3, fork_y_span=40e3,
+        fork_metal_width=15e3, fork_gnd_gap=10e3,
+        trans_in=DCplxTrans(1, 90, False, 0, 0)
+    )
+
+
+def benchmark(sweep_n=100):
+    """
+    Prints timings of the `(L1, r)` sweep for both construction modes.
+    """
+    params_list = [(100e3 + i * 1e3, 50e3 + i * 100)
+                   for i in range(sweep_n)]
+    for skeleton in [False, True]:
+        GEOMETRY_CACHE.clear()
+        t = time.perf_counter()
+        if skeleton:
+            with SkeletonMode():
+                resonators = [build_resonator(*params)
+                              for params in params_list]
+        else:
+            resonators = [build_resonator(*params)
+                          for params in params_list]
+            # bounding box is taken from regions of primitives
+            for resonator in resonators:
+                resonator.bbox()
+        dt = time.perf_counter() - t
+        resonator = resonators[-1]
+        print(f"skeleton: {skeleton}, "
+              f"per resonator: {dt / sweep_n * 1e3:.2f} ms, "
+              f"length: {resonator.length(exception='fork') / 1e3:.3f} um, "
+              f"bbox: {resonator.bbox()}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
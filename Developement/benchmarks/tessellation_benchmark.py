@@ -0,0 +1,85 @@
+"""
+    Compares fixed (`PROGRAM.ARC_PTS_N`) and chord-error driven
+(`PROGRAM.ARC_CHORD_ERROR`) arc tessellation on a set of resonators.
+Total vertex count, merge time and GDS size are printed.
+"""
+import os
+import tempfile
+import time
+from math import pi
+
+import pya
+from pya import DPoint, DCplxTrans, Trans, Region
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib._PROG_SETTINGS import PROGRAM
+from classLib.baseClasses import GEOMETRY_CACHE
+from classLib.coplanars import CPWParameters
+from classLib.resonators import EMResonatorTL3QbitWormRLTailXmonFork
+from classLib.shapes import Circle
+
+
+def build_region(resonators_n=8):
+    reg = Region()
+    Z_res = CPWParameters(10e3, 6e3)
+    for i in range(resonators_n):
+        EMResonatorTL3QbitWormRLTailXmonFork(
+            Z_res, DPoint(i * 1e6, 0), L_coupling=310e3,
+            L0=986e3, L1=114e3, r=60e3 + i * 10e3, N=3,
+            tail_shape="LRLRL", tail_turn_radiuses=60e3,
+            tail_segment_lengths=[100e3, 300e3, 100e3],
+            tail_turn_angles=[pi / 2, -pi / 2],
+            tail_trans_in=Trans.R270,
+            fork_x_span=200e3, fork_y_span=40e3,
+            fork_metal_width=15e3, fork_gnd_gap=10e3,
+            trans_in=DCplxTrans(1, 90, False, 0, 0)
+        ).place(reg)
+        # small circles, e.g. SQUID pads
+        for j in range(20):
+            Circle(DPoint(i * 1e6 + j * 20e3, -200e3), 5e3).place(reg)
+    return reg
+
+
+def region_stats(reg):
+    vertices_n = sum(poly.num_points() for poly in reg.each())
+    t = time.perf_counter()
+    merged = reg.merged()
+    t_merge = time.perf_counter() - t
+
+    layout = pya.Layout()
+    layout.dbu = 0.001
+    cell = layout.create_cell("top")
+    cell.shapes(layout.layer(pya.LayerInfo(1, 0))).insert(merged)
+    filename = os.path.join(tempfile.mkdtemp(), "tessellation.gds")
+    layout.write(filename)
+    return vertices_n, t_merge, os.path.getsize(filename)
+
+
+def benchmark(chord_error=25):
+    """
+    Prints tessellation statistics for fixed and adaptive modes.
+
+    Parameters
+    ----------
+    chord_error : float
+        `PROGRAM.ARC_CHORD_ERROR` of the adaptive mode in dbu
+    """
+    default_chord_error = PROGRAM.ARC_CHORD_ERROR
+    for mode_chord_error in [None, chord_error]:
+        PROGRAM.ARC_CHORD_ERROR = mode_chord_error
+        GEOMETRY_CACHE.clear()
+        vertices_n, t_merge, gds_size = region_stats(build_region())
+        mode_str = f"ARC_PTS_N = {PROGRAM.ARC_PTS_N}" \
+            if mode_chord_error is None \
+            else f"ARC_CHORD_ERROR = {mode_chord_error}"
+        print(f"{mode_str}: vertices: {vertices_n}, "
+              f"merge: {t_merge * 1e3:.1f} ms, "
+              f"GDS size: {gds_size / 1e3:.1f} kB")
+    PROGRAM.ARC_CHORD_ERROR = default_chord_error
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,63 @@
+"""
+    Compares post-processing of the whole reticle layer stage by stage
+with `TiledPipeline` that runs all stages tile by tile.
+    Reticle consists of `CHIP_16p5x16p5_20pads` sized chips, every
+chip ground plane has a set of coplanar gaps erased from it.
+Stages are pinning holes, overetching, inversion, splitting and hole
+resolution. Wall time and number of polygons are printed for both
+approaches and for different numbers of threads.
+"""
+import os
+import time
+
+import pya
+from pya import Region, Box
+
+from importlib import reload
+import classLib
+reload(classLib)
+from classLib.chipTemplates import CHIP_16p5x16p5_20pads
+from classLib.helpers import PinningGrid, pinning_holes, sized_region, \
+    split_region, resolved_region, TiledPipeline
+
+
+def reticle_region(chips_n=2, gaps_step=240e3, gap=30e3):
+    chip_size = int(CHIP_16p5x16p5_20pads.dx)
+    chip = Region(Box(0, 0, chip_size, chip_size))
+    for i in range(int(chip_size / gaps_step)):
+        x = 100e3 + i * gaps_step
+        chip -= Region(Box(x, 200e3, x + gap, chip_size - 200e3))
+    chip.merge()
+    reticle = Region()
+    for i in range(chips_n):
+        for j in range(chips_n):
+            reticle += chip.moved(i * chip_size, j * chip_size)
+    return reticle, Box(0, 0, chips_n * chip_size, chips_n * chip_size)
+
+
+def benchmark(chips_n=2, tile_size=2e6):
+    ground, box = reticle_region(chips_n)
+    grid = PinningGrid(dx=40e3, dy=40e3, width=15e3, height=15e3)
+
+    t = time.perf_counter()
+    result = ground - pinning_holes(ground, grid, d=40e3)
+    result = sized_region(result, 1.5e3)
+    result ^= Region(box)
+    result = resolved_region(split_region(result, 180), cache=False)
+    print(f"whole layer stages: {time.perf_counter() - t:.2f} s, "
+          f"polygons: {result.count()}")
+
+    for threads in sorted({1, os.cpu_count() or 1}):
+        pipeline = TiledPipeline(box, tile_size, threads=threads)
+        pipeline.pinning_holes(grid, d=40e3).sized(1.5e3).inverse()
+        pipeline.split(180).resolve_holes()
+        t = time.perf_counter()
+        result = pipeline.run(ground)
+        print(f"tiled pipeline, threads: {threads}, "
+              f"{time.perf_counter() - t:.2f} s, "
+              f"polygons: {result.count()}")
+
+
+### MAIN FUNCTION ###
+if __name__ == "__main__":
+    benchmark()
@@ -39,7 +39,8 @@ from classLib.chipTemplates import CHIP_16p5x16p5_20pads, FABRICATION
 from classLib.chipDesign import ChipDesign
 from classLib.marks import MarkBolgar
 from classLib.contactPads import ContactPad
-from classLib.helpers import fill_holes, split_polygons, extended_region
+from classLib.helpers import fill_holes, split_layers, extended_region, \
+    sized_region, resolved_region
 
 import sonnetSim
 
@@ -1530,24 +1531,9 @@ class Design8Q(ChipDesign):
         self.region_ph = filled_reg + other_regs
 
     def extend_photo_overetching(self):
-        tmp_reg = Region()
-        ep = pya.EdgeProcessor()
-        for poly in self.region_ph.each():
-            tmp_reg.insert(
-                ep.simple_merge_p2p(
-                    [
-                        poly.sized(
-                            FABRICATION.OVERETCHING,
-                            FABRICATION.OVERETCHING,
-                            2
-                        )
-                    ],
-                    False,
-                    False,
-                    1
-                )
-            )
-        self.region_ph = tmp_reg
+        self.region_ph = sized_region(
+            self.region_ph, *FABRICATION.overetching("photo")
+        )
 
     # TODO: add layer or region
     #  arguments to the functions wich names end with "..._in_layers()"
@@ -1556,26 +1542,13 @@ class Design8Q(ChipDesign):
                 self.region_ph, self.region_bridges1, self.region_bridges2,
                 self.region_el, self.dc_bandage_reg,
                 self.region_el_protection):
-            tmp_reg = Region()
-            for poly in reg:
-                tmp_reg.insert(poly.resolved_holes())
-            reg.clear()
-            reg |= tmp_reg
-
-        # TODO: the following code is not working (region_bridges's polygons remain the same)
-        # for poly in chain(self.region_bridges2):
-        #     poly.resolve_holes()
+            reg.assign(resolved_region(reg))
 
     def split_polygons_in_layers(self, max_pts=200):
-        self.region_ph = split_polygons(self.region_ph, max_pts)
-        self.region_bridges2 = split_polygons(self.region_bridges2,
-                                              max_pts)
-        for poly in self.region_ph:
-            if poly.num_points() > max_pts:
-                print("exists photo")
-        for poly in self.region_ph:
-            if poly.num_points() > max_pts:
-                print("exists bridge2")
+        split_layers(
+            {"photo": self.region_ph, "bridges2": self.region_bridges2},
+            max_pts
+        )
 
     def get_resonator_length(self, res_idx):
         resonator = self.resonators[res_idx]
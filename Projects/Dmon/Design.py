@@ -125,7 +125,7 @@ reload(classLib)
 
 from classLib.baseClasses import ElementBase, ComplexBase
 from classLib.coplanars import CPWParameters, CPW, DPathCPW, \
-    CPWRLPath, Bridge1, CPW2CPW
+    CPWRLPath, Bridge1, Bridge1Batch, CPW2CPW
 from classLib.shapes import XmonCross, Rectangle, CutMark
 from classLib.resonators import EMResonatorTL3QbitWormRLTailXmonFork
 from classLib.josJ import AsymSquidParams, AsymSquid
@@ -133,7 +133,8 @@ from classLib.chipTemplates import CHIP_10x5_8pads, FABRICATION
 from classLib.chipDesign import ChipDesign
 from classLib.marks import MarkBolgar
 from classLib.contactPads import ContactPad
-from classLib.helpers import fill_holes, split_polygons, extended_region
+from classLib.helpers import fill_holes, split_layers, extended_region, \
+    sized_region, resolved_region
 
 import sonnetSim
 
@@ -1683,6 +1684,7 @@ class DesignDmon(ChipDesign):
     def draw_bridges(self):
         bridges_step = 130e3
         fl_bridges_step = 130e3
+        bridges = Bridge1Batch(bridges_step)
 
         # for resonators
         for resonator in self.resonators:
@@ -1693,11 +1695,7 @@ class DesignDmon(ChipDesign):
                         # place bridges only at arcs of coils
                         # but not on linear segments
                         if "arc" in primitive_name:
-                            Bridge1.bridgify_CPW(
-                                primitive, bridges_step,
-                                dest=self.region_bridges1,
-                                dest2=self.region_bridges2
-                            )
+                            bridges.add_cpw(primitive)
                     continue
                 elif "fork" in name:  # skip fork primitives
                     continue
@@ -1708,17 +1706,11 @@ class DesignDmon(ChipDesign):
                     # `EMResonatorTL3QbitWormRLTailXmonFork`
                     if name == "arc1":
                         continue
-                    Bridge1.bridgify_CPW(
-                        res_primitive, bridges_step,
-                        dest=self.region_bridges1,
-                        dest2=self.region_bridges2
-                    )
+                    bridges.add_cpw(res_primitive)
 
         for i, cpw_fl in enumerate(self.cpw_fl_lines):
-            Bridge1.bridgify_CPW(
-                cpw_fl, bridges_step=bridges_step,
-                dest=self.region_bridges1,
-                dest2=self.region_bridges2,
+            bridges.add_cpw(
+                cpw_fl,
                 avoid_points=[cpw_fl.end],
                 avoid_distances=130e3
             )
@@ -1729,9 +1721,7 @@ class DesignDmon(ChipDesign):
                 else:
                     dy = -dy
                 bridge_center1 = cpw_fl.end + DVector(0, -dy)
-                br = Bridge1(center=bridge_center1, trans_in=Trans.R90)
-                br.place(dest=self.region_bridges1, region_id="bridges_1")
-                br.place(dest=self.region_bridges2, region_id="bridges_2")
+                bridges.add_bridge(bridge_center1, alpha=pi / 2)
 
         # for readout waveguide
         avoid_resonator_points = []
@@ -1740,13 +1730,15 @@ class DesignDmon(ChipDesign):
                 res.origin + DPoint(res.L_coupling / 2, 0)
             )
 
-        Bridge1.bridgify_CPW(
-            self.cpwrl_ro_line, bridges_step,
-            dest=self.region_bridges1, dest2=self.region_bridges2,
+        bridges.add_cpw(
+            self.cpwrl_ro_line,
             avoid_points=avoid_resonator_points,
             avoid_distances=3 / 4 * max(self.L_coupling_list) + self.res_r
         )
 
+        bridges.place(self.region_bridges1, region_id="bridges_1")
+        bridges.place(self.region_bridges2, region_id="bridges_2")
+
     def draw_pinning_holes(self):
         selection_region = Region(
             pya.Box(Point(100e3, 100e3), Point(101e3, 101e3))
@@ -1760,24 +1752,9 @@ class DesignDmon(ChipDesign):
         self.region_ph = filled_reg + other_regs
 
     def extend_photo_overetching(self):
-        tmp_reg = Region()
-        ep = pya.EdgeProcessor()
-        for poly in self.region_ph.each():
-            tmp_reg.insert(
-                ep.simple_merge_p2p(
-                    [
-                        poly.sized(
-                            FABRICATION.OVERETCHING,
-                            FABRICATION.OVERETCHING,
-                            2
-                        )
-                    ],
-                    False,
-                    False,
-                    1
-                )
-            )
-        self.region_ph = tmp_reg
+        self.region_ph = sized_region(
+            self.region_ph, *FABRICATION.overetching("photo")
+        )
 
     # TODO: add layer or region arguments to the functions wich end with "..._in_layers()"
     def resolve_holes(self):
@@ -1785,26 +1762,13 @@ class DesignDmon(ChipDesign):
                 self.region_ph, self.region_bridges1, self.region_bridges2,
                 self.region_el, self.dc_bandage_reg,
                 self.region_el_protection):
-            tmp_reg = Region()
-            for poly in reg:
-                tmp_reg.insert(poly.resolved_holes())
-            reg.clear()
-            reg |= tmp_reg
-
-        # TODO: the following code is not working (region_bridges's polygons remain the same)
-        # for poly in chain(self.region_bridges2):
-        #     poly.resolve_holes()
+            reg.assign(resolved_region(reg))
 
     def split_polygons_in_layers(self, max_pts=200):
-        self.region_ph = split_polygons(self.region_ph, max_pts)
-        self.region_bridges2 = split_polygons(self.region_bridges2,
-                                              max_pts)
-        for poly in self.region_ph:
-            if poly.num_points() > max_pts:
-                print("exists photo")
-        for poly in self.region_ph:
-            if poly.num_points() > max_pts:
-                print("exists bridge2")
+        split_layers(
+            {"photo": self.region_ph, "bridges2": self.region_bridges2},
+            max_pts
+        )
 
     def get_resonator_length(self, res_idx):
         resonator = self.resonators[res_idx]
@@ -14,8 +14,9 @@ and they will not account for backward compatibility
 of code that uses this file conent.
 """
 
+import os
 import pya
-from math import sqrt, cos, sin, atan2, pi, copysign
+from math import sqrt, cos, sin, atan2, pi, copysign, acos, ceil
 from pya import Point,DPoint,DSimplePolygon,SimplePolygon, DPolygon, Polygon,  Region
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
 
@@ -23,6 +24,94 @@ class PROGRAM:
     LAYER1_NUM = 70
     LAYER2_NUM = 80
     ARC_PTS_N = 50
+    # maximal deviation (sagitta) of arc polygon edges from the exact
+    # arc in database units (nm). If set, number of arc points is
+    # chosen according to arc radius and angle (see `arc_pts_n`), but
+    # never exceeds the fixed number of points of the element.
+    # Reasonable values are several dbu or a fraction of Sonnet cell
+    # size. If `None`, every element uses its fixed number of points
+    # (`ARC_PTS_N` for most of them). Any other value changes the
+    # geometry of existing designs, hence the mode is opt-in.
+    ARC_CHORD_ERROR = None
+    ARC_PTS_N_MIN = 3
+    ARC_PTS_N_MAX = 1024
+    # `DPathCPW` with the same CPW parameters along the whole line is
+    # drawn as a few polygons built along its center line. Per-segment
+    # primitives are created only on demand.
+    # Contour vertices differ from the ones of per-segment primitives
+    # by up to a few database units, hence the mode is opt-in.
+    DPATH_SINGLE_CONTOUR = False
+    # maximal number of center line points in a single polygon of
+    # `DPathCPW` contour
+    DPATH_CONTOUR_PTS_MAX = 2000
+    # maximum number of distinct element geometries stored by
+    # `classLib.baseClasses.GEOMETRY_CACHE`
+    GEOMETRY_CACHE_SIZE = 4096
+
+
+def arc_pts_n(r, delta_alpha=2 * pi, fixed_n=None):
+    """
+    Returns number of points (including both ends) that approximates
+    arc of radius `r` and angular size `delta_alpha` with deviation
+    not exceeding `PROGRAM.ARC_CHORD_ERROR`. Result is limited by the
+    fixed number of points, so tessellation is never finer than the
+    one with `PROGRAM.ARC_CHORD_ERROR = None`.
+
+    Parameters
+    ----------
+    r : float
+        maximal radius of the arc-shaped polygon edges
+    delta_alpha : float
+        angular size of the arc in radians
+    fixed_n : Optional[int]
+        number of points returned if `PROGRAM.ARC_CHORD_ERROR` is
+        `None` and upper limit otherwise. `PROGRAM.ARC_PTS_N` is used
+        if `None`.
+
+    Returns
+    -------
+    int
+    """
+    if fixed_n is None:
+        fixed_n = PROGRAM.ARC_PTS_N
+    if PROGRAM.ARC_CHORD_ERROR is None:
+        return fixed_n
+    r = abs(r)
+    if r <= PROGRAM.ARC_CHORD_ERROR:
+        d_alpha = pi / 2
+    else:
+        # sagitta of the chord with angular size `d_alpha` equals to
+        # r*(1 - cos(d_alpha/2))
+        d_alpha = 2 * acos(1 - PROGRAM.ARC_CHORD_ERROR / r)
+    pts_n = ceil(abs(delta_alpha) / d_alpha) + 1
+    return min(max(pts_n, PROGRAM.ARC_PTS_N_MIN), PROGRAM.ARC_PTS_N_MAX,
+               fixed_n)
+
+
+def circle_pts_n(r):
+    """
+    Returns number of points for a closed circle of radius `r`.
+    See `arc_pts_n`.
+    """
+    if PROGRAM.ARC_CHORD_ERROR is None:
+        return PROGRAM.ARC_PTS_N
+    # closed circle has one point less than the full-turn arc
+    return max(arc_pts_n(r, 2 * pi, fixed_n=PROGRAM.ARC_PTS_N + 1) - 1,
+               PROGRAM.ARC_PTS_N_MIN)
+
+
+class BOOLEAN_ENGINE:
+    """
+    Settings of full-layer `Region` operations
+    (see `classLib.baseClasses.full_layer_boolean`).
+    """
+    # number of threads used by KLayout for deep (hierarchical)
+    # region operations
+    THREADS = os.cpu_count() or 1
+    # perform full-layer operations on deep regions.
+    # Deep regions are processed hierarchically and by
+    # `THREADS` threads. Flat regions are processed single-threaded.
+    DEEP_MODE = False
 
 
 class LAYERS:
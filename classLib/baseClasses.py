@@ -1,13 +1,735 @@
-from typing import Hashable, Union, Dict, Any
+from typing import Hashable, Union, Dict, Any, List, Tuple
 import pya
-from math import sqrt, cos, sin, atan2, pi, copysign
-from pya import Point, DPoint, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region
+from math import sqrt, cos, sin, atan2, pi, copysign, floor, ceil
+from pya import Point, DPoint, Box, DBox, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
 
-from classLib._PROG_SETTINGS import PROGRAM
+from classLib._PROG_SETTINGS import PROGRAM, BOOLEAN_ENGINE
 
 from collections import OrderedDict
 import itertools
+import operator
+import numpy as np
+
+
+def to_dcplxtrans(trans):
+    """
+    Converts any of KLayout transformations to `DCplxTrans`.
+    """
+    if isinstance(trans, DCplxTrans):
+        return trans
+    elif isinstance(trans, DTrans):
+        return DCplxTrans(trans, 1)
+    elif isinstance(trans, Trans):
+        return DCplxTrans(DTrans().from_itrans(trans), 1)
+    elif isinstance(trans, ICplxTrans):
+        return DCplxTrans(trans)
+    else:
+        return trans
+
+
+def trans_to_matrix(trans):
+    """
+    Returns affine representation `p -> M @ p + d` of the KLayout
+    transformation.
+
+    Parameters
+    ----------
+    trans : Union[DCplxTrans, DTrans, Trans, ICplxTrans]
+        transformation to represent
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        2x2 linear part `M` and displacement `d` of shape (2,)
+    """
+    m00, m01, m10, m11, dx, dy = _trans_coefficients(trans)
+    return np.array([[m00, m01], [m10, m11]]), np.array([dx, dy])
+
+
+def _trans_coefficients(trans):
+    # coefficients `(m00, m01, m10, m11, dx, dy)` of the affine map
+    trans = to_dcplxtrans(trans)
+    alpha = trans.angle / 180 * pi
+    c = trans.mag * cos(alpha)
+    s = trans.mag * sin(alpha)
+    # KLayout mirrors at x-axis before rotation
+    mirror = -1 if trans.is_mirror() else 1
+    return c, -s * mirror, s, c * mirror, trans.disp.x, trans.disp.y
+
+
+def transform_points_array(pts_arr, trans, displacement=True):
+    """
+    Transforms N x 2 array of points with a single matrix product.
+
+    Parameters
+    ----------
+    pts_arr : np.ndarray
+        array of shape (N, 2) with points coordinates
+    trans : Union[DCplxTrans, DTrans, Trans, ICplxTrans]
+        transformation to apply
+    displacement : bool
+        if `False`, only linear part of the transformation is applied.
+        Suitable for direction vectors.
+
+    Returns
+    -------
+    np.ndarray
+        transformed points array of shape (N, 2)
+    """
+    mat, disp = trans_to_matrix(trans)
+    res = pts_arr @ mat.T
+    if displacement:
+        res += disp
+    return res
+
+
+def points_to_array(pts):
+    return np.array([(pt.x, pt.y) for pt in pts], dtype=float).reshape(-1, 2)
+
+
+def array_to_points(pts_arr):
+    return [DPoint(x, y) for x, y in pts_arr.tolist()]
+
+
+def array_to_simple_polygon(pts_arr):
+    """
+    Creates integer `SimplePolygon` from N x 2 array of hull points
+    without construction of intermediate `DPoint` objects.
+    Coordinates are rounded half away from zero, as it is done by
+    `SimplePolygon(DSimplePolygon)` conversion.
+
+    Parameters
+    ----------
+    pts_arr : np.ndarray
+        array of shape (N, 2) with hull points coordinates
+
+    Returns
+    -------
+    SimplePolygon
+    """
+    pts_arr = np.asarray(pts_arr, dtype=float)
+    coords = np.trunc(pts_arr + np.copysign(0.5, pts_arr))
+    coords = coords.astype(np.int64).ravel().tolist()
+    return SimplePolygon.from_s(
+        "(" + ";".join(map("{},{}".format, coords[0::2], coords[1::2]))
+        + ")"
+    )
+
+
+def stripe_polygon(pts_arr, normals_arr, d_inner, d_outer):
+    """
+    Creates polygon of the stripe that lies between two offset curves
+    of the polyline. Offset curves are obtained by shifting polyline
+    points along their normals by `d_inner` and `d_outer`.
+
+    Parameters
+    ----------
+    pts_arr : np.ndarray
+        polyline points of shape (N, 2)
+    normals_arr : np.ndarray
+        unit normals at polyline points of shape (N, 2)
+    d_inner : float
+        offset of the stripe's first boundary
+    d_outer : float
+        offset of the stripe's second boundary
+
+    Returns
+    -------
+    SimplePolygon
+    """
+    contour = np.concatenate(
+        (pts_arr + d_inner * normals_arr,
+         (pts_arr + d_outer * normals_arr)[::-1])
+    )
+    return array_to_simple_polygon(contour)
+
+
+def arc_polygons(center, alphas, r_inner, r_outer):
+    """
+    Builds polygons of several arc-shaped stripes sharing common
+    center and angular grid in one vectorized pass.
+    Every stripe polygon consists of inner contour traversed along
+    `alphas` followed by outer contour traversed backwards.
+
+    Parameters
+    ----------
+    center : DPoint
+        common center of arcs
+    alphas : np.ndarray
+        angles of arcs points in radians of shape (N,)
+    r_inner : array_like
+        radii of inner contours points. Broadcastable to shape (M, N),
+        where M is the number of stripes. E.g. array of shape (M, 1)
+        describes stripes with constant width.
+    r_outer : array_like
+        radii of outer contours points. Broadcastable to shape (M, N).
+
+    Returns
+    -------
+    List[SimplePolygon]
+        M polygons in the order of `r_inner` and `r_outer` rows.
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    r_inner, r_outer = np.broadcast_arrays(
+        np.atleast_2d(r_inner), np.atleast_2d(r_outer), alphas
+    )[:2]
+    dirs = np.stack((np.cos(alphas), np.sin(alphas)), axis=-1)
+    contours = np.concatenate(
+        (r_inner[..., None] * dirs,
+         r_outer[:, ::-1, None] * dirs[::-1]),
+        axis=1
+    )
+    contours += (center.x, center.y)
+    return [array_to_simple_polygon(contour) for contour in contours]
+
+
+def arc_bbox(center, alpha_start, alpha_end, r_inner, r_outer):
+    """
+    Returns bounding box of the annular sector without building its
+    polygon.
+
+    Parameters
+    ----------
+    center : DPoint
+        center of the sector
+    alpha_start : float
+        starting angle of the sector in radians
+    alpha_end : float
+        ending angle of the sector in radians
+    r_inner : float
+        inner radius of the sector. Negative radii are treated as
+        positive ones for angles shifted by pi as `arc_polygons` does.
+    r_outer : float
+        outer radius of the sector
+
+    Returns
+    -------
+    DBox
+    """
+    if r_inner < 0 and r_outer <= 0:
+        r_inner, r_outer = -r_outer, -r_inner
+        alpha_start += pi
+        alpha_end += pi
+    r_inner = max(r_inner, 0)
+    a_min, a_max = min(alpha_start, alpha_end), max(alpha_start, alpha_end)
+    # sector reaches its extreme coordinates either at its ends or
+    # at the outer radius in axis directions
+    alphas = [a_min, a_max]
+    k = int(np.ceil(a_min / (pi / 2)))
+    while k * pi / 2 < a_max:
+        alphas.append(k * pi / 2)
+        k += 1
+    xs = [r_outer * cos(alpha) for alpha in alphas] + \
+         [r_inner * cos(alpha) for alpha in alphas[:2]]
+    ys = [r_outer * sin(alpha) for alpha in alphas] + \
+         [r_inner * sin(alpha) for alpha in alphas[:2]]
+    return DBox(center.x + min(xs), center.y + min(ys),
+                center.x + max(xs), center.y + max(ys))
+
+
+def arc_transformed(arc, dCplxTrans):
+    """
+    Transforms annular sector that is described by `arc_bbox` arguments.
+
+    Parameters
+    ----------
+    arc : Tuple[DPoint, float, float, float, float]
+        `(center, alpha_start, alpha_end, r_inner, r_outer)`
+    dCplxTrans : DCplxTrans
+
+    Returns
+    -------
+    Tuple[DPoint, float, float, float, float]
+        sector in the same format
+    """
+    center, alpha_start, alpha_end, r_inner, r_outer = arc
+    rot = dCplxTrans.angle * pi / 180
+    if dCplxTrans.is_mirror():
+        # mirroring w.r.t. `x` axis is performed before rotation
+        alpha_start, alpha_end = -alpha_start, -alpha_end
+    mag = dCplxTrans.mag
+    return (dCplxTrans * center, alpha_start + rot, alpha_end + rot,
+            r_inner * mag, r_outer * mag)
+
+
+_DEEP_SHAPE_STORE = None
+
+
+def _padded_skeleton_bbox(box):
+    # polygons are rounded to the database grid by every
+    # transformation, hence analytical box is padded by 1 nm
+    return DBox(floor(box.left) - 1, floor(box.bottom) - 1,
+                ceil(box.right) + 1, ceil(box.top) + 1)
+
+
+def deep_shape_store():
+    """
+    Returns `DeepShapeStore` shared by all deep regions of `classLib`
+    with threads number set by `BOOLEAN_ENGINE.THREADS`.
+    """
+    global _DEEP_SHAPE_STORE
+    if _DEEP_SHAPE_STORE is None:
+        _DEEP_SHAPE_STORE = pya.DeepShapeStore()
+    _DEEP_SHAPE_STORE.threads = BOOLEAN_ENGINE.THREADS
+    return _DEEP_SHAPE_STORE
+
+
+def engine_region(reg):
+    """
+    Returns deep copy of flat region `reg` if
+    `BOOLEAN_ENGINE.DEEP_MODE` is set. Otherwise returns `reg` itself.
+    """
+    if (not BOOLEAN_ENGINE.DEEP_MODE) or reg.is_deep():
+        return reg
+    layout = pya.Layout()
+    cell = layout.create_cell("engine_region")
+    layer_i = layout.layer()
+    cell.shapes(layer_i).insert(reg)
+    return Region(cell.begin_shapes_rec(layer_i), deep_shape_store())
+
+
+def flat_region(reg):
+    """
+    Returns flat copy of deep region `reg` or `reg` itself if it is
+    already flat.
+    """
+    if not reg.is_deep():
+        return reg
+    flat_reg = Region()
+    flat_reg.insert(reg)
+    return flat_reg
+
+
+_INPLACE_OPS = {"+": operator.iadd, "-": operator.isub,
+                "&": operator.iand, "|": operator.ior, "^": operator.ixor}
+_OPS = {"+": operator.add, "-": operator.sub,
+        "&": operator.and_, "|": operator.or_, "^": operator.xor}
+
+
+def full_layer_boolean(dest, other, operation):
+    """
+    Performs in-place boolean `dest = dest <operation> other` of
+    full-layer regions by engine configured in `BOOLEAN_ENGINE`.
+    In deep mode `dest` is copied into deep store on every call, so
+    this is meant for whole-layer operations (crop, inversion,
+    batch flush). Per-element placement uses flat booleans.
+
+    Parameters
+    ----------
+    dest : Region
+        flat region to be modified
+    other : Region
+        second operand
+    operation : str
+        one of "+", "-", "&", "|", "^"
+
+    Returns
+    -------
+    Region
+        `dest`
+    """
+    if not BOOLEAN_ENGINE.DEEP_MODE:
+        return _INPLACE_OPS[operation](dest, other)
+    result = _OPS[operation](engine_region(dest), engine_region(other))
+    dest.assign(flat_region(result))
+    return dest
+
+
+def full_layer_merge(dest):
+    """
+    Merges full-layer region `dest` in-place by engine configured in
+    `BOOLEAN_ENGINE`.
+
+    Parameters
+    ----------
+    dest : Region
+        flat region to be merged
+
+    Returns
+    -------
+    Region
+        `dest`
+    """
+    if not BOOLEAN_ENGINE.DEEP_MODE:
+        return dest.merge()
+    dest.assign(flat_region(engine_region(dest).merged()))
+    return dest
+
+
+def cell_layer_region(cell, layer_i):
+    """
+    Returns content of the `cell` layer `layer_i` (including child
+    cells) as region. Region is deep if `BOOLEAN_ENGINE.DEEP_MODE` is
+    set.
+    """
+    if BOOLEAN_ENGINE.DEEP_MODE:
+        return Region(cell.begin_shapes_rec(layer_i), deep_shape_store())
+    return Region(cell.begin_shapes_rec(layer_i))
+
+
+def write_cell_layer(cell, layer_i, reg):
+    """
+    Replaces content of the layer `layer_i` with `reg`.
+    Layer is replaced through temporary layer, because region
+    that was obtained from the same layer may refer to its shapes.
+    Hierarchy of the deep region is written back into the layout.
+    """
+    layout = cell.layout()
+    temp_i = layout.layer(pya.LayerInfo(PROGRAM.LAYER1_NUM, 0))
+    if reg.is_deep():
+        reg.insert_into(layout, cell.cell_index(), temp_i)
+    else:
+        cell.shapes(temp_i).insert(reg)
+    layout.clear_layer(layer_i)
+    layout.move_layer(temp_i, layer_i)
+    layout.delete_layer(temp_i)
+
+
+class PlacementBatch:
+    """
+        Context manager that postpones `place()` calls into registered
+    destinations (`Region` instances or `(Cell, layer_i)` pairs) and
+    commits them into each destination with a single boolean pass at
+    exit.
+        Without a batch every `place()` into a cell layer reads the whole
+    layer into a `Region`, performs boolean with the element and writes
+    the layer back. Placing N elements is therefore O(N x total shapes).
+        Order of placement is preserved: element placed later still
+    erases metal of elements that were placed earlier by its empty
+    regions.
+
+    Examples
+    --------
+    ```python
+    with PlacementBatch(region_ph, (cell, layer_ph)):
+        for element in elements:
+            element.place(region_ph)
+            element.place(cell, layer_ph)
+    ```
+
+    Notes
+    -----
+        Registered destinations must not be read until the batch is
+    committed (or `flush()`'ed) since they do not contain postponed
+    geometry yet.
+    """
+    _active: List["PlacementBatch"] = []
+
+    def __init__(self, *dests, merge=False):
+        """
+        Parameters
+        ----------
+        dests : Union[Region, Tuple[Cell, int]]
+            destinations to be batched. Cell layers are supplied as
+            `(cell, layer_i)` pairs.
+        merge : bool
+            merge every destination after the batch is committed
+        """
+        self.merge = merge
+        self._dests = []
+        # list of `(metal, empty)` contributions for every destination
+        # in order of `place()` calls
+        self._pending: List[List[Tuple[Region, Region]]] = []
+        for dest in dests:
+            if isinstance(dest, tuple):
+                self._dests.append(dest)
+            else:
+                self._dests.append((dest, -1))
+            self._pending.append([])
+
+    def __enter__(self):
+        PlacementBatch._active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        PlacementBatch._active.remove(self)
+        self.flush()
+        return False
+
+    @staticmethod
+    def find(dest, layer_i=-1):
+        """
+        Returns innermost active batch that has `dest` registered
+        or `None` if there is no such batch.
+        """
+        for batch in reversed(PlacementBatch._active):
+            if batch._index(dest, layer_i) is not None:
+                return batch
+        return None
+
+    def _index(self, dest, layer_i):
+        for i, (batch_dest, batch_layer_i) in enumerate(self._dests):
+            if (batch_dest is dest) and (batch_layer_i == layer_i):
+                return i
+        return None
+
+    def add(self, dest, layer_i, metal, empty):
+        """
+        Postpones placement of the `metal` and `empty` regions into
+        the `dest`. `metal` is assumed to be already cleared
+        from `empty`.
+        """
+        self._pending[self._index(dest, layer_i)].append((metal, empty))
+
+    @staticmethod
+    def _combine(first, second):
+        # Placement of `(metal, empty)` pair is equivalent to
+        # `dest = (dest - empty) + metal`. Two sequential placements
+        # are equivalent to a single one with
+        # `empty = empty1 + empty2` and
+        # `metal = (metal1 - empty2) + metal2`
+        metal1, empty1 = first
+        metal2, empty2 = second
+        if empty2.is_empty():
+            metal = metal1 + metal2
+        else:
+            metal = (metal1 - empty2) + metal2
+        return metal, empty1 + empty2
+
+    def _reduce(self, contributions):
+        # pairwise reduction performs O(log(N)) boolean passes
+        # over the total geometry instead of N
+        while len(contributions) > 1:
+            reduced = [
+                self._combine(first, second) for first, second in
+                zip(contributions[::2], contributions[1::2])
+            ]
+            if len(contributions) % 2 == 1:
+                reduced.append(contributions[-1])
+            contributions = reduced
+        return contributions[0]
+
+    def flush(self):
+        """
+        Commits all postponed placements into their destinations.
+        """
+        for (dest, layer_i), contributions in zip(self._dests,
+                                                   self._pending):
+            if len(contributions) == 0:
+                continue
+            metal, empty = self._reduce(contributions)
+            if layer_i == -1:
+                # `dest` is interpreted as `pya.Region` object
+                full_layer_boolean(dest, empty, "-")
+                full_layer_boolean(dest, metal, "+")
+                if self.merge:
+                    full_layer_merge(dest)
+            else:
+                # `dest` is interpreted as `pya.Cell` object
+                r_cell = cell_layer_region(dest, layer_i)
+                r_cell -= empty
+                r_cell += metal
+                if self.merge:
+                    r_cell.merge()
+                write_cell_layer(dest, layer_i, r_cell)
+        self._pending = [[] for _ in self._dests]
+
+
+class SkeletonMode:
+    """
+        Context manager that switches construction of elements into
+    geometry-free mode. Elements that implement `init_skeleton()`
+    calculate only their connections, angles and conservative bounding
+    box analytically and do not build any polygons. Elements that do not
+    implement it are built as usual.
+        Straight and arc coplanars, `CPWRLPath` and `Coil_type_1` have
+    analytic skeletons. The latter two store outlines of their parts
+    instead of primitives (see `ComplexBase.init_skeleton()`), hence
+    `length(exception)` skips parts by the names of the primitives they
+    replace. Resonators are composed of these elements and are
+    constructed without polygons of their lines as well.
+        Lengths, connections, angles and `bbox()` of the elements
+    constructed in this mode are the same as in the usual mode (up to
+    tessellation of the arcs for the bounding boxes), while their
+    regions are empty.
+
+    Examples
+    --------
+    ```python
+    with SkeletonMode():
+        resonator = EMResonatorTL3QbitWormRLTail(...)
+    print(resonator.length(), resonator.end, resonator.bbox())
+    ```
+    """
+    _depth = 0
+
+    def __enter__(self):
+        SkeletonMode._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        SkeletonMode._depth -= 1
+        return False
+
+    @staticmethod
+    def active():
+        return SkeletonMode._depth > 0
+
+
+class GeometryCache:
+    """
+        Bounded LRU storage of local-frame geometry of elements.
+        Element that defines `_geometry_cache_key()` builds its regions
+    and connections by `init_regions()` only once per distinct key.
+    Subsequent elements with the same key copy stored geometry and
+    only apply their own placement transformation.
+
+    Examples
+    --------
+    ```python
+    from classLib.baseClasses import GEOMETRY_CACHE
+    GEOMETRY_CACHE.clear()
+    # draw design
+    print(GEOMETRY_CACHE.info())
+    ```
+    """
+
+    def __init__(self, maxsize=None):
+        """
+        Parameters
+        ----------
+        maxsize : Optional[int]
+            maximum number of stored geometries. Least recently used
+            entries are evicted first.
+            `PROGRAM.GEOMETRY_CACHE_SIZE` is used if `None`.
+        """
+        if maxsize is None:
+            maxsize = PROGRAM.GEOMETRY_CACHE_SIZE
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+
+GEOMETRY_CACHE = GeometryCache()
+
+
+# connections lists of this length and shorter are transformed point
+# by point with precalculated affine coefficients. Most elements have
+# 2-4 connections, and for them the matrix product together with
+# conversion of `DPoint` list to array and back is about twice slower
+_SCALAR_TRANS_N_MAX = 8
+
+
+def composed_trans(dCplxTranss):
+    """
+    Returns transformation that is equivalent to application of
+    `dCplxTranss` one after another.
+
+    Parameters
+    ----------
+    dCplxTranss : Iterable[Union[DCplxTrans, DTrans, Trans, ICplxTrans]]
+
+    Returns
+    -------
+    DCplxTrans
+    """
+    res = DCplxTrans()
+    for dCplxTrans in dCplxTranss:
+        res = to_dcplxtrans(dCplxTrans) * res
+    return res
+
+
+def _grid_exact(dCplxTrans):
+    # integer points are mapped to integer points, hence regions are
+    # transformed without rounding
+    disp = dCplxTrans.disp
+    return dCplxTrans.is_ortho() and not dCplxTrans.is_mag() and \
+        disp.x == round(disp.x) and disp.y == round(disp.y)
+
+
+def _rounding_steps(dCplxTranss):
+    """
+        Prepares transformations `dCplxTranss` that are applied one
+    after another for the element tree. Polygons have to be rounded to
+    the database grid after every transformation. Consecutive
+    transformations that map the grid onto itself (see `_grid_exact`)
+    do not round anything, so they are merged into a single step.
+
+    Parameters
+    ----------
+    dCplxTranss : List[DCplxTrans]
+        transformations in order of application
+
+    Returns
+    -------
+    Tuple[List[Tuple[DCplxTrans, ICplxTrans]], DCplxTrans]
+        steps of region transformations and the composed transformation
+    """
+    dCplxTranss = [to_dcplxtrans(dCplxTrans) for dCplxTrans in dCplxTranss]
+    if len(dCplxTranss) == 1:
+        # e.g. `make_trans()` call
+        dCplxTrans = dCplxTranss[0]
+        return [(dCplxTrans, ICplxTrans().from_dtrans(dCplxTrans))], \
+            dCplxTrans
+    steps = []
+    merged = None
+    for dCplxTrans in dCplxTranss:
+        if not _grid_exact(dCplxTrans):
+            if merged is not None:
+                steps.append(merged)
+                merged = None
+            steps.append(dCplxTrans)
+        elif merged is None:
+            merged = dCplxTrans
+        else:
+            merged = dCplxTrans * merged
+    if merged is not None:
+        steps.append(merged)
+    steps = [(dCplxTrans, ICplxTrans().from_dtrans(dCplxTrans))
+             for dCplxTrans in steps]
+    return steps, composed_trans(dCplxTranss)
+
+
+def _regions_stats(regions):
+    """
+    Returns bounding box, number of polygons and number of vertices
+    (including vertices of holes) of `regions`.
+
+    Parameters
+    ----------
+    regions : Iterable[Region]
+
+    Returns
+    -------
+    Tuple[Box, int, int]
+    """
+    box = Box()
+    polygons_n = 0
+    vertices_n = 0
+    for reg in regions:
+        if reg.is_empty():
+            continue
+        box += reg.bbox()
+        polygons_n += reg.count()
+        vertices_n += sum(poly.num_points() for poly in reg.each())
+    return box, polygons_n, vertices_n
 
 
 class ElementBase():
@@ -35,19 +757,14 @@ class ElementBase():
 
         self.origin = origin
         self.inverse = inverse
-        # TODO: after Region.insert() and/or? metal_region + other_region
-        #  there is width problem that initial region has dimensions
-        #  Region().bbox() = ((-1,-1,1,1)) or something like that
-        #  Hence, if you wish to take Region.bbox() of the resulting region
-        #  You will get incorrect value due to initial region having
-        #  something "blank" at the creation moment. This may be solved
-        #  by either shrinking resulting region to shapes it contains,
-        #  or by refusing of usage of empty `Region()`s
+        # Note: bbox of the empty `Region()` is an empty box that does
+        #  not contribute to the united bbox. Use `self.bbox()` instead of
+        #  `(self.metal_region + self.empty_region).bbox()`.
+        self.region_id = region_id
         self.metal_regions: Dict[Any, Region] = OrderedDict()
         self.empty_regions: Dict[Any, Region] = OrderedDict()
         self.metal_region = Region()
         self.empty_region = Region()
-        self.region_id = region_id
         self.metal_regions[self.region_id] = self.metal_region
         self.empty_regions[self.region_id] = self.empty_region
         self.region_ids = [self.region_id]
@@ -77,6 +794,19 @@ class ElementBase():
                 self.DCplxTrans_init = DCplxTrans(trans_in)
                 self.ICplxTrans_init = trans_in
         self._geometry_parameters = OrderedDict()
+        # bounding box of the element constructed in `SkeletonMode`
+        self._skeleton_bbox: DBox = None
+        # outline of the straight element or annular sector of the
+        # arc-shaped element (see `arc_transformed()`) constructed in
+        # `SkeletonMode`. Bounding box is recalculated from it in the
+        # final frame, because bounding box of the rotated box is wider
+        # than the box of the rotated element
+        self._skeleton_polygon: DPolygon = None
+        self._skeleton_arc = None
+        # cached `(bbox, polygons_n, vertices_n)` of the regions.
+        # See `self._geometry_stats()`
+        self._stats: Tuple[Box, int, int] = None
+        self._stats_key = None
         self._init_regions_trans()
 
     def get_geometry_params_dict(self, prefix="", postfix=""):
@@ -105,56 +835,214 @@ class ElementBase():
     def init_regions(self):
         raise NotImplementedError
 
-    # first it makes trans_init displacement
-    # then the rest of the trans_init
-    # then displacement of the current state to the origin
-    # after all, origin should be updated
-    def _init_regions_trans(self):
-        self.init_regions()  # must be implemented in child classes
+    def init_skeleton(self):
+        """
+            Calculates `self.connections`, `self.angle_connections` and
+        `self._skeleton_bbox` in the same reference frame as
+        `self.init_regions()` does, but without building any regions.
+        Element that is not aligned with axes sets `self._skeleton_polygon`
+        or `self._skeleton_arc` as well to keep its bounding box tight
+        after rotations.
+            See classLib.coplanars.CPW for example.
+        """
+        # can be implemented in child class
+        raise NotImplementedError
+
+    def _skeleton_supported(self, init_method="init_regions"):
+        # skeleton has to be implemented by the same class that draws
+        # the element (by `init_method`) or by its descendant
+        cls = type(self)
+        skeleton_cls = next(
+            c for c in cls.__mro__ if "init_skeleton" in c.__dict__
+        )
+        regions_cls = next(
+            c for c in cls.__mro__ if init_method in c.__dict__
+        )
+        return skeleton_cls is not ElementBase and \
+            issubclass(skeleton_cls, regions_cls)
+
+    def _geometry_cache_key(self):
+        """
+            Returns hashable tuple of parameters that fully define
+        geometry produced by `self.init_regions()` or `None` if
+        the element's geometry is not cached.
+            See classLib.coplanars.CPWArc for example.
+        """
+        # can be implemented in child class
+        return None
+
+    def _init_regions_cached(self):
+        key = self._geometry_cache_key()
+        if (key is None) or (not GEOMETRY_CACHE.enabled):
+            self.init_regions()  # must be implemented in child classes
+            return
+        key = (self.__class__, self.region_id) + tuple(key)
+        entry = GEOMETRY_CACHE.get(key)
+        if entry is None:
+            self.init_regions()
+            GEOMETRY_CACHE.put(
+                key,
+                (
+                    {k: reg.dup() for k, reg in self.metal_regions.items()},
+                    {k: reg.dup() for k, reg in self.empty_regions.items()},
+                    list(self.connections),
+                    list(self.angle_connections),
+                    list(self.connection_edges)
+                )
+            )
+            return
+
+        metal_regions, empty_regions, connections, angles, edges = entry
+        for own_regions, cached_regions in zip(
+                (self.metal_regions, self.empty_regions),
+                (metal_regions, empty_regions)
+        ):
+            for reg_id, reg in cached_regions.items():
+                if reg_id in own_regions:
+                    own_regions[reg_id].insert(reg)
+                else:
+                    own_regions[reg_id] = reg.dup()
+        self.connections = list(connections)
+        self.angle_connections = list(angles)
+        self.connection_edges = list(edges)
+
+    def _get_init_trans(self):
+        """
+            Returns construction transformations.
+            Construction consists of `self.DCplxTrans_init` displacement,
+        then the rest of the `self.DCplxTrans_init` and then
+        displacement of the current state to the `self.origin`.
 
-        dr_origin = DSimplePolygon([DPoint(0, 0)])
+        Returns
+        -------
+        Tuple[List[DCplxTrans], DPoint]
+            transformations in order of application and the shift of
+            the `self.origin` that has to be applied after
+            transformations are performed
+        """
+        transs = []
+        dr_origin = DPoint(0, 0)
         if (self.DCplxTrans_init is not None):
             # constructor trans displacement
-            dCplxTrans_temp = DCplxTrans(1, 0, False, self.DCplxTrans_init.disp)
-            self.make_trans(dCplxTrans_temp)
-            dr_origin.transform(dCplxTrans_temp)
-
+            transs.append(
+                DCplxTrans(1, 0, False, self.DCplxTrans_init.disp)
+            )
             # rest of the constructor trans functions
-            dCplxTrans_temp = self.DCplxTrans_init.dup()
-            dCplxTrans_temp.disp = DPoint(0, 0)
-            self.make_trans(dCplxTrans_temp)
-            dr_origin.transform(dCplxTrans_temp)
-
+            rest_trans = self.DCplxTrans_init.dup()
+            rest_trans.disp = DPoint(0, 0)
+            transs.append(rest_trans)
+            dr_origin = rest_trans * self.DCplxTrans_init.disp
         # translation local coordinates to the program coordinates by
         # tranlating geometry into `self.origin` - user-requested point
         # in program's coordinate system
+        transs.append(DCplxTrans(1, 0, False, self.origin))
+        return [trans for trans in transs if not trans.is_unity()], \
+            dr_origin
+
+    # all construction transformations are performed in a single
+    # pass. After all, origin should be updated
+    def _init_regions_trans(self):
+        if SkeletonMode.active() and self._skeleton_supported():
+            self.init_skeleton()
+        else:
+            self._init_regions_cached()
+
+        transs, dr_origin = self._get_init_trans()
         # Note: self.connections are already contain proper values
-        self.make_trans(DCplxTrans(1, 0, False, self.origin))  # move to the origin
-        self.origin += dr_origin.point(0)
+        self._make_trans_steps(transs)
+        self.origin += dr_origin
 
     def make_trans(self, dCplxTrans):
         if (dCplxTrans is not None):
-            regions = itertools.chain(self.metal_regions.values(), self.empty_regions.values())
-            for reg in regions:
-                iCplxTrans = ICplxTrans().from_dtrans(dCplxTrans)
+            self._make_trans_steps([dCplxTrans])
+
+    def _make_trans_steps(self, dCplxTranss):
+        """
+            Performs transformations `dCplxTranss` one after another.
+        Regions are rounded to the database grid after every
+        transformation, exactly as consecutive `self.make_trans()`
+        calls do, while connections, angles and skeleton are
+        transformed only once by the composed transformation.
+
+        Parameters
+        ----------
+        dCplxTranss : List[DCplxTrans]
+            transformations in order of application
+        """
+        self._apply_trans_steps(*_rounding_steps(dCplxTranss))
+
+    def _apply_trans_steps(self, steps, dCplxTrans):
+        """
+            Performs transformations prepared by `_rounding_steps()`.
+        Steps are prepared once for the whole element tree.
+
+        Parameters
+        ----------
+        steps : List[Tuple[DCplxTrans, ICplxTrans]]
+            region transformations in order of application
+        dCplxTrans : DCplxTrans
+            composed transformation
+        """
+        regions = itertools.chain(self.metal_regions.values(), self.empty_regions.values())
+        for reg in regions:
+            for _, iCplxTrans in steps:
                 reg.transform(iCplxTrans)
-            self._update_connections(dCplxTrans)
-            self._update_alpha(dCplxTrans)
+        for step_dCplxTrans, iCplxTrans in steps:
+            self._transform_stats(step_dCplxTrans, iCplxTrans)
+        if self._skeleton_polygon is not None:
+            self._skeleton_polygon = self._skeleton_polygon.transformed(
+                dCplxTrans
+            )
+            self._skeleton_bbox = self._skeleton_polygon.bbox()
+        elif self._skeleton_arc is not None:
+            self._skeleton_arc = arc_transformed(self._skeleton_arc,
+                                                 dCplxTrans)
+            self._skeleton_bbox = arc_bbox(*self._skeleton_arc)
+        elif self._skeleton_bbox is not None:
+            self._skeleton_bbox = self._skeleton_bbox.transformed(
+                dCplxTrans
+            )
+        self._update_connections(dCplxTrans)
+        self._update_alpha(dCplxTrans)
+
+    def _transform_stats(self, dCplxTrans, iCplxTrans):
+        """
+        Updates cached `self._stats` after the element's geometry was
+        transformed by `iCplxTrans` (made from `dCplxTrans`).
+        """
+        if self._stats is None:
+            return
+        disp = dCplxTrans.disp
+        if iCplxTrans.is_ortho() and not iCplxTrans.is_mag() and \
+                disp.x == round(disp.x) and disp.y == round(disp.y):
+            # integer coordinates are mapped exactly, while
+            # fractional displacement is rounded differently
+            # for polygon points and box corners
+            box, polygons_n, vertices_n = self._stats
+            self._stats = (box.transformed(iCplxTrans),
+                           polygons_n, vertices_n)
+        else:
+            # recalculated on demand
+            self._stats = None
 
     def _update_connections(self, dCplxTrans):
-        if (dCplxTrans is not None):
-            '''the problem is, if k construct polygon with multiple points
-            their order in poly_temp.each_point() doesn't coinside
-            with the order of the list that was passed to the polygon
-            constructor so, when k perform transformation and
-            try to read new values through poly_temp.each_point()
-            they values are rearranged solution is: k need to create
-            polygon for each point personally,
-            then the initial order presists'''
-            for i, pt in enumerate(self.connections):
-                poly_temp = DSimplePolygon([pt])
-                poly_temp.transform(dCplxTrans)
-                self.connections[i] = poly_temp.point(0)
+        if (dCplxTrans is not None) and (len(self.connections) > 0):
+            # connections are kept as `DPoint` list, that is the
+            # interface of the element. Long lists are transformed by a
+            # single matrix product of N x 2 coordinate array, short
+            # ones point by point. List is updated in-place, so aliases
+            # of `self.connections` stay valid.
+            if len(self.connections) <= _SCALAR_TRANS_N_MAX:
+                m00, m01, m10, m11, dx, dy = _trans_coefficients(dCplxTrans)
+                self.connections[:] = [
+                    DPoint(pt.x * m00 + pt.y * m01 + dx,
+                           pt.x * m10 + pt.y * m11 + dy)
+                    for pt in self.connections
+                ]
+            else:
+                pts_arr = points_to_array(self.connections)
+                pts_arr = transform_points_array(pts_arr, dCplxTrans)
+                self.connections[:] = array_to_points(pts_arr)
         self._refresh_named_connections()
 
     def _refresh_named_connections(self):
@@ -172,14 +1060,25 @@ class ElementBase():
 
     def _update_alpha(self, dCplxTrans):
         if (dCplxTrans is not None):
-            dCplxTrans_temp = dCplxTrans.dup()
-            dCplxTrans_temp.disp = DPoint(0, 0)
-
-            for i, alpha in enumerate(self.angle_connections):
-                poly_temp = DSimplePolygon([DPoint(cos(alpha), sin(alpha))])
-                poly_temp.transform(dCplxTrans_temp)
-                pt = poly_temp.point(0)
-                self.angle_connections[i] = atan2(pt.y, pt.x)
+            if 0 < len(self.angle_connections) <= _SCALAR_TRANS_N_MAX:
+                m00, m01, m10, m11, _, _ = _trans_coefficients(dCplxTrans)
+                dirs = [(cos(alpha), sin(alpha))
+                        for alpha in self.angle_connections]
+                self.angle_connections[:] = [
+                    atan2(x * m10 + y * m11, x * m00 + y * m01)
+                    for x, y in dirs
+                ]
+            elif len(self.angle_connections) > 0:
+                alphas = np.asarray(self.angle_connections, dtype=float)
+                # unit direction vectors are transformed without
+                # displacement
+                dirs_arr = np.column_stack((np.cos(alphas), np.sin(alphas)))
+                dirs_arr = transform_points_array(
+                    dirs_arr, dCplxTrans, displacement=False
+                )
+                self.angle_connections[:] = np.arctan2(
+                    dirs_arr[:, 1], dirs_arr[:, 0]
+                ).tolist()
             self._refresh_named_angles()
 
     def _refresh_named_angles(self):
@@ -195,15 +1094,102 @@ class ElementBase():
 
     def _update_origin(self, dCplxTrans):
         if (dCplxTrans is not None):
-            poly_temp = DSimplePolygon([self.origin])
-            poly_temp.transform(dCplxTrans)
-            self.origin = poly_temp.point(0)
+            self.origin = to_dcplxtrans(dCplxTrans) * self.origin
+
+    def bbox(self):
+        """
+        Returns bounding box of all metal and empty regions of the
+        element. Element constructed in `SkeletonMode` returns its
+        analytically calculated conservative bounding box.
+
+        Returns
+        -------
+        DBox
+        """
+        if self._skeleton_bbox is not None:
+            return _padded_skeleton_bbox(self._skeleton_bbox)
+        box = self._geometry_stats()[0]
+        if box.empty():
+            return DBox()
+        return DBox(box)
+
+    def polygon_count(self):
+        """
+        Returns number of polygons stored in metal and empty regions
+        of the element.
+
+        Returns
+        -------
+        int
+        """
+        return self._geometry_stats()[1]
+
+    def vertex_count(self):
+        """
+        Returns number of vertices (including vertices of holes) of
+        polygons stored in metal and empty regions of the element.
+
+        Returns
+        -------
+        int
+        """
+        return self._geometry_stats()[2]
+
+    def _regions_key(self):
+        # regions are identified together with number of their
+        # polygons and their data id, so insertions and boolean
+        # operations on the regions of the element outside of
+        # `make_trans` drop cached statistics
+        return tuple(
+            (id(reg), reg.count(), reg.data_id())
+            for reg in itertools.chain(
+                self.metal_regions.values(), self.empty_regions.values()
+            )
+        )
+
+    def _geometry_stats(self):
+        """
+            Returns bounding box, number of polygons and number of
+        vertices of the element's regions.
+            Statistics are calculated once and then updated by
+        `self.make_trans()`. Rotations by multiples of 90 degrees,
+        mirroring and integer displacements are applied to the cached
+        bbox exactly, other transformations postpone recalculation to
+        the next call.
+
+        Returns
+        -------
+        Tuple[Box, int, int]
+        """
+        key = self._regions_key()
+        if (self._stats is None) or (key != self._stats_key):
+            self._stats = _regions_stats(itertools.chain(
+                self.metal_regions.values(), self.empty_regions.values()
+            ))
+            self._stats_key = key
+        return self._stats
 
     def change_region_id(self, old_reg_id, new_reg_id):
         self.metal_regions[new_reg_id] = self.metal_regions.pop(old_reg_id)
         self.empty_regions[new_reg_id] = self.empty_regions.pop(old_reg_id)
         self.region_id = new_reg_id
 
+    def _placement_contribution(self, region_id="default"):
+        """
+        Returns `(metal, empty)` pair such that placement of this object
+        into destination is equivalent to
+        `dest = (dest - empty) + metal`.
+        """
+        metal = Region()
+        empty = Region()
+        if region_id in self.empty_regions:
+            empty = self.empty_regions[region_id].dup()
+        if region_id in self.metal_regions:
+            metal = self.metal_regions[region_id].dup()
+            if not empty.is_empty():
+                metal -= empty
+        return metal, empty
+
     def place(self, dest, layer_i=-1, region_id="default", merge=False):
         if all([
                 region_id not in self.metal_regions,
@@ -211,9 +1197,14 @@ class ElementBase():
         ]):
             return
 
+        batch = PlacementBatch.find(dest, layer_i)
+        if batch is not None:
+            batch.add(dest, layer_i,
+                      *self._placement_contribution(region_id))
+            return
+
         if (layer_i != -1):
-            r_cell = Region(dest.begin_shapes_rec(layer_i))
-            temp_i = dest.layout().layer(pya.LayerInfo(PROGRAM.LAYER1_NUM, 0))
+            r_cell = cell_layer_region(dest, layer_i)
             if (region_id in self.metal_regions):
                 metal_region = self.metal_regions[region_id]
                 r_cell += metal_region
@@ -224,10 +1215,7 @@ class ElementBase():
             if (merge is True):
                 r_cell.merge()
 
-            dest.shapes(temp_i).insert(r_cell)
-            dest.layout().clear_layer(layer_i)
-            dest.layout().move_layer(temp_i, layer_i)
-            dest.layout().delete_layer(temp_i)
+            write_cell_layer(dest, layer_i, r_cell)
         if (layer_i == -1):  # dest is interpreted as instance of Region() class
             if (region_id in self.metal_regions):
                 metal_region = self.metal_regions[region_id]
@@ -236,66 +1224,146 @@ class ElementBase():
                 empty_region = self.empty_regions[region_id]
                 dest -= empty_region
             if (merge is True):
-                dest.merge()
+                # merge of the whole destination is a full-layer
+                # operation, while per-element booleans stay flat
+                full_layer_merge(dest)
 
 
 class ComplexBase(ElementBase):
     def __init__(self, origin, trans_in=None, region_id="default"):
         super().__init__(origin, trans_in, region_id=region_id)
+        # aggregate regions are built from primitives on first access
+        self._invalidate_regions()
         # ensures sequential order of drawing primitives
         self.primitives: Dict[Hashable, Union[ElementBase, ComplexBase]] = OrderedDict()
+        # parts of the element constructed in `SkeletonMode` instead of
+        # primitives: `name -> (outline, length)`, where outline is
+        # either `DPolygon` or annular sector (see `arc_transformed()`).
+        # See `self.init_skeleton()`
+        self._skeleton_parts: Dict[Hashable, Tuple[Any, float]] = None
         self._init_primitives_trans()
 
+    # Intermediate object representation is kept in its metal regions.
+    # These regions are assembled from primitives only when they are
+    # accessed for the first time and are dropped by every `make_trans`
+    # call. Hence, nested objects do not store the same polygons at
+    # every level of the primitives tree.
+    @property
+    def metal_regions(self) -> Dict[Any, Region]:
+        if self._metal_regions is None:
+            self._build_regions()
+        return self._metal_regions
+
+    @metal_regions.setter
+    def metal_regions(self, value):
+        self._metal_regions = value
+
+    @property
+    def empty_regions(self) -> Dict[Any, Region]:
+        if self._empty_regions is None:
+            self._build_regions()
+        return self._empty_regions
+
+    @empty_regions.setter
+    def empty_regions(self, value):
+        self._empty_regions = value
+
+    @property
+    def metal_region(self) -> Region:
+        return self.metal_regions[self.region_id]
+
+    @metal_region.setter
+    def metal_region(self, value):
+        self.metal_regions[self.region_id] = value
+
+    @property
+    def empty_region(self) -> Region:
+        return self.empty_regions[self.region_id]
+
+    @empty_region.setter
+    def empty_region(self, value):
+        self.empty_regions[self.region_id] = value
+
+    def _invalidate_regions(self):
+        self._metal_regions = None
+        self._empty_regions = None
+
+    def _build_regions(self):
+        metal_regions = OrderedDict()
+        empty_regions = OrderedDict()
+        for reg_id in self.region_ids:
+            metal_regions[reg_id] = Region()
+            metal_regions[reg_id].merged_semantics = True
+            empty_regions[reg_id] = Region()
+            empty_regions[reg_id].merged_semantics = True
+            for element in self.primitives.values():
+                element.place(metal_regions[reg_id], region_id=reg_id)
+        self._metal_regions = metal_regions
+        self._empty_regions = empty_regions
+
     def _init_regions_trans(self):
         pass
 
     def make_trans(self, dCplxTrans_temp: DCplxTrans):
+        self._make_trans_steps([dCplxTrans_temp])
+
+    def _apply_trans_steps(self, steps, dCplxTrans):
         for primitive in self.primitives.values():
-            primitive.make_trans(dCplxTrans_temp)
-        for region in itertools.chain(self.metal_regions.values(), self.empty_regions.values()):
-            iCplxTrans = ICplxTrans().from_dtrans(dCplxTrans_temp)
-            region.transform(iCplxTrans)
-        self._update_connections(dCplxTrans_temp)
-        self._update_alpha(dCplxTrans_temp)
+            primitive._apply_trans_steps(steps, dCplxTrans)
+        if self._skeleton_parts:
+            for name, (outline, length) in self._skeleton_parts.items():
+                if isinstance(outline, DPolygon):
+                    outline = outline.transformed(dCplxTrans)
+                else:
+                    outline = arc_transformed(outline, dCplxTrans)
+                self._skeleton_parts[name] = (outline, length)
+        # aggregate regions will be rebuilt from transformed primitives
+        self._invalidate_regions()
+        for step_dCplxTrans, iCplxTrans in steps:
+            self._transform_stats(step_dCplxTrans, iCplxTrans)
+        self._update_connections(dCplxTrans)
+        self._update_alpha(dCplxTrans)
 
     def _init_primitives_trans(self):
-        self.init_primitives()  # must be implemented in every subclass
-        dr_origin = DSimplePolygon([DPoint(0, 0)])
-        if (self.DCplxTrans_init is not None):
-            # constructor trans displacement
-            dCplxTrans_temp = DCplxTrans(1, 0, False, self.DCplxTrans_init.disp)
-            self.make_trans(dCplxTrans_temp)
-            dr_origin.transform(dCplxTrans_temp)
+        if SkeletonMode.active() and \
+                self._skeleton_supported(init_method="init_primitives"):
+            self._skeleton_parts = OrderedDict()
+            self.init_skeleton()
+        else:
+            self.init_primitives()  # must be implemented in every subclass
 
-            # rest of the constructor trans functions
-            dCplxTrans_temp = self.DCplxTrans_init.dup()
-            dCplxTrans_temp.disp = DPoint(0, 0)
-            self.make_trans(dCplxTrans_temp)
-            dr_origin.transform(dCplxTrans_temp)
-
-        dCplxTrans_temp = DCplxTrans(1, 0, False, self.origin.x, self.origin.y)
-        self.make_trans(dCplxTrans_temp)  # move to the origin
-        self.origin += dr_origin.point(0)
-
-        # Intermediate object representation is kept in its metal regions.
-        # This is a tradeoff biased into memory size to simplify and speedup analysis of
-        # compound objects.
-        for element in self.primitives.values():
-            for reg_id in self.region_ids:
-                element.place(self.metal_regions[reg_id], region_id=reg_id)
+        # all construction transformations are performed in a single
+        # pass over primitives tree
+        transs, dr_origin = self._get_init_trans()
+        self._make_trans_steps(transs)
+        self.origin += dr_origin
+
+    def _placement_contribution(self, region_id="default"):
+        metal = Region()
+        empty = Region()
+        for primitive in self.primitives.values():
+            prim_metal, prim_empty = primitive._placement_contribution(
+                region_id
+            )
+            if not prim_empty.is_empty():
+                metal -= prim_empty
+                empty += prim_empty
+            metal += prim_metal
+        return metal, empty
 
     def place(self, dest, layer_i=-1, region_id="default"):
+        batch = PlacementBatch.find(dest, layer_i)
+        if batch is not None:
+            batch.add(dest, layer_i,
+                      *self._placement_contribution(region_id))
+            return
+
         if (layer_i != -1):
             # `dest` is interpreted as `pya.Cell` object
-            r_cell = Region(dest.begin_shapes_rec(layer_i))
+            r_cell = cell_layer_region(dest, layer_i)
             for primitive in self.primitives.values():
                 primitive.place(r_cell, region_id=region_id)
-
-            temp_i = dest.layout().layer(pya.LayerInfo(PROGRAM.LAYER1_NUM, 0))
-            dest.shapes(temp_i).insert(r_cell)
-            dest.layout().clear_layer(layer_i)
-            dest.layout().move_layer(temp_i, layer_i)
-            dest.layout().delete_layer(temp_i)
+            write_cell_layer(dest, layer_i, r_cell)
         else:
             # `dest` is interpreted as `pya.Region` object
             for primitive in self.primitives.values():
@@ -304,9 +1372,88 @@ class ComplexBase(ElementBase):
     def init_primitives(self):
         raise NotImplementedError
 
+    def init_skeleton(self):
+        """
+            Calculates `self.connections` and `self.angle_connections`
+        in the same reference frame as `self.init_primitives()` does.
+        Instead of building primitives, outlines and lengths of the
+        parts are stored by `self._add_skeleton_straight()` and
+        `self._add_skeleton_arc()` under the names of the primitives
+        they replace. Subelements that are not simple lines may be
+        added to `self.primitives` as usual.
+            See classLib.coplanars.CPWRLPath for example.
+        """
+        # can be implemented in child class
+        raise NotImplementedError
+
+    def _add_skeleton_straight(self, name, start, end, half_width):
+        # the same outline as `CPW.init_skeleton()` has
+        dr = end - start
+        length = dr.abs()
+        outline = DPolygon(DBox(-1, -half_width, length + 1, half_width))
+        self._skeleton_parts[name] = (
+            outline.transformed(
+                DCplxTrans(1, atan2(dr.y, dr.x) * 180 / pi, False,
+                           start.x, start.y)
+            ),
+            length
+        )
+
+    def _add_skeleton_arc(self, name, center, alpha_start, alpha_end, r,
+                          half_width):
+        # sector is extended along the arc the same way as the sector
+        # of `CPWArc.init_skeleton()`
+        d_alpha = copysign(1e-3, alpha_end - alpha_start)
+        self._skeleton_parts[name] = (
+            (center, alpha_start - d_alpha, alpha_end + d_alpha,
+             r - half_width, r + half_width),
+            abs((alpha_end - alpha_start) * r)
+        )
+
     def init_regions(self):
         pass
 
+    def bbox(self):
+        box = DBox()
+        for primitive in self.primitives.values():
+            box += primitive.bbox()
+        if self._skeleton_parts:
+            parts_box = DBox()
+            for outline, _ in self._skeleton_parts.values():
+                if isinstance(outline, DPolygon):
+                    parts_box += outline.bbox()
+                else:
+                    parts_box += arc_bbox(*outline)
+            box += _padded_skeleton_bbox(parts_box)
+        return box
+
+    def _regions_key(self):
+        # primitives tree is identified together with the regions of
+        # its leaves, aggregate regions of `self` are not built
+        return tuple(
+            (id(primitive), primitive._regions_key())
+            for primitive in self.primitives.values()
+        )
+
+    def _geometry_stats(self):
+        # aggregate is updated by `self.make_trans()` and is
+        # recalculated if the primitives tree itself or regions of
+        # the primitives were changed
+        key = self._regions_key()
+        if (self._stats is None) or (key != self._stats_key):
+            box = Box()
+            polygons_n = 0
+            vertices_n = 0
+            for primitive in self.primitives.values():
+                prim_box, prim_polygons_n, prim_vertices_n = \
+                    primitive._geometry_stats()
+                box += prim_box
+                polygons_n += prim_polygons_n
+                vertices_n += prim_vertices_n
+            self._stats = (box, polygons_n, vertices_n)
+            self._stats_key = key
+        return self._stats
+
     def length(self, exception=None):
         """
 
@@ -339,5 +1486,10 @@ class ComplexBase(ElementBase):
                 length += dl
             else:
                 continue
+        if self._skeleton_parts:
+            for name, (_, dl) in self._skeleton_parts.items():
+                if (exception is not None) and (exception in name):
+                    continue
+                length += dl
 
         return length
@@ -1,10 +1,12 @@
 import pya
 from math import cos, sin, atan2, pi
+import numpy as np
 from numpy import sign
 from pya import Point, DPoint, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
 
-from classLib.baseClasses import ElementBase
+from classLib._PROG_SETTINGS import arc_pts_n
+from classLib.baseClasses import ElementBase, arc_polygons
 from classLib.airbridge import Airbridge
 
 
@@ -106,31 +108,22 @@ class BridgedCPWArc(ElementBase):
         self.alpha_start = self.angle_connections[0]
         self.alpha_end = self.angle_connections[1]
 
-    def _get_solid_arc(self, center, R, width, alpha_start, alpha_end, n_inner, n_outer):
-        pts = []
-        #        print(alpha_start/pi, alpha_end/pi, cos( alpha_start ), cos( alpha_end ),
-        #                         sin(alpha_start), sin(alpha_end))
-
+    def _get_cpw_arcs(self, center, alpha_start, alpha_end, n_pts):
         if alpha_end > alpha_start:
             alpha_start = alpha_start - 1e-3
             alpha_end = alpha_end + 1e-3
         else:
             alpha_start = alpha_start + 1e-3
             alpha_end = alpha_end - 1e-3
+        alphas = np.linspace(alpha_start, alpha_end, n_pts)
 
-        d_alpha_inner = (alpha_end - alpha_start) / (n_inner - 1)
-        d_alpha_outer = -(alpha_end - alpha_start) / (n_outer - 1)
-
-        #        print("Center:", center)
-
-        for i in range(0, n_inner):
-            alpha = alpha_start + d_alpha_inner * i
-            pts.append(center + DPoint(cos(alpha), sin(alpha)) * (R - width / 2))
-        for i in range(0, n_outer):
-            alpha = alpha_end + d_alpha_outer * i
-            pts.append(center + DPoint(cos(alpha), sin(alpha)) * (R + width / 2))
-        #        print("Points:", pts[:n_inner],"\n       ", pts[n_inner:], "\n")
-        return DSimplePolygon(pts)
+        r_metal_in = self.R - self.width / 2
+        r_metal_out = self.R + self.width / 2
+        return arc_polygons(
+            center, alphas,
+            r_inner=[[r_metal_in], [r_metal_in - self.gap], [r_metal_out]],
+            r_outer=[[r_metal_out], [r_metal_in], [r_metal_out + self.gap]]
+        )
 
     def init_regions(self):
 
@@ -149,21 +142,15 @@ class BridgedCPWArc(ElementBase):
         self.end = self.dr
         self.center = DPoint(0, self.R)
 
-        n_inner = 10
-        n_outer = 10
-
-        metal_arc = self._get_solid_arc(self.center, self.R, self.width,
-                                        self.alpha_start - pi / 2, self.alpha_end - pi / 2, n_inner, n_outer)
-
-        empty_arc1 = self._get_solid_arc(self.center, self.R - (self.width + self.gap) / 2,
-                                         self.gap, self.alpha_start - pi / 2, self.alpha_end - pi / 2, n_inner, n_outer)
-
-        empty_arc2 = self._get_solid_arc(self.center, self.R + (self.width + self.gap) / 2,
-                                         self.gap, self.alpha_start - pi / 2, self.alpha_end - pi / 2, n_inner, n_outer)
-
-        self.metal_regions["photo"].insert(SimplePolygon(metal_arc))
-        self.empty_regions["photo"].insert(SimplePolygon(empty_arc1))
-        self.empty_regions["photo"].insert(SimplePolygon(empty_arc2))
+        n_pts = arc_pts_n(self.R + self.width / 2 + self.gap,
+                          self.delta_alpha, fixed_n=10)
+        metal_arc, empty_arc1, empty_arc2 = self._get_cpw_arcs(
+            self.center, self.alpha_start - pi / 2, self.alpha_end - pi / 2,
+            n_pts
+        )
+        self.metal_regions["photo"].insert(metal_arc)
+        self.empty_regions["photo"].insert(empty_arc1)
+        self.empty_regions["photo"].insert(empty_arc2)
 
         bridge_pos = self.center + DPoint(sin(self.delta_alpha / 2), -cos(self.delta_alpha / 2)) * self.R
 
@@ -1,10 +1,13 @@
 import pya
+import numpy as np
 from math import sqrt, cos, sin, tan, atan2, pi, copysign
 from pya import Point, DPoint, Vector, DVector, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
 
 from classLib.coplanars import *
 from classLib.shapes import *
+from classLib._PROG_SETTINGS import arc_pts_n
+from classLib.baseClasses import arc_polygons
 
 
 class CWave2CPW(ElementBase):
@@ -12,7 +15,7 @@ class CWave2CPW(ElementBase):
     Draws width semi-circle coupler from coplanar waveguide to jelly capacitance plates.
     '''
 
-    def __init__(self, c_wave_cap, params, n_pts=50, trans_in=None):
+    def __init__(self, c_wave_cap, params, n_pts=None, trans_in=None):
         self.c_wave_ref = c_wave_cap
         if isinstance(params, dict):
             self.Z1 = params['Z1']
@@ -36,38 +39,30 @@ class CWave2CPW(ElementBase):
         self.n_pts = n_pts
         super().__init__(self.c_wave_ref.origin, trans_in)
 
-    def _get_solid_arc(self, center, R, width, alpha_start, alpha_end, n_inner, n_outer):
-        pts = []
-
-        d_alpha_inner = (alpha_end - alpha_start) / (n_inner - 1)
-        d_alpha_outer = -(alpha_end - alpha_start) / (n_outer - 1)
-
-        for i in range(0, n_inner):
-            alpha = alpha_start + d_alpha_inner * i
-            pts.append(center + DPoint(cos(alpha), sin(alpha)) * (R - width / 2))
-        for i in range(0, n_outer):
-            alpha = alpha_end + d_alpha_outer * i
-            pts.append(center + DPoint(cos(alpha), sin(alpha)) * (R + width / 2))
-
-        return DSimplePolygon(pts)
-
     def init_regions(self):
         origin = DPoint(0, 0)
-        arc_1_solid = self._get_solid_arc(origin, self.c_wave_ref.in_circle.r + self.gap1 + self.width1 / 2,
-                                          self.width1,
-                                          pi / 2 - self.d_alpha1 / 2, pi / 2 + self.d_alpha1 / 2,
-                                          self.n_pts, self.n_pts)
-        arc_1_empty = self._get_solid_arc(origin, self.c_wave_ref.in_circle.r + self.gap1 / 2, self.gap1,
-                                          pi / 2 - self.d_alpha1 / 2, pi / 2 + self.d_alpha1 / 2,
-                                          self.n_pts, self.n_pts)
-
-        arc_2_solid = self._get_solid_arc(origin, self.c_wave_ref.in_circle.r + self.gap2 + self.width2 / 2,
-                                          self.width2,
-                                          3 / 2 * pi - self.d_alpha2 / 2, 3 / 2 * pi + self.d_alpha2 / 2,
-                                          self.n_pts, self.n_pts)
-        arc_2_empty = self._get_solid_arc(origin, self.c_wave_ref.in_circle.r + self.gap2 / 2, self.gap2,
-                                          3 / 2 * pi - self.d_alpha2 / 2, 3 / 2 * pi + self.d_alpha2 / 2,
-                                          self.n_pts, self.n_pts)
+        r_in = self.c_wave_ref.in_circle.r
+        n_pts_1 = self.n_pts
+        n_pts_2 = self.n_pts
+        if self.n_pts is None:
+            n_pts_1 = arc_pts_n(r_in + self.gap1 + self.width1, self.d_alpha1)
+            n_pts_2 = arc_pts_n(r_in + self.gap2 + self.width2, self.d_alpha2)
+
+        # solid and empty arcs share angular grid
+        alphas_1 = np.linspace(pi / 2 - self.d_alpha1 / 2,
+                               pi / 2 + self.d_alpha1 / 2, n_pts_1)
+        arc_1_solid, arc_1_empty = arc_polygons(
+            origin, alphas_1,
+            r_inner=[[r_in + self.gap1], [r_in]],
+            r_outer=[[r_in + self.gap1 + self.width1], [r_in + self.gap1]]
+        )
+        alphas_2 = np.linspace(3 / 2 * pi - self.d_alpha2 / 2,
+                               3 / 2 * pi + self.d_alpha2 / 2, n_pts_2)
+        arc_2_solid, arc_2_empty = arc_polygons(
+            origin, alphas_2,
+            r_inner=[[r_in + self.gap2], [r_in]],
+            r_outer=[[r_in + self.gap2 + self.width2], [r_in + self.gap2]]
+        )
         self.metal_region.insert(arc_1_solid)
         self.metal_region.insert(arc_2_solid)
         self.empty_region.insert(arc_1_empty)
@@ -79,7 +74,7 @@ class CWave(ComplexBase):
     Draws width condensator from width circle cutted into 2 pieces.
     '''
 
-    def __init__(self, center, r_out, dr, n_segments, s, alpha, r_curve, delta=40e3, n_pts=50, solid=True,
+    def __init__(self, center, r_out, dr, n_segments, s, alpha, r_curve, delta=40e3, n_pts=None, solid=True,
                  trans_in=None):
         '''
         Parameters:
@@ -99,8 +94,9 @@ class CWave(ComplexBase):
             The outer_r of single arc.
         delta: float
             length of the horizontal lines on the ends of the cut
-        n_pts: int
+        n_pts: Optional[int]
             The number of points on the perimeter of the circle.
+            If `None`, it is chosen according to `PROGRAM.ARC_CHORD_ERROR`.
         solid: ???
         trans_in: Bool
             Initial transformation
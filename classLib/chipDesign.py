@@ -1,12 +1,278 @@
 import pya
 from pya import Region, DPoint, Cell, Vector, Trans, DSimplePolygon
+from pya import DCplxTrans, ICplxTrans, CellInstArray
 
 from classLib._PROG_SETTINGS import PROGRAM
+from classLib.baseClasses import PlacementBatch, to_dcplxtrans, \
+    full_layer_boolean, cell_layer_region, write_cell_layer, ElementBase
+
+from classLib.helpers.region_manipulation import regions_to_bytes, \
+    regions_from_bytes
+from classLib.helpers.element_index import ElementIndex
+from classLib.helpers.tiled_pipeline import TiledPipeline
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from numbers import Number
-from typing import Union
+from typing import Union, List, Any
+
+
+class BuildTask:
+    """
+        Independent part of a design that can be constructed in a
+    separate process. See `ChipDesign.run_build_tasks()`.
+        `func(*args, **kwargs)` has to return `(placements, data)`
+    pair. `placements` is a list of
+    `(dest_name, element)` or `(dest_name, element, region_id)`
+    tuples, where `dest_name` is a name of the design's `Region`
+    attribute (e.g. "region_ph") the `element` has to be placed into.
+    `data` is any picklable object that is returned to the design
+    (e.g. connection points of constructed elements).
+        `func`, `args` and `kwargs` have to be picklable, i.e. `func`
+    has to be defined at module level of importable module.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _run_build_task(task: BuildTask):
+    placements, data = task.func(*task.args, **task.kwargs)
+    # every destination receives a single `(metal, empty)` pair
+    # equivalent to the sequence of task placements
+    contributions = OrderedDict()
+    for placement in placements:
+        dest_name, element = placement[:2]
+        region_id = placement[2] if len(placement) > 2 else "default"
+        contribution = element._placement_contribution(region_id)
+        if dest_name in contributions:
+            contribution = PlacementBatch._combine(
+                contributions[dest_name], contribution
+            )
+        contributions[dest_name] = contribution
+    regions = [reg for pair in contributions.values() for reg in pair]
+    return list(contributions.keys()), regions_to_bytes(regions), data
+
+
+def gui_available():
+    """
+    Returns `True` if code is executed inside KLayout application
+    that has main window. `False` for standalone `klayout` python
+    package and KLayout batch mode (`klayout -b`).
+    """
+    if not hasattr(pya, "Application"):
+        return False
+    app = pya.Application.instance()
+    if app is None:
+        return False
+    return app.main_window() is not None
+
+
+class HeadlessLayoutView:
+    """
+        Minimal replacement of `pya.LayoutView` for designs that are
+    generated without KLayout GUI. View-only calls are ignored,
+    `save_as` writes layout directly.
+    """
+
+    def __init__(self, layout):
+        self.layout = layout
+
+    def select_cell(self, cell_index, cv_index):
+        pass
+
+    def add_missing_layers(self):
+        pass
+
+    def zoom_fit(self):
+        pass
+
+    def save_as(self, cell_index, filename, slo):
+        # `LayoutView.save_as` writes `cell_index` as top cell
+        slo.clear_cells()
+        slo.add_cell(cell_index)
+        self.layout.write(filename, slo)
+
+
+class CellInstancer:
+    """
+        Writes repeated elements into layout hierarchically.
+        Geometry of an element prototype is stored once in a child
+    cell of `top_cell` and every placement is a `CellInstArray`
+    that refers to this cell. Regular arrays are stored as a single
+    array instance.
+        Empty regions of placed elements are erased from the supplied
+    flat destination region in a single boolean per call. Empty
+    regions are expanded by `begin_shapes_rec` of the instances just
+    created, so no per-placement Python geometry is produced.
+
+    Notes
+    -----
+        Element prototype has to be constructed in its local
+    reference frame (usually at `DPoint(0, 0)` without `trans_in`).
+    Every placement is described by a transformation of the
+    prototype.
+        Instanced metal is not part of the design's flat regions, so
+    region-level post-processing (inversion, overetching, polygons
+    splitting, etc.) does not apply to it.
+    """
+
+    def __init__(self, top_cell: Cell):
+        self.top_cell = top_cell
+        self.layout = top_cell.layout()
+        # (geometry key, placement key, layer_i, region_id) ->
+        # (element, child cell). See `self._cell_key()`.
+        # Element reference keeps `id(element)` unique
+        self._cells = OrderedDict()
+
+    @staticmethod
+    def _cell_key(element, layer_i, region_id):
+        # elements of the same class with equal geometry keys share
+        # the cell, other elements are distinguished by identity
+        geometry_key = element._geometry_cache_key()
+        if geometry_key is None:
+            geometry_key = id(element)
+        else:
+            geometry_key = (element.__class__, tuple(geometry_key))
+        # current placement of the prototype, so prototype that was
+        # transformed after the cell was created gets a new cell
+        box, polygons_n, vertices_n = element._geometry_stats()
+        placement_key = (
+            (box.left, box.bottom, box.right, box.top, polygons_n,
+             vertices_n),
+            tuple((round(pt.x, 3), round(pt.y, 3))
+                  for pt in element.connections),
+            tuple(round(alpha, 9) for alpha in element.angle_connections)
+        )
+        return geometry_key, placement_key, layer_i, region_id
+
+    def element_cell(self, element, layer_i, region_id="default"):
+        """
+        Returns child cell that contains metal of the `element`
+        region `region_id` on layer `layer_i`. Cell is created
+        during the first request and is shared by elements with equal
+        `_geometry_cache_key()` and placement.
+
+        Parameters
+        ----------
+        element : ElementBase
+            element prototype
+        layer_i : int
+            layer index to put element metal into
+        region_id : Hashable
+            element region to be instanced
+
+        Returns
+        -------
+        Cell
+        """
+        key = self._cell_key(element, layer_i, region_id)
+        if key not in self._cells:
+            cell = self.layout.create_cell(
+                f"{element.__class__.__name__}_{len(self._cells)}"
+            )
+            metal, _ = element._placement_contribution(region_id)
+            cell.shapes(layer_i).insert(metal)
+            self._cells[key] = (element, cell)
+        return self._cells[key][1]
+
+    def place(self, element, transs: List[DCplxTrans], layer_i,
+              region_id="default", dest: Region = None):
+        """
+        Places `element` prototype with every transformation from
+        `transs`.
+
+        Parameters
+        ----------
+        element : ElementBase
+            element prototype
+        transs : List[Union[DCplxTrans, DTrans]]
+            placement transformations
+        layer_i : int
+            layer index to put element metal into
+        region_id : Hashable
+            element region to be instanced
+        dest : Optional[Region]
+            flat region that element empty region is erased from
+
+        Returns
+        -------
+        None
+        """
+        cell_index = self.element_cell(element, layer_i,
+                                       region_id).cell_index()
+        inst_arrs = [
+            CellInstArray(
+                cell_index, ICplxTrans().from_dtrans(to_dcplxtrans(trans))
+            )
+            for trans in transs
+        ]
+        self._insert(element, inst_arrs, region_id, dest)
+
+    def place_array(self, element, trans, a, b, na, nb, layer_i,
+                    region_id="default", dest: Region = None):
+        """
+        Places `element` prototype as a regular array. Placement
+        `(i, j)` is transformed by `trans` followed by displacement
+        `i*a + j*b`.
+
+        Parameters
+        ----------
+        element : ElementBase
+            element prototype
+        trans : Union[DCplxTrans, DTrans]
+            transformation of the array's first element
+        a : DVector
+            first array axis
+        b : DVector
+            second array axis
+        na : int
+            number of elements along `a`
+        nb : int
+            number of elements along `b`
+        layer_i : int
+            layer index to put element metal into
+        region_id : Hashable
+            element region to be instanced
+        dest : Optional[Region]
+            flat region that element empty region is erased from
+
+        Returns
+        -------
+        None
+        """
+        inst_arr = CellInstArray(
+            self.element_cell(element, layer_i, region_id).cell_index(),
+            ICplxTrans().from_dtrans(to_dcplxtrans(trans)),
+            Vector(a), Vector(b), na, nb
+        )
+        self._insert(element, [inst_arr], region_id, dest)
+
+    def _insert(self, element, inst_arrs, region_id, dest):
+        for inst_arr in inst_arrs:
+            self.top_cell.insert(inst_arr)
+        if (dest is None) or (region_id not in element.empty_regions) or \
+                element.empty_regions[region_id].is_empty():
+            return
+
+        # empty region is temporary instanced on a separate layer
+        # and flattened by layout database itself
+        holder = self.layout.create_cell("__empty_holder")
+        temp_i = self.layout.insert_layer(pya.LayerInfo())
+        empty_cell = self.layout.create_cell("__empty")
+        empty_cell.shapes(temp_i).insert(element.empty_regions[region_id])
+        for inst_arr in inst_arrs:
+            inst_arr = inst_arr.dup()
+            inst_arr.cell_index = empty_cell.cell_index()
+            holder.insert(inst_arr)
+        # in deep mode boolean is performed hierarchically
+        full_layer_boolean(dest, cell_layer_region(holder, temp_i), "-")
+        holder.delete()
+        empty_cell.delete()
+        self.layout.delete_layer(temp_i)
 
 
 class ChipDesign:
@@ -24,25 +290,34 @@ class ChipDesign:
             chip_name of cell design will be written into, e.g. 'testScript'
         """
         # getting main references of the application
-        self.app = pya.Application.instance()
-        self.mw = self.app.main_window()
-        self.lv = self.mw.current_view()
+        self.app = None
+        self.mw = None
+        self.lv = None
         self.cv = None
         self.cell = None
+        self.headless = not gui_available()
 
         # basic regions for sample
         self.region_ph = Region()
         self.region_el = Region()
 
-        # this insures that lv and cv are valid objects
-        if (self.lv == None):
-            self.cv = self.mw.create_layout(1)
-            self.lv = self.mw.current_view()
+        if self.headless:
+            # standalone `klayout.db` or KLayout batch mode
+            self.layout = pya.Layout()
+            self.lv = HeadlessLayoutView(self.layout)
         else:
-            self.cv = self.lv.active_cellview()
+            self.app = pya.Application.instance()
+            self.mw = self.app.main_window()
+            self.lv = self.mw.current_view()
+            # this insures that lv and cv are valid objects
+            if (self.lv == None):
+                self.cv = self.mw.create_layout(1)
+                self.lv = self.mw.current_view()
+            else:
+                self.cv = self.lv.active_cellview()
+            self.layout = self.cv.layout()
 
         # find or create the desired by programmer cell and layer
-        self.layout = self.cv.layout()
         self.layout.dbu = 0.001
         if (self.layout.has_cell(cell_name)):
             self.cell = self.layout.cell(cell_name)
@@ -58,7 +333,7 @@ class ChipDesign:
         # clear this cell and layer
         self.cell.clear()
 
-        # setting layout view  
+        # setting layout view
         self.lv.select_cell(self.cell.cell_index(), 0)
         self.lv.add_missing_layers()
 
@@ -72,6 +347,15 @@ class ChipDesign:
         self.design_pars = OrderedDict()
         self.sonnet_ports: list[DPoint] = []
 
+        # opt-in hierarchical output of repeated elements.
+        # See `self.place_instances()`
+        self.hierarchical = False
+        self._instancer: CellInstancer = None
+
+        # spatial index of the drawn elements.
+        # See `self.index_elements()`
+        self.element_index = ElementIndex()
+
     def get_version(self):
         return self.version
 
@@ -112,6 +396,237 @@ class ChipDesign:
         self.cell.shapes(self.layer_el).insert(self.region_el)
         self.lv.zoom_fit()
 
+    def placement_batch(self, *dests, merge=False):
+        """
+            Returns context manager that postpones every `place()` call
+        into `dests` and commits them with a single boolean pass per
+        destination at exit.
+            If `dests` are not supplied, every `Region` attribute of the
+        design (`self.region_ph`, `self.region_el` and regions added in
+        child classes) is batched.
+
+        Parameters
+        ----------
+        dests : Union[Region, Tuple[Cell, int]]
+            regions or `(cell, layer_i)` pairs to be batched
+        merge : bool
+            merge destinations after commit
+
+        Returns
+        -------
+        PlacementBatch
+
+        Examples
+        --------
+        ```python
+        with self.placement_batch():
+            for resonator in self.resonators:
+                resonator.place(self.region_ph)
+        ```
+        """
+        if len(dests) == 0:
+            dests = [val for val in self.__dict__.values()
+                     if isinstance(val, Region)]
+        return PlacementBatch(*dests, merge=merge)
+
+    def index_elements(self, *attr_names):
+        """
+            Fills `self.element_index` with elements stored in design
+        attributes. Element stored in list, tuple or dict attribute
+        is named as `attr_name[key]`.
+            If `attr_names` are not supplied, every attribute of the
+        design that holds elements is indexed.
+            Elements have to be already transformed to their final
+        positions. Index is rebuilt on every call, while elements
+        transformed after the call have to be refreshed by
+        `self.element_index.refresh(name)`.
+
+        Parameters
+        ----------
+        attr_names : str
+            names of the design attributes to be indexed
+
+        Returns
+        -------
+        ElementIndex
+
+        Examples
+        --------
+        ```python
+        index = self.index_elements("resonators", "xmons")
+        for name_a, name_b, _ in index.clearance_violations(20e3):
+            print(f"{name_a} is too close to {name_b}")
+        ```
+        """
+        if len(attr_names) == 0:
+            attr_names = list(self.__dict__.keys())
+        self.element_index.clear()
+        for attr_name in attr_names:
+            val = getattr(self, attr_name)
+            if isinstance(val, ElementBase):
+                self.element_index.insert(attr_name, val)
+            elif isinstance(val, (list, tuple, dict)):
+                items = val.items() if isinstance(val, dict) \
+                    else enumerate(val)
+                for key, element in items:
+                    if isinstance(element, ElementBase):
+                        self.element_index.insert(
+                            f"{attr_name}[{key}]", element
+                        )
+        return self.element_index
+
+    @property
+    def instancer(self):
+        if self._instancer is None:
+            self._instancer = CellInstancer(self.cell)
+        return self._instancer
+
+    def place_instances(self, element, transs, layer_i,
+                        region_id="default", dest=None):
+        """
+            Places copies of `element` prototype transformed by each of
+        `transs`.
+            If `self.hierarchical` is `True`, prototype metal is stored
+        once as a child cell of `self.cell` and copies are inserted as
+        cell instances on `layer_i`. Empty region of every copy is
+        erased from `dest`.
+            Otherwise copies are placed into `dest` as usual.
+
+        Parameters
+        ----------
+        element : ElementBase
+            element prototype constructed in its local reference frame
+        transs : List[Union[DCplxTrans, DTrans]]
+            placement transformations
+        layer_i : int
+            layer index for instanced metal
+        region_id : Hashable
+            element region to be placed
+        dest : Optional[Region]
+            flat destination region. If `None`, region that
+        corresponds to `layer_i` is used (see `self._reg_from_layer`).
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        ```python
+        self.hierarchical = True
+        bridge = Bridge1(DPoint(0, 0))
+        self.place_instances(
+            bridge, [DCplxTrans(1, 90, False, pt) for pt in centers],
+            self.layer_bridges1, region_id="bridges_1",
+            dest=self.region_bridges1
+        )
+        ```
+        """
+        if dest is None:
+            dest = self._reg_from_layer(layer_i)
+        if self.hierarchical:
+            self.instancer.place(element, transs, layer_i,
+                                 region_id=region_id, dest=dest)
+        else:
+            self._place_copies(element, transs, region_id, dest)
+
+    def place_instance_array(self, element, trans, a, b, na, nb, layer_i,
+                             region_id="default", dest=None):
+        """
+            Places `element` prototype as a regular `na` x `nb` array
+        with axes `a` and `b` starting from `trans`.
+            In hierarchical mode a single array instance is inserted.
+            See `self.place_instances()` for the rest of details.
+
+        Returns
+        -------
+        None
+        """
+        if dest is None:
+            dest = self._reg_from_layer(layer_i)
+        if self.hierarchical:
+            self.instancer.place_array(element, trans, a, b, na, nb,
+                                       layer_i, region_id=region_id,
+                                       dest=dest)
+        else:
+            trans = to_dcplxtrans(trans)
+            transs = [
+                DCplxTrans(1, 0, False, a * i + b * j) * trans
+                for i in range(na) for j in range(nb)
+            ]
+            self._place_copies(element, transs, region_id, dest)
+
+    @staticmethod
+    def _place_copies(element, transs, region_id, dest):
+        metal, empty = element._placement_contribution(region_id)
+        batch = PlacementBatch.find(dest)
+        own_batch = batch is None
+        if own_batch:
+            batch = PlacementBatch(dest)
+        for trans in transs:
+            itrans = ICplxTrans().from_dtrans(to_dcplxtrans(trans))
+            batch.add(dest, -1, metal.transformed(itrans),
+                      empty.transformed(itrans))
+        if own_batch:
+            batch.flush()
+
+    def run_build_tasks(self, tasks: List[BuildTask], max_workers=None):
+        """
+            Constructs independent design parts in a process pool and
+        places their geometry into the design's regions.
+            Geometry is shipped back from worker processes as
+        serialized regions and placed in order of `tasks`, so the
+        result does not depend on the workers' completion order and
+        equals to sequential execution of tasks.
+
+        Parameters
+        ----------
+        tasks : List[BuildTask]
+            independent build tasks
+        max_workers : Optional[int]
+            number of worker processes. `None` - number of CPUs.
+            `1` - tasks are executed in the current process.
+
+        Returns
+        -------
+        List[Any]
+            `data` returned by tasks, in order of `tasks`
+
+        Examples
+        --------
+        ```python
+        # module level
+        def build_resonator(Z0, origin, L_coupling):
+            res = EMResonatorTL3QbitWormRLTailXmonFork(Z0, origin, ...)
+            return [("region_ph", res)], res.end
+
+        # inside `draw()`
+        tasks = [BuildTask(build_resonator, self.Z_res, pt, L)
+                 for pt, L in zip(self.res_origins, self.L_couplings)]
+        res_ends = self.run_build_tasks(tasks)
+        ```
+        """
+        if (max_workers == 1) or (len(tasks) <= 1):
+            results = [_run_build_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_run_build_task, tasks))
+
+        datas = []
+        for dest_names, geometry_bytes, data in results:
+            regions = regions_from_bytes(geometry_bytes, 2 * len(dest_names))
+            for i, dest_name in enumerate(dest_names):
+                dest = getattr(self, dest_name)
+                metal, empty = regions[2 * i], regions[2 * i + 1]
+                batch = PlacementBatch.find(dest)
+                if batch is not None:
+                    batch.add(dest, -1, metal, empty)
+                else:
+                    full_layer_boolean(dest, empty, "-")
+                    full_layer_boolean(dest, metal, "+")
+            datas.append(data)
+        return datas
+
     # Erases everything outside the box
     def crop(self, box, region=None):
         if region is None:
@@ -123,7 +638,7 @@ class ChipDesign:
     # Erases everything outside the box in width layer
     def __crop_box_in_region(self, region, box):
         box_reg = Region(box)
-        region &= box_reg
+        full_layer_boolean(region, box_reg, "&")
 
     def _reg_from_layer(self, layer):
         if layer == self.layer_el:
@@ -157,19 +672,48 @@ class ChipDesign:
 
         if layer_i == -1:
             dest_reg = dest
-            dest_reg ^= tmp_reg
+            full_layer_boolean(dest_reg, tmp_reg, "^")
         else:
-            r_cell = Region(dest.begin_shapes_rec(layer_i))
+            r_cell = cell_layer_region(dest, layer_i)
             r_cell ^= tmp_reg
-            temp_layer_i = dest.layout().layer(pya.LayerInfo(PROGRAM.LAYER1_NUM, 0))
-
-            # Moving layers.
-            # Due to internal representation, region polygons are actually
-            # point to polygons in width cell. So we can
-            dest.shapes(temp_layer_i).insert(r_cell)
-            dest.layout().clear_layer(layer_i)
-            dest.layout().move_layer(temp_layer_i, layer_i)
-            dest.layout().delete_layer(temp_layer_i)
+            write_cell_layer(dest, layer_i, r_cell)
+
+    def tiled_pipeline(self, tile_size=2e6, border=None, threads=None,
+                       box=None):
+        """
+            Returns empty chain of post-processing stages that are
+        executed tile by tile over the chip box. Stages are added by
+        `crop()`, `inverse()`, `sized()`, `pinning_holes()`, `split()`
+        and `resolve_holes()` calls and executed by `run(region)`.
+        See `classLib.helpers.tiled_pipeline`.
+
+        Parameters
+        ----------
+        tile_size : float
+            tile size in nm
+        border : Optional[float]
+            tiles overlap in nm. Calculated from the stages if `None`.
+        threads : Optional[int]
+            number of threads. `BOOLEAN_ENGINE.THREADS` is used if `None`.
+        box : Optional[DBox]
+            processed area, e.g. reticle box. `self.chip_box` if `None`.
+
+        Returns
+        -------
+        TiledPipeline
+
+        Examples
+        --------
+        ```python
+        pipeline = self.tiled_pipeline(tile_size=2e6)
+        pipeline.sized(*FABRICATION.overetching("photo")).inverse()
+        pipeline.split(max_pts=180).resolve_holes()
+        self.region_ph = pipeline.run(self.region_ph)
+        ```
+        """
+        if box is None:
+            box = self.chip_box
+        return TiledPipeline(box, tile_size, border, threads)
 
     def transform_region(self, reg, trans, trans_ports=False):
         """
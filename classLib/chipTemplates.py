@@ -34,6 +34,38 @@ class FABRICATION:
     overetching, depending on the design and fabrication process.
     """
     OVERETCHING = 0.0e3
+    # overetching along `y` axis if etching is anisotropic.
+    # `OVERETCHING` is used if `None`.
+    OVERETCHING_Y = None
+    # per-layer values that override the ones above.
+    # Layer name -> overetching or `(overetching_x, overetching_y)`,
+    # e.g. `{"bridges1": 0.2e3}`
+    LAYERS_OVERETCHING = {}
+
+    @staticmethod
+    def overetching(layer_name=None):
+        """
+        Returns overetching of the layer.
+
+        Parameters
+        ----------
+        layer_name : str
+            key of `FABRICATION.LAYERS_OVERETCHING`
+
+        Returns
+        -------
+        Tuple[float, float]
+            overetching along `x` and `y` axes in nm. Values of
+            different signs are applied by `sized_region` in two passes.
+        """
+        value = FABRICATION.LAYERS_OVERETCHING.get(layer_name)
+        if value is None:
+            if FABRICATION.OVERETCHING_Y is None:
+                return FABRICATION.OVERETCHING, FABRICATION.OVERETCHING
+            return FABRICATION.OVERETCHING, FABRICATION.OVERETCHING_Y
+        if isinstance(value, (tuple, list)):
+            return tuple(value)
+        return value, value
 
 
 class Chip5x10_with_contactPads(ComplexBase):
@@ -2,31 +2,88 @@ from math import sqrt, cos, sin, atan2, pi, copysign, tan
 
 import pya
 import numpy as np
-from pya import Point, DPoint, DVector, DSimplePolygon, SimplePolygon, \
-    DPolygon, Polygon, Region
+from pya import Point, DPoint, DVector, DBox, DSimplePolygon, \
+    SimplePolygon, DPolygon, Polygon, Region
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
 
 from typing import Union, List
 from collections import OrderedDict
 import itertools
-import copy
 
-from classLib.baseClasses import ElementBase, ComplexBase
+from classLib._PROG_SETTINGS import PROGRAM, arc_pts_n
+from classLib.baseClasses import ElementBase, ComplexBase, PlacementBatch, \
+    SkeletonMode, _regions_stats
+from classLib.baseClasses import arc_polygons, arc_bbox, stripe_polygon, \
+    array_to_simple_polygon, \
+    cell_layer_region, write_cell_layer, full_layer_boolean
 from classLib.bridgedCoplanars import BridgedCPW, BridgedCPWArc
 
 
-class CPWParameters(ElementBase):
+class CPWParameters:
+    """
+    Immutable set of coplanar waveguide cross-section parameters.
+
+    Instances are hashable and compare by value, so they can be shared
+    between path segments (e.g. `[cpw_params] * N`) and used as
+    dictionary keys. Copying returns the same object.
+    """
+    __slots__ = ("width", "gap", "smoothing")
+
     def __init__(self, width=0, gap=0, smoothing=False):
         # smoothing `True` value means that this CPW is designated
         # to continuously connect two coplanars. None of the other
         # parameters matter in this case.
-        self.smoothing = smoothing
-        self.width = width
-        self.gap = gap
-        self.b = 2 * gap + width
+        object.__setattr__(self, "smoothing", smoothing)
+        object.__setattr__(self, "width", width)
+        object.__setattr__(self, "gap", gap)
+
+    @property
+    def b(self):
+        return 2 * self.gap + self.width
+
+    @property
+    def _geometry_parameters(self):
+        return {"cpw width, um": self.width,
+                "cpw_gap, um": self.gap}
+
+    def get_geometry_params_dict(self, prefix="", postfix=""):
+        return {prefix + key + postfix: item
+                for key, item in self._geometry_parameters.items()}
+
+    def _key(self):
+        return self.width, self.gap, self.smoothing
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable, "
+            f"construct a new instance instead"
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CPWParameters):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(width={self.width}, " \
+               f"gap={self.gap}, smoothing={self.smoothing})"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
-        self._geometry_parameters = {"cpw width, um": self.width,
-                                     "cpw_gap, um": self.gap}
+    def __reduce__(self):
+        return self.__class__, self._key()
 
 
 class CPW(ElementBase):
@@ -106,6 +163,22 @@ class CPW(ElementBase):
         self.metal_region.transform(alpha_trans)
         self.empty_region.transform(alpha_trans)
 
+    def init_skeleton(self):
+        self.connections = [DPoint(0, 0), self.dr]
+        self.start = DPoint(0, 0)
+        self.end = self.start + self.dr
+        alpha = atan2(self.dr.y, self.dr.x)
+        self.angle_connections = [alpha, alpha]
+        hw = max(self.width / 2, self.width / 2 + self.gap)
+        # regions are sized by 1 nm along the line
+        self._skeleton_polygon = DPolygon(
+            DBox(-1, -hw, self.dr.abs() + 1, hw)
+        ).transformed(DCplxTrans(1, alpha * 180 / pi, False, 0, 0))
+        self._skeleton_bbox = self._skeleton_polygon.bbox()
+
+    def _geometry_cache_key(self):
+        return self.width, self.gap, self.dr.x, self.dr.y
+
     def _refresh_named_connections(self):
         self.end = self.connections[1]
         self.start = self.connections[0]
@@ -155,33 +228,41 @@ class CPWArc(ElementBase):
         self.alpha_start = self.angle_connections[0]
         self.alpha_end = self.angle_connections[1]
 
-    def _get_solid_arc(self, center, R, width,
-                       alpha_start, alpha_end, n_inner, n_outer):
-        pts = []
-        #        print(alpha_start/pi, alpha_end/pi, cos( alpha_start ), cos( alpha_end ),
-        #                         sin(alpha_start), sin(alpha_end))
+    def _get_cpw_arcs(self, center, alpha_start, alpha_end, n_pts):
+        """
+        Returns central metal, inner gap and outer gap polygons of the
+        arc built in a single vectorized pass.
+
+        Parameters
+        ----------
+        center : DPoint
+            center of the arc
+        alpha_start : float
+            starting angle of the arc points in radians
+        alpha_end : float
+            ending angle of the arc points in radians
+        n_pts : int
+            number of points of every contour (including both ends)
 
+        Returns
+        -------
+        List[SimplePolygon]
+        """
         if alpha_end > alpha_start:
             alpha_start = alpha_start - 1e-3
             alpha_end = alpha_end + 1e-3
         else:
             alpha_start = alpha_start + 1e-3
             alpha_end = alpha_end - 1e-3
-
-        d_alpha_inner = (alpha_end - alpha_start) / (n_inner - 1)
-        d_alpha_outer = -d_alpha_inner
-
-        #        print("Center:", center)
-        for i in range(0, n_inner):
-            alpha = alpha_start + d_alpha_inner * i
-            pts.append(
-                center + DPoint(cos(alpha), sin(alpha)) * (R - width / 2))
-        for i in range(0, n_outer):
-            alpha = alpha_end + d_alpha_outer * i
-            pts.append(
-                center + DPoint(cos(alpha), sin(alpha)) * (R + width / 2))
-        #        print("Points:", pts[:n_inner],"\n       ", pts[n_inner:], "\n")
-        return DSimplePolygon(pts)
+        alphas = np.linspace(alpha_start, alpha_end, n_pts)
+
+        r_metal_in = self.R - self.width / 2
+        r_metal_out = self.R + self.width / 2
+        return arc_polygons(
+            center, alphas,
+            r_inner=[[r_metal_in], [r_metal_in - self.gap], [r_metal_out]],
+            r_outer=[[r_metal_out], [r_metal_in], [r_metal_out + self.gap]]
+        )
 
     def init_regions(self):
         self.connections = [DPoint(0, 0), self.dr, DPoint(0, self.R)]
@@ -190,31 +271,35 @@ class CPWArc(ElementBase):
         self.end = self.dr
         self.center = DPoint(0, self.R)
 
-        from ._PROG_SETTINGS import PROGRAM
-        n_inner = PROGRAM.ARC_PTS_N
-        n_outer = PROGRAM.ARC_PTS_N
-
-        metal_arc = self._get_solid_arc(self.center, self.R, self.width,
-                                        self.alpha_start - pi / 2,
-                                        self.alpha_end - pi / 2, n_inner,
-                                        n_outer)
-        self.connection_edges = [n_inner + n_outer, n_inner]
-        empty_arc1 = self._get_solid_arc(self.center, self.R - (
-                    self.width + self.gap) / 2,
-                                         self.gap,
-                                         self.alpha_start - pi / 2,
-                                         self.alpha_end - pi / 2, n_inner,
-                                         n_outer)
-
-        empty_arc2 = self._get_solid_arc(self.center, self.R + (
-                    self.width + self.gap) / 2,
-                                         self.gap,
-                                         self.alpha_start - pi / 2,
-                                         self.alpha_end - pi / 2, n_inner,
-                                         n_outer)
-        self.metal_region.insert(SimplePolygon(metal_arc))
-        self.empty_region.insert(SimplePolygon(empty_arc1))
-        self.empty_region.insert(SimplePolygon(empty_arc2))
+        n_pts = arc_pts_n(self.R + self.b / 2, self.delta_alpha)
+
+        metal_arc, empty_arc1, empty_arc2 = self._get_cpw_arcs(
+            self.center, self.alpha_start - pi / 2,
+            self.alpha_end - pi / 2, n_pts
+        )
+        self.connection_edges = [2 * n_pts, n_pts]
+        self.metal_region.insert(metal_arc)
+        self.empty_region.insert(empty_arc1)
+        self.empty_region.insert(empty_arc2)
+
+    def init_skeleton(self):
+        self.connections = [DPoint(0, 0), self.dr, DPoint(0, self.R)]
+        self.angle_connections = [self.alpha_start, self.alpha_end]
+        self.start = DPoint(0, 0)
+        self.end = self.dr
+        self.center = DPoint(0, self.R)
+        # arcs are extended by 1e-3 rad at both ends
+        self._skeleton_arc = (
+            self.center,
+            self.alpha_start - pi / 2 - copysign(1e-3, self.delta_alpha),
+            self.alpha_end - pi / 2 + copysign(1e-3, self.delta_alpha),
+            self.R - self.b / 2, self.R + self.b / 2
+        )
+        self._skeleton_bbox = arc_bbox(*self._skeleton_arc)
+
+    def _geometry_cache_key(self):
+        return self.width, self.gap, self.R, self.alpha_start, \
+            self.alpha_end, arc_pts_n(self.R + self.b / 2, self.delta_alpha)
 
     def _refresh_named_connections(self):
         self.start = self.connections[0]
@@ -272,6 +357,17 @@ class CPW2CPW(ElementBase):
 
         self.make_trans(alpha_trans)
 
+    def init_skeleton(self):
+        self.connections = [DPoint(0, 0), DPoint(self.dr.abs(), 0)]
+        alpha = atan2(self.dr.y, self.dr.x)
+        self.angle_connections = [alpha, alpha]
+        hw = max(self.Z0.b, self.Z1.b) / 2 + 1
+        self._skeleton_polygon = DPolygon(
+            DBox(-1, -hw, self.dr.abs() + 1, hw)
+        )
+        self._skeleton_bbox = self._skeleton_polygon.bbox()
+        self.make_trans(DCplxTrans(1, alpha * 180 / pi, False, 0, 0))
+
     def _refresh_named_connections(self):
         self.start = self.connections[0]
         self.end = self.connections[1]
@@ -331,8 +427,10 @@ class CPW2CPWArc(ElementBase):
         self.gap = self.cpw2_params.gap
         self.b = self.width + 2 * self.gap
 
-        from classLib._PROG_SETTINGS import PROGRAM
-        self.n_arc_pts = PROGRAM.ARC_PTS_N
+        self.n_arc_pts = arc_pts_n(
+            self.r + max(self.cpw1_params.b, self.cpw2_params.b) / 2,
+            self.end_angle - self.start_angle, fixed_n=200
+        )
 
         super().__init__(
             origin=origin, trans_in=trans_in, inverse=inverse,
@@ -344,51 +442,59 @@ class CPW2CPWArc(ElementBase):
         # print()
 
     def init_regions(self):
-        metal_arc = self._get_cpw_arc(
-            center=self.center, r=self.r,
-            segment="center_metal"
-        )
-        empty_arc1 = self._get_cpw_arc(
-            center=self.center, r=self.r,
-            segment="outer_gap"
-        )
-        empty_arc2 = self._get_cpw_arc(
-            center=self.center, r=self.r,
-            segment="inner_gap"
+        metal_arc, empty_arc1, empty_arc2 = self._get_cpw_arcs(
+            center=self.center, r=self.r, n_arc_pts=self.n_arc_pts
         )
-        self.metal_region.insert(SimplePolygon(metal_arc))
-        self.empty_region.insert(SimplePolygon(empty_arc1))
-        self.empty_region.insert(SimplePolygon(empty_arc2))
+        self.metal_region.insert(metal_arc)
+        self.empty_region.insert(empty_arc1)
+        self.empty_region.insert(empty_arc2)
 
         self.connections = [self.start.dup(), self.center.dup(),
                             self.end.dup()]
         self.angle_connections = [self.start_angle + np.pi / 2,
                                   self.end_angle + np.pi / 2]
 
-    def _get_cpw_arc(self, center, r, n_arc_pts=200, method="linear",
-                     segment="center_metal"):
+    def init_skeleton(self):
+        self.connections = [self.start.dup(), self.center.dup(),
+                            self.end.dup()]
+        self.angle_connections = [self.start_angle + np.pi / 2,
+                                  self.end_angle + np.pi / 2]
+        # arcs are extended by 1e-3 rad at both ends
+        d_alpha = copysign(1e-3, self.end_angle - self.start_angle)
+        hw = max(self.cpw1_params.b, self.cpw2_params.b) / 2
+        self._skeleton_arc = (
+            self.center, self.start_angle - d_alpha,
+            self.end_angle + d_alpha, self.r - hw, self.r + hw
+        )
+        self._skeleton_bbox = arc_bbox(*self._skeleton_arc)
+
+    def _get_cpw_arcs(self, center, r, n_arc_pts=200, method="linear"):
         """
-        TODO: add description
+        Builds polygons of all CPW arc segments in a single vectorized
+        pass over the common angular grid.
 
         Parameters
         ----------
-        center : Union[DPoint, List[DPoint]]
+        center : DPoint
+            center of the arc
         r : float
+            arc central radius
         n_arc_pts : int
             number of points along width guide line (including both ends).
         method : str
             "linear" - width of polygons are scaled linearly from one
             end to another
-        segment : str
-            "inner_gap" - inner gap of CPW
-            "center_metal" - center metal polygon (defualt)
-            "outer_gap" - outer gap of CPW polygon
 
         Returns
         -------
-
+        List[SimplePolygon]
+            center metal, outer gap and inner gap polygons
         """
-        pts = []
+        if method != "linear":
+            raise ValueError(
+                "`method` argument has invalid value.\n"
+                "See docstring for details"
+            )
 
         if self.end_angle > self.start_angle:
             start_angle = self.start_angle - 1e-3
@@ -397,52 +503,26 @@ class CPW2CPWArc(ElementBase):
             start_angle = self.start_angle + 1e-3
             end_angle = self.end_angle - 1e-3
 
-        if method == "linear":
-            alphas = np.linspace(
-                start_angle, end_angle, n_arc_pts
-            )
-
-            self._gaps = np.linspace(
-                self.cpw1_params.gap, self.cpw2_params.gap, n_arc_pts
-            )
-            self._widths = np.linspace(
-                self.cpw1_params.width, self.cpw2_params.width, n_arc_pts
-            )
+        alphas = np.linspace(start_angle, end_angle, n_arc_pts)
+        gaps = np.linspace(
+            self.cpw1_params.gap, self.cpw2_params.gap, n_arc_pts
+        )
+        widths = np.linspace(
+            self.cpw1_params.width, self.cpw2_params.width, n_arc_pts
+        )
 
-            if segment == "center_metal":
-                dr_arr = self._widths / 2
-                r_arr = np.repeat(r, n_arc_pts)
-            elif segment == "inner_gap":
-                dr_arr = self._gaps / 2
-                r_arr = r - (self._widths + self._gaps) / 2
-            elif segment == "outer_gap":
-                dr_arr = self._gaps / 2
-                r_arr = r + (self._widths + self._gaps) / 2
-            else:
-                raise ValueError(
-                    "`segment` argument has invalid value.\n"
-                    "See docstring for details"
-                )
+        r_metal_in = r - widths / 2
+        r_metal_out = r + widths / 2
+        return arc_polygons(
+            center, alphas,
+            r_inner=[r_metal_in, r_metal_out, r_metal_in - gaps],
+            r_outer=[r_metal_out, r_metal_out + gaps, r_metal_in]
+        )
 
-            # inner points
-            for i in range(0, n_arc_pts):
-                alpha = alphas[i]
-                dr = dr_arr[i]
-                r = r_arr[i]
-                pts.append(
-                    center + DPoint(np.cos(alpha), np.sin(alpha)) *
-                    (r - dr)
-                )
-            # outer points
-            for i in range(0, n_arc_pts):
-                alpha = alphas[-i - 1]
-                dr = dr_arr[-i - 1]
-                r = r_arr[-i - 1]
-                pts.append(
-                    center + DPoint(np.cos(alpha), np.sin(alpha)) *
-                    (r + dr)
-                )
-        return DSimplePolygon(pts)
+    def _geometry_cache_key(self):
+        return self.cpw1_params.width, self.cpw1_params.gap, \
+            self.cpw2_params.width, self.cpw2_params.gap, \
+            self.r, self.start_angle, self.end_angle, self.n_arc_pts
 
     def _refresh_named_connections(self):
         self.start = self.connections[0]
@@ -484,6 +564,26 @@ class Coil_type_1(ComplexBase):
         self.primitives = {"cop1": self.cop1, "arc1": self.arc1,
                            "cop2": self.cop2, "arc2": self.arc2}
 
+    def init_skeleton(self):
+        hw = max(self.Z0.width / 2, self.Z0.b / 2)
+        R = -self.r
+        cop1_end = DPoint(self.L1, 0)
+        self._add_skeleton_straight("cop1", DPoint(0, 0), cop1_end, hw)
+        # arcs as they are constructed by `CPWArc`
+        arc1_center = cop1_end + DPoint(0, R)
+        arc1_end = arc1_center + DPoint(sin(-pi), -cos(-pi)) * R
+        self._add_skeleton_arc("arc1", arc1_center, -pi / 2, -3 * pi / 2,
+                               R, self.Z0.b / 2)
+        cop2_end = arc1_end - DPoint(self.L2, 0)
+        self._add_skeleton_straight("cop2", arc1_end, cop2_end, hw)
+        arc2_center = cop2_end + DPoint(0, R)
+        arc2_end = arc2_center + DPoint(sin(pi), -cos(pi)) * R
+        self._add_skeleton_arc("arc2", arc2_center, -pi / 2, pi / 2,
+                               R, self.Z0.b / 2)
+
+        self.connections = [DPoint(0, 0), arc2_end]
+        self.angle_connections = [0, pi]
+
 
 from collections import Counter
 
@@ -545,7 +645,7 @@ class CPWRLPath(ComplexBase):
             if len(cpw_parameters) != self._N_elements:
                 raise ValueError("CPW parameters dimension mismatch")
             else:
-                self._cpw_parameters = copy.deepcopy(cpw_parameters)
+                self._cpw_parameters = list(cpw_parameters)
         else:
             self._cpw_parameters: List[CPWParameters] = \
                 [cpw_parameters] * self._N_elements
@@ -554,7 +654,7 @@ class CPWRLPath(ComplexBase):
             if len(turn_radiuses) != self._N_turns:
                 raise ValueError("Turn raduises dimension mismatch")
             else:
-                self._turn_radiuses = copy.deepcopy(turn_radiuses)
+                self._turn_radiuses = list(turn_radiuses)
         else:
             self._turn_radiuses = [turn_radiuses] * self._N_turns
 
@@ -563,7 +663,7 @@ class CPWRLPath(ComplexBase):
             if len(segment_lengths) != self._N_straights:
                 raise ValueError("Straight segments dimension mismatch")
             else:
-                self._segment_lengths = copy.deepcopy(segment_lengths)
+                self._segment_lengths = list(segment_lengths)
         else:
             self._segment_lengths = [segment_lengths] * self._N_straights
 
@@ -643,36 +743,7 @@ class CPWRLPath(ComplexBase):
                 self.primitives["arc_" + str(idx_r)] = cpw_arc
                 idx_r += 1
             elif symbol == 'L':
-                # Turns are reducing segments' lengths so as if
-                # there were no roundings at all
-
-                # next 'R' segment if exists
-                if (i + 1 < self._N_elements
-                        and self._shape_string[i + 1] == 'R'
-                        and abs(self._turn_angles[idx_r]) < np.pi):
-                    coeff = abs(np.tan(self._turn_angles[idx_r] / 2))
-                    # print(self._segment_lengths)
-                    # print(coeff)
-                    # print(self._turn_radiuses)
-                    self._segment_lengths[idx_l] -= \
-                        self._turn_radiuses[idx_r] * coeff
-                # previous 'R' segment if exists
-                if (i - 1 > 0
-                        and self._shape_string[i - 1] == 'R'
-                        and abs(self._turn_angles[idx_r - 1]) < np.pi):
-                    coeff = abs(np.tan(self._turn_angles[idx_r - 1] / 2))
-                    self._segment_lengths[idx_l] -= \
-                        self._turn_radiuses[idx_r - 1] * coeff
-
-                if (self._segment_lengths[idx_l] < 0):
-                    raise Warning(
-                        f"{self.__class__.__name__} warning: segment №"
-                        f"{idx_l} length is less than zero\n:"
-                        f"length = {self._segment_lengths[idx_l]} \t"
-                        f"turn_r multiplier - {coeff}\n"
-                        f"previos turn radius{self._turn_radiuses[idx_r - 1]}"
-                    )
-
+                self._shorten_segment(i, idx_l, idx_r)
                 cpw = CPW(self._cpw_parameters[i].width,
                           self._cpw_parameters[i].gap,
                           prev_primitive_end, prev_primitive_end + DPoint(
@@ -694,6 +765,100 @@ class CPWRLPath(ComplexBase):
             list(self.primitives.values())[0].alpha_start,
             list(self.primitives.values())[-1].alpha_end]
 
+    def _shorten_segment(self, i, idx_l, idx_r):
+        # Turns are reducing segments' lengths so as if
+        # there were no roundings at all
+
+        # next 'R' segment if exists
+        if (i + 1 < self._N_elements
+                and self._shape_string[i + 1] == 'R'
+                and abs(self._turn_angles[idx_r]) < np.pi):
+            coeff = abs(np.tan(self._turn_angles[idx_r] / 2))
+            self._segment_lengths[idx_l] -= \
+                self._turn_radiuses[idx_r] * coeff
+        # previous 'R' segment if exists
+        if (i - 1 > 0
+                and self._shape_string[i - 1] == 'R'
+                and abs(self._turn_angles[idx_r - 1]) < np.pi):
+            coeff = abs(np.tan(self._turn_angles[idx_r - 1] / 2))
+            self._segment_lengths[idx_l] -= \
+                self._turn_radiuses[idx_r - 1] * coeff
+
+        if (self._segment_lengths[idx_l] < 0):
+            raise Warning(
+                f"{self.__class__.__name__} warning: segment №"
+                f"{idx_l} length is less than zero\n:"
+                f"length = {self._segment_lengths[idx_l]} \t"
+                f"turn_r multiplier - {coeff}\n"
+                f"previos turn radius{self._turn_radiuses[idx_r - 1]}"
+            )
+
+    def init_skeleton(self):
+        idx_r = 0
+        idx_l = 0
+        end = DPoint(0, 0)
+        end_angle = 0
+
+        for i, symbol in enumerate(self._shape_string):
+            if symbol == 'R':
+                turn_radius = self._turn_radiuses[idx_r]
+                turn_angle = self._turn_angles[idx_r]
+
+                if abs(turn_radius) < self._cpw_parameters[i].b / 2:
+                    raise Warning(
+                        f"for round segment with index {idx_r}:\n"
+                        "turn radius may be depicted incorrectly due to "
+                        "the fact that curvature radius is lesser that "
+                        "CPW half-width")
+
+                if turn_angle < 0:
+                    turn_radius *= -1
+
+                arc_center = end + DPoint(
+                    -turn_radius * np.sin(end_angle),
+                    turn_radius * np.cos(end_angle)
+                )
+                cpw1_params = cpw2_params = self._cpw_parameters[i]
+                if self._cpw_parameters[i].smoothing:
+                    # the same parameters as `self.init_primitives()`
+                    # passes to `CPW2CPWArc`
+                    if i > 0:
+                        cpw1_params = self._cpw_parameters[i - 1]
+                    else:
+                        raise ValueError(
+                            "No previous segment to smooth into"
+                        )
+
+                    if i < self._N_elements:
+                        cpw2_params = self._cpw_parameters[i + 1]
+                        self._cpw_parameters[i] = cpw2_params
+
+                alpha_start = end_angle - np.pi / 2
+                alpha_end = alpha_start + turn_angle
+                self._add_skeleton_arc(
+                    "arc_" + str(idx_r), arc_center, alpha_start, alpha_end,
+                    turn_radius, max(cpw1_params.b, cpw2_params.b) / 2
+                )
+                end = arc_center + turn_radius * DPoint(np.cos(alpha_end),
+                                                        np.sin(alpha_end))
+                end_angle += turn_angle
+                idx_r += 1
+            elif symbol == 'L':
+                self._shorten_segment(i, idx_l, idx_r)
+                cpw_params = self._cpw_parameters[i]
+                segment_end = end + self._segment_lengths[idx_l] * DPoint(
+                    np.cos(end_angle), np.sin(end_angle)
+                )
+                self._add_skeleton_straight(
+                    "cpw_" + str(idx_l), end, segment_end,
+                    max(cpw_params.width / 2, cpw_params.b / 2)
+                )
+                end = segment_end
+                idx_l += 1
+
+        self.connections = [DPoint(0, 0), end]
+        self.angle_connections = [0, end_angle]
+
     def _refresh_named_connections(self):
         self.start = self.connections[0]
         self.end = self.connections[1]
@@ -798,7 +963,7 @@ class DPathCPW(ComplexBase):
                     f"{l_length}"
                 )
             else:
-                self._cpw_parameters = copy.deepcopy(cpw_parameters)
+                self._cpw_parameters = list(cpw_parameters)
             if l_length == 1:
                 self._cpw_parameters = [cpw_parameters[
                                             0]] * self._N_elements
@@ -809,7 +974,7 @@ class DPathCPW(ComplexBase):
             if len(turn_radiuses) != self._N_turns:
                 raise ValueError("Turn raduises dimension mismatch")
             else:
-                self._turn_radiuses = copy.deepcopy(turn_radiuses)
+                self._turn_radiuses = list(turn_radiuses)
         else:
             self._turn_radiuses = [turn_radiuses] * self._N_turns
 
@@ -825,18 +990,128 @@ class DPathCPW(ComplexBase):
                     f"segment_lengths = {segment_lengths}"
                 )
             else:
-                self._segment_lengths = copy.deepcopy(segment_lengths)
+                self._segment_lengths = list(segment_lengths)
         else:
             self._segment_lengths: List[float] = [segment_lengths] * \
                                                  self._N_straights
 
+        # geometry of the single contour drawing mode
+        self._contour_metal: Region = None
+        self._contour_empty: Region = None
+        # transformation from the local reference frame of the line
+        self._contour_trans = DCplxTrans()
+        # the same transformation as a sequence of steps, regions of
+        # per-segment primitives are rounded after each of them
+        self._contour_steps: List[DCplxTrans] = []
+        self._shorten_segments_by_turns()
+
         super().__init__(self.points[0], trans_in, region_id=region_id)
         self.start = self.connections[0]
         self.end = self.connections[1]
         self.alpha_start = self.angle_connections[0]
         self.alpha_end = self.angle_connections[1]
 
+    @property
+    def primitives(self):
+        # caller may modify the primitives tree, hence line that is
+        # drawn as a single contour is switched to per-segment
+        # primitives on the first access from outside
+        if self._contour_metal is not None:
+            self._detach_contour()
+        return self._primitives
+
+    @primitives.setter
+    def primitives(self, value):
+        self._contour_metal = None
+        self._contour_empty = None
+        self._primitives = value
+        self._invalidate_regions()
+        self._stats = None
+
+    def _detach_contour(self):
+        """
+        Replaces single contour of the line by per-segment primitives
+        transformed to the current position of the line.
+        """
+        self._primitives = OrderedDict()
+        self._init_segment_primitives()
+        for primitive in self._primitives.values():
+            primitive._make_trans_steps(self._contour_steps)
+        self._contour_metal = None
+        self._contour_empty = None
+        self._invalidate_regions()
+        self._stats = None
+
+    def _single_contour_applicable(self):
+        cpw_params = self._cpw_parameters[0]
+        return all([
+            PROGRAM.DPATH_SINGLE_CONTOUR,
+            # skeleton of the line consists of its segments' skeletons
+            not SkeletonMode.active(),
+            self.extend_segments_l == 0,
+            not cpw_params.smoothing,
+            all(params == cpw_params for params in self._cpw_parameters),
+            all(abs(r) >= cpw_params.b / 2 for r in self._turn_radiuses)
+        ])
+
     def init_primitives(self):
+        if self._single_contour_applicable():
+            self._primitives = None
+            self._init_contour()
+        else:
+            self._init_segment_primitives()
+            primitives = list(self._primitives.values())
+            self.connections = [primitives[0].start, primitives[-1].end]
+            self.angle_connections = [primitives[0].alpha_start,
+                                      primitives[-1].alpha_end]
+
+        first_vec = self.points[1] - self.points[0]
+        firts_angle = np.arctan2(first_vec.y, first_vec.x)
+        self.make_trans(
+            DCplxTrans(1, firts_angle * 180 / np.pi, False, 0, 0)
+        )
+
+    def _shorten_segments_by_turns(self):
+        """
+        Rounded courners are reducing segments' lengths so as if there
+        were no roundings at all.
+        """
+        idx_r = 0
+        idx_l = 0
+        for i, symbol in enumerate(self._shape_string):
+            if symbol == 'R':
+                idx_r += 1
+            elif symbol == 'L':
+                # next 'R' segment if exists
+                if (i + 1 < self._N_elements
+                        and self._shape_string[i + 1] == 'R'
+                        and abs(self._turn_angles[idx_r]) < np.pi):
+                    coeff = abs(np.tan(self._turn_angles[idx_r] / 2))
+                    self._segment_lengths[idx_l] -= self._turn_radiuses[
+                                                        idx_r] * coeff
+                # previous 'R' segment if exists
+                if (i - 1 > 0  # line can't start with 'R'
+                        and self._shape_string[i - 1] == 'R'
+                        and abs(self._turn_angles[idx_r - 1]) < np.pi):
+                    coeff = abs(np.tan(self._turn_angles[idx_r - 1] / 2))
+                    self._segment_lengths[idx_l] -= self._turn_radiuses[
+                                                        idx_r - 1] * coeff
+
+                if (self._segment_lengths[idx_l] < 0):
+                    raise Warning(
+                        "CPWDPath warning: segment length "
+                        "is less than zero\n"
+                        f"idx_l = {idx_l}\tlength = "
+                        f"{self._segment_lengths[idx_l]}"
+                    )
+
+                idx_l += 1
+
+    def _init_segment_primitives(self):
+        """
+        Creates `CPW` and `CPW2CPWArc` primitive for every segment and
+        turn of the line in its local reference frame.
+        """
         idx_r = 0
         idx_l = 0
         origin = DPoint(0, 0)
@@ -897,35 +1172,10 @@ class DPathCPW(ComplexBase):
                         region_id=self.region_id
                     )
 
-                self.primitives["arc_" + str(idx_r)] = cpw_arc
+                self._primitives["arc_" + str(idx_r)] = cpw_arc
+                prev_primitive = cpw_arc
                 idx_r += 1
             elif symbol == 'L':
-                # Rounded courners
-                # are reducing segments' lengths so as if
-                # there were no roundings at all
-                # next 'R' segment if exists
-                if (i + 1 < self._N_elements
-                        and self._shape_string[i + 1] == 'R'
-                        and abs(self._turn_angles[idx_r]) < np.pi):
-                    coeff = abs(np.tan(self._turn_angles[idx_r] / 2))
-                    self._segment_lengths[idx_l] -= self._turn_radiuses[
-                                                        idx_r] * coeff
-                # previous 'R' segment if exists
-                if (i - 1 > 0  # line can't start with 'R'
-                        and self._shape_string[i - 1] == 'R'
-                        and abs(self._turn_angles[idx_r - 1]) < np.pi):
-                    coeff = abs(np.tan(self._turn_angles[idx_r - 1] / 2))
-                    self._segment_lengths[idx_l] -= self._turn_radiuses[
-                                                        idx_r - 1] * coeff
-
-                if (self._segment_lengths[idx_l] < 0):
-                    raise Warning(
-                        "CPWDPath warning: segment length "
-                        "is less than zero\n"
-                        f"idx_l = {idx_l}\tlength = "
-                        f"{self._segment_lengths[idx_l]}"
-                    )
-
                 if self._cpw_parameters[i].smoothing:
                     if i > 0:
                         cpw1_params = self._cpw_parameters[i - 1]
@@ -971,23 +1221,196 @@ class DPathCPW(ComplexBase):
                         region_id=self.region_id
                     )
 
-                self.primitives["cpw_" + str(idx_l)] = cpw
+                self._primitives["cpw_" + str(idx_l)] = cpw
+                prev_primitive = cpw
                 idx_l += 1
 
-            prev_primitive = list(self.primitives.values())[-1]
             prev_primitive_end = prev_primitive.end
             prev_primitive_end_angle = prev_primitive.alpha_end
 
-        first_vec = self.points[1] - self.points[0]
-        firts_angle = np.arctan2(first_vec.y, first_vec.x)
-        self.connections = [list(self.primitives.values())[0].start,
-                            list(self.primitives.values())[-1].end]
-        self.angle_connections = [
-            list(self.primitives.values())[0].alpha_start,
-            list(self.primitives.values())[-1].alpha_end]
-        self.make_trans(
-            DCplxTrans(1, firts_angle * 180 / np.pi, False, 0, 0)
+    def _center_line(self):
+        """
+        Calculates center line of the line in its local reference frame.
+        Turns are tessellated in the same way as `CPW2CPWArc` does.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, float]
+            center line points of shape (N, 2), unit normals pointing to
+            the left of the propagation direction at these points
+            and the propagation direction angle at the end of the line.
+        """
+        pts_list = [np.zeros((1, 2))]
+        normals_list = [np.array([[0.0, 1.0]])]
+        pos = np.zeros(2)
+        angle = 0
+        b = self._cpw_parameters[0].b
+        idx_r = 0
+        idx_l = 0
+        for symbol in self._shape_string:
+            if symbol == 'L':
+                length = self._segment_lengths[idx_l]
+                idx_l += 1
+                if length == 0:
+                    continue
+                direction = np.array([np.cos(angle), np.sin(angle)])
+                pos = pos + length * direction
+                pts_list.append(pos[None, :])
+                normals_list.append(
+                    np.array([[-direction[1], direction[0]]])
+                )
+            elif symbol == 'R':
+                turn_radius = abs(self._turn_radiuses[idx_r])
+                turn_angle = self._turn_angles[idx_r]
+                idx_r += 1
+                # +1 for counter-clockwise turn, -1 for clockwise
+                turn_sign = 1 if turn_angle > 0 else -1
+                left = np.array([-np.sin(angle), np.cos(angle)])
+                arc_center = pos + turn_sign * turn_radius * left
+                n_pts = arc_pts_n(turn_radius + b / 2, turn_angle,
+                                  fixed_n=200)
+                phis = angle - turn_sign * np.pi / 2 + \
+                    np.linspace(0, turn_angle, n_pts)[1:]
+                radial = np.column_stack((np.cos(phis), np.sin(phis)))
+                pts_list.append(arc_center + turn_radius * radial)
+                normals_list.append(-turn_sign * radial)
+                pos = pts_list[-1][-1]
+                angle += turn_angle
+        return np.concatenate(pts_list), np.concatenate(normals_list), angle
+
+    def _init_contour(self):
+        """
+        Draws metal and gaps of the whole line as polygons that are
+        built along the line's center line in the local reference frame.
+        """
+        pts_arr, normals_arr, end_angle = self._center_line()
+        cpw_params = self._cpw_parameters[0]
+        hw = cpw_params.width / 2
+        gap = cpw_params.gap
+
+        self._contour_metal = Region()
+        self._contour_empty = Region()
+        # long lines are split into several polygons that share
+        # center line points at their boundaries
+        step = PROGRAM.DPATH_CONTOUR_PTS_MAX - 1
+        for i in range(0, max(len(pts_arr) - 1, 1), step):
+            pts = pts_arr[i:i + step + 1]
+            normals = normals_arr[i:i + step + 1]
+            self._contour_metal.insert(
+                stripe_polygon(pts, normals, -hw, hw)
+            )
+            if gap > 0:
+                self._contour_empty.insert(
+                    stripe_polygon(pts, normals, hw, hw + gap)
+                )
+                self._contour_empty.insert(
+                    stripe_polygon(pts, normals, -hw - gap, -hw)
+                )
+        self._contour_trans = DCplxTrans()
+        self._contour_steps = []
+
+        self.connections = [DPoint(0, 0), DPoint(*pts_arr[-1])]
+        self.angle_connections = [0, end_angle]
+
+    def _apply_trans_steps(self, steps, dCplxTrans):
+        if self._contour_metal is None:
+            super()._apply_trans_steps(steps, dCplxTrans)
+            return
+
+        for step_dCplxTrans, iCplxTrans in steps:
+            self._contour_metal.transform(iCplxTrans)
+            self._contour_empty.transform(iCplxTrans)
+            self._transform_stats(step_dCplxTrans, iCplxTrans)
+        self._contour_trans = dCplxTrans * self._contour_trans
+        self._contour_steps.extend(
+            step_dCplxTrans for step_dCplxTrans, _ in steps
         )
+        self._invalidate_regions()
+        self._update_connections(dCplxTrans)
+        self._update_alpha(dCplxTrans)
+
+    def _build_regions(self):
+        if self._contour_metal is None:
+            super()._build_regions()
+            return
+
+        metal_region = self._contour_metal.dup()
+        metal_region.merged_semantics = True
+        empty_region = Region()
+        empty_region.merged_semantics = True
+        self._metal_regions = OrderedDict([(self.region_id, metal_region)])
+        self._empty_regions = OrderedDict([(self.region_id, empty_region)])
+
+    def _placement_contribution(self, region_id="default"):
+        if self._contour_metal is None:
+            return super()._placement_contribution(region_id)
+
+        if region_id != self.region_id:
+            return Region(), Region()
+        return self._contour_metal.dup(), self._contour_empty.dup()
+
+    def place(self, dest, layer_i=-1, region_id="default"):
+        if self._contour_metal is None:
+            super().place(dest, layer_i=layer_i, region_id=region_id)
+            return
+
+        if region_id != self.region_id:
+            return
+        batch = PlacementBatch.find(dest, layer_i)
+        if batch is not None:
+            batch.add(dest, layer_i,
+                      *self._placement_contribution(region_id))
+            return
+
+        if layer_i != -1:
+            # `dest` is interpreted as `pya.Cell` object
+            r_cell = cell_layer_region(dest, layer_i)
+            r_cell -= self._contour_empty
+            r_cell += self._contour_metal
+            write_cell_layer(dest, layer_i, r_cell)
+        else:
+            # `dest` is interpreted as `pya.Region` object
+            dest -= self._contour_empty
+            dest += self._contour_metal
+
+    def _regions_key(self):
+        if self._contour_metal is None:
+            return super()._regions_key()
+        return tuple(
+            (id(reg), reg.count(), reg.data_id())
+            for reg in (self._contour_metal, self._contour_empty)
+        )
+
+    def _geometry_stats(self):
+        if self._contour_metal is None:
+            return super()._geometry_stats()
+        # statistics of the placed contour, segment primitives
+        # are not built
+        if self._stats is None:
+            self._stats = _regions_stats((self._contour_metal,
+                                          self._contour_empty))
+        return self._stats
+
+    def bbox(self):
+        if self._contour_metal is not None:
+            return DBox(self._contour_metal.bbox() +
+                        self._contour_empty.bbox())
+        return super().bbox()
+
+    def length(self, exception=None):
+        if self._contour_metal is None:
+            return super().length(exception=exception)
+        # lengths of the primitives that are not built.
+        # Names are the same as in `self._init_segment_primitives()`
+        length = 0
+        for i, segment_length in enumerate(self._segment_lengths):
+            if (exception is None) or (exception not in f"cpw_{i}"):
+                length += segment_length
+        for i, (R, alpha) in enumerate(zip(self._turn_radiuses,
+                                           self._turn_angles)):
+            if (exception is None) or (exception not in f"arc_{i}"):
+                length += abs(R * alpha)
+        return length
 
     def _refresh_named_connections(self):
         self.start = self.connections[0]
@@ -1003,6 +1426,191 @@ class DPathCPW(ComplexBase):
                     zip(self._turn_radiuses, self._turn_angles)])
 
 
+class ArcLengthParametrization:
+    """
+        Arc-length parametrization of the center line of a path-like
+    element. Element is decomposed into straight and circular pieces
+    once, then positions and tangent angles for any array of arc-length
+    coordinates are evaluated in one vectorized pass.
+
+    Examples
+    --------
+    ```python
+    param = ArcLengthParametrization(md_line)
+    pts_arr, alphas = param.evaluate(np.linspace(0, param.length, 11))
+    ```
+    """
+
+    def __init__(self, element):
+        """
+        Parameters
+        ----------
+        element : Union[CPW, CPW2CPW, CPWArc, CPW2CPWArc, BridgedCPW,
+                        BridgedCPWArc, CPWRLPath, DPathCPW, Coil_type_1]
+            element to be parametrized. Complex elements are traversed
+            in order of their primitives.
+
+        Raises
+        ------
+        ValueError
+            if element or one of its primitives is not path-like
+        """
+        # every piece is
+        # (length, x0, y0, alpha, center_x, center_y, radius, phi0, sign)
+        # where straight pieces have zero radius
+        pieces = []
+        self._add_pieces(element, pieces)
+        pieces = np.array(pieces, dtype=float).reshape(-1, 9)
+        self._lengths = pieces[:, 0]
+        self._s_ends = np.cumsum(self._lengths)
+        self._s_starts = self._s_ends - self._lengths
+        self._pieces = pieces
+        self.length = float(self._s_ends[-1]) if len(pieces) > 0 else 0.0
+
+    @staticmethod
+    def _add_straight(start, end, pieces):
+        dr = end - start
+        length = dr.abs()
+        if length > 0:
+            pieces.append((length, start.x, start.y, atan2(dr.y, dr.x),
+                           0, 0, 0, 0, 0))
+
+    @staticmethod
+    def _add_arc(start, center, alpha, length, pieces):
+        # `alpha` is the direction of propagation at `start`
+        radial = start - center
+        # +1 for counter-clockwise arc, -1 for clockwise
+        sign = 1 if radial.x * sin(alpha) - radial.y * cos(alpha) > 0 \
+            else -1
+        pieces.append((length, start.x, start.y, alpha, center.x,
+                       center.y, radial.abs(), atan2(radial.y, radial.x),
+                       sign))
+
+    @staticmethod
+    def _add_contour_pieces(line, pieces):
+        # line drawn as a single contour is parametrized by its center
+        # line in the local frame (see `DPathCPW._center_line()`)
+        # without building its primitives
+        local_pieces = []
+        pos = np.zeros(2)
+        angle = 0
+        idx_r = 0
+        idx_l = 0
+        for symbol in line._shape_string:
+            if symbol == 'L':
+                length = line._segment_lengths[idx_l]
+                idx_l += 1
+                if length == 0:
+                    continue
+                local_pieces.append((length, pos[0], pos[1], angle,
+                                     0, 0, 0, 0, 0))
+                pos = pos + length * np.array([np.cos(angle),
+                                               np.sin(angle)])
+            elif symbol == 'R':
+                turn_radius = abs(line._turn_radiuses[idx_r])
+                turn_angle = line._turn_angles[idx_r]
+                idx_r += 1
+                turn_sign = 1 if turn_angle > 0 else -1
+                left = np.array([-np.sin(angle), np.cos(angle)])
+                arc_center = pos + turn_sign * turn_radius * left
+                phi0 = angle - turn_sign * pi / 2
+                local_pieces.append((turn_radius * abs(turn_angle),
+                                     pos[0], pos[1], angle, arc_center[0],
+                                     arc_center[1], turn_radius, phi0,
+                                     turn_sign))
+                pos = arc_center + turn_radius * np.array(
+                    [np.cos(phi0 + turn_angle), np.sin(phi0 + turn_angle)]
+                )
+                angle += turn_angle
+
+        # pieces are moved to the current position of the line
+        trans = line._contour_trans
+        mirror = -1 if trans.is_mirror() else 1
+        rot = trans.angle * pi / 180
+        mag = trans.mag
+        for length, x0, y0, alpha, cx, cy, radius, phi0, sign in \
+                local_pieces:
+            start = trans * DPoint(x0, y0)
+            center = trans * DPoint(cx, cy)
+            pieces.append((length * mag, start.x, start.y,
+                           mirror * alpha + rot, center.x, center.y,
+                           radius * mag, mirror * phi0 + rot,
+                           mirror * sign))
+
+    @staticmethod
+    def _add_pieces(element, pieces):
+        add_pieces = ArcLengthParametrization._add_pieces
+        if isinstance(element, (CPW, CPW2CPW, BridgedCPW)):
+            # named connections of bridged lines are not updated by
+            # transformations
+            ArcLengthParametrization._add_straight(
+                element.connections[0], element.connections[1], pieces
+            )
+        elif isinstance(element, (CPWArc, CPW2CPWArc, BridgedCPWArc)):
+            # `alpha_start` is the image of the local direction that
+            # coincides with the direction of propagation only for
+            # positive radius and sweep angle
+            if isinstance(element, CPW2CPWArc):
+                start, center = element.connections[0:2]
+                direct = element.r * (element.end_angle -
+                                      element.start_angle) > 0
+                length = element.length()
+            else:
+                start, center = element.connections[0], \
+                    element.connections[2]
+                direct = element.R * element.delta_alpha > 0
+                length = abs(element.R * element.delta_alpha)
+            alpha = element.angle_connections[0] + (0 if direct else pi)
+            ArcLengthParametrization._add_arc(start, center, alpha,
+                                              length, pieces)
+        elif isinstance(element, DPathCPW) and \
+                element._contour_metal is not None:
+            ArcLengthParametrization._add_contour_pieces(element, pieces)
+        elif isinstance(element, (CPWRLPath, DPathCPW, Coil_type_1)):
+            for primitive in element.primitives.values():
+                add_pieces(primitive, pieces)
+        else:
+            raise ValueError(
+                f"{element.__class__.__name__} is not a path-like element"
+            )
+
+    def evaluate(self, s):
+        """
+        Returns center line points and tangent angles at arc-length
+        coordinates `s`.
+
+        Parameters
+        ----------
+        s : array_like
+            arc-length coordinates from the start of the element in nm.
+            Values are clipped into `[0, self.length]`.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            points of shape (N, 2) and tangent angles in radians of
+            shape (N,)
+        """
+        s = np.clip(np.atleast_1d(np.asarray(s, dtype=float)), 0,
+                    self.length)
+        idxs = np.minimum(np.searchsorted(self._s_ends, s, side="right"),
+                          len(self._pieces) - 1)
+        ds = s - self._s_starts[idxs]
+        _, x0, y0, alpha, cx, cy, radius, phi0, sign = self._pieces[idxs].T
+
+        is_arc = radius > 0
+        phi = phi0 + sign * ds / np.where(is_arc, radius, 1)
+        pts_arr = np.where(
+            is_arc[:, None],
+            np.column_stack((cx + radius * np.cos(phi),
+                             cy + radius * np.sin(phi))),
+            np.column_stack((x0 + ds * np.cos(alpha),
+                             y0 + ds * np.sin(alpha)))
+        )
+        alphas = np.where(is_arc, phi + sign * pi / 2, alpha)
+        return pts_arr, alphas
+
+
 class Bridge1(ElementBase):
     """
         Class implements bridges that are used to suppress
@@ -1097,6 +1705,10 @@ class Bridge1(ElementBase):
         self.empty_regions["bridges_2"].insert(
             SimplePolygon.from_dpoly(empty_polygon))
 
+    def _geometry_cache_key(self):
+        return self.gnd_touch_dx, self.gnd_touch_dy, self.gnd2gnd_dy, \
+            self.surround_gap, self.transition_len
+
     def _refresh_named_connections(self):
         self.center = self.connections[0]
 
@@ -1115,6 +1727,7 @@ class Bridge1(ElementBase):
         coplanar's wave
         propagation direction.
             Bridges are distributed over coplanar starting with its center.
+            Use `Bridge1Batch` directly to bridge many coplanars at once.
 
         Parameters
         ----------
@@ -1137,137 +1750,332 @@ class Bridge1(ElementBase):
         -------
         None
         """
-        bridge_tmp = Bridge1(DPoint(0, 0), gnd2gnd_dy=gnd2gnd_dy)
-        bridge_tmp.__bridgify_CPW(
-            cpw, bridges_step, gnd2gnd_dy=gnd2gnd_dy,
-            dest=dest, bridge_layer1=bridge_layer1,
-            bridge_layer2=bridge_layer2, dest2=dest2,
-            avoid_points=avoid_points, avoid_distances=avoid_distances
-        )
+        bridges = Bridge1Batch(bridges_step, gnd2gnd_dy=gnd2gnd_dy)
+        bridges.add_cpw(cpw, avoid_points=avoid_points,
+                        avoid_distances=avoid_distances)
+        bridges.place(dest=dest, layer_i=bridge_layer1,
+                      region_id="bridges_1")
+        if dest2 is not None:
+            bridges.place(dest=dest2, layer_i=bridge_layer2,
+                          region_id="bridges_2")
+        else:
+            bridges.place(dest=dest, layer_i=bridge_layer2,
+                          region_id="bridges_2")
 
-    def __bridgify_CPW(self, cpw, bridges_step, dest=None, gnd2gnd_dy=70e3,
-                       bridge_layer1=-1, bridge_layer2=-1, dest2=None,
-                       avoid_points=[], avoid_distances=[]):
-        """
-            Function puts bridge patterns to fabricate bridges on coplanar waveguide
-        `cpw` with bridges having period of `bridges_step` along coplanar's wave
-        propagation direction.
-            Bridges are distributed over coplanar starting with its center.
 
+def points_near(pts_arr, avoid_pts_arr, avoid_distances):
+    """
+    Tests which points lie closer than the corresponding avoid distance
+    to any of the avoid points.
+    Avoid points are hashed into square grid with cell size equal to the
+    largest avoid distance, so every point is compared only with avoid
+    points from 3x3 neighbouring cells.
+
+    Parameters
+    ----------
+    pts_arr : np.ndarray
+        points of shape (N, 2)
+    avoid_pts_arr : np.ndarray
+        avoid points of shape (M, 2)
+    avoid_distances : np.ndarray
+        avoid distances of shape (M,)
+
+    Returns
+    -------
+    np.ndarray
+        boolean mask of shape (N,)
+    """
+    near = np.zeros(len(pts_arr), dtype=bool)
+    if len(pts_arr) == 0 or len(avoid_pts_arr) == 0:
+        return near
+    cell_size = avoid_distances.max()
+    if cell_size <= 0:
+        return near
+
+    avoid_cells = np.floor(avoid_pts_arr / cell_size).astype(np.int64)
+    pts_cells = np.floor(pts_arr / cell_size).astype(np.int64)
+    origin = np.minimum(avoid_cells.min(axis=0), pts_cells.min(axis=0)) - 1
+    avoid_cells -= origin
+    pts_cells -= origin
+    ny = max(avoid_cells[:, 1].max(), pts_cells[:, 1].max()) + 2
+    avoid_keys = avoid_cells[:, 0] * ny + avoid_cells[:, 1]
+    order = np.argsort(avoid_keys, kind="stable")
+    avoid_keys = avoid_keys[order]
+    avoid_pts_arr = avoid_pts_arr[order]
+    avoid_distances = avoid_distances[order]
+
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            keys = (pts_cells[:, 0] + dx) * ny + pts_cells[:, 1] + dy
+            lo = np.searchsorted(avoid_keys, keys, side="left")
+            hi = np.searchsorted(avoid_keys, keys, side="right")
+            # cells may contain several avoid points
+            for j in range(int((hi - lo).max())):
+                idxs = lo + j
+                valid = np.flatnonzero(idxs < hi)
+                idxs = idxs[valid]
+                dist = np.hypot(*(avoid_pts_arr[idxs] - pts_arr[valid]).T)
+                near[valid[dist < avoid_distances[idxs]]] = True
+    return near
+
+
+class Bridge1Batch:
+    """
+        Collects `Bridge1` sites of many coplanars and places all the
+    bridges at once.
+        Bridge centers and orientations are calculated for all straight
+    segments of a coplanar with numpy. Polygons of all bridges are
+    stamped from the single `Bridge1` template and are placed into
+    destination by a single boolean operation.
+
+    Examples
+    --------
+    ```python
+    bridges = Bridge1Batch(bridges_step=130e3)
+    for resonator in resonators:
+        bridges.add_cpw(resonator)
+    bridges.add_cpw(ro_line, avoid_points=pts, avoid_distances=200e3)
+    bridges.place(region_bridges1, region_id="bridges_1")
+    bridges.place(region_bridges2, region_id="bridges_2")
+    ```
+    """
+
+    def __init__(self, bridges_step, gnd_touch_dx=20e3, gnd2gnd_dy=70e3):
+        """
         Parameters
         ----------
-        cpw : Union[CPW, CPWArc, DPathCPW]
-            instance of coplanar class to be bridged during fabrication
         bridges_step : float
             distance between centers of bridges in nm
-        dest : pya.Cell
-            cell to place bridge polygons at
-        bridge_layer1 : int
-            index of the layer in the `cell` with ground touching polygons
-        bridge_layer2 : int
-            index of the layer in the `cell` with empty polygons
+        gnd_touch_dx : float
+            see `Bridge1`
+        gnd2gnd_dy : float
+            see `Bridge1`
+        """
+        self.bridges_step = bridges_step
+        template = Bridge1(DPoint(0, 0), gnd_touch_dx=gnd_touch_dx,
+                           gnd2gnd_dy=gnd2gnd_dy)
+        # polygons of the bridge at the origin for every region id
+        self._templates = OrderedDict()
+        for reg_id in ["bridges_1", "bridges_2"]:
+            self._templates[reg_id] = (
+                [self._polygon_to_array(poly)
+                 for poly in template.metal_regions[reg_id].each()],
+                [self._polygon_to_array(poly)
+                 for poly in template.empty_regions[reg_id].each()]
+            )
+        # bridge width along the coplanar with default `gnd_touch_dx`
+        self._bridge_dx = Bridge1.gnd_touch_dx + 2 * Bridge1.surround_gap
+        # centers and orientations of the added bridges
+        self._centers: List[np.ndarray] = []
+        self._alphas: List[np.ndarray] = []
+
+    @staticmethod
+    def _polygon_to_array(poly):
+        return np.array([(pt.x, pt.y) for pt in poly.each_point_hull()],
+                        dtype=float)
+
+    def __len__(self):
+        return sum(len(alphas) for alphas in self._alphas)
+
+    def add_bridge(self, center, alpha=0):
+        """
+        Adds single bridge.
+
+        Parameters
+        ----------
+        center : DPoint
+            center of the bridge
+        alpha : float
+            direction of the bridged coplanar in radians
+        """
+        self._centers.append(np.array([[center.x, center.y]]))
+        self._alphas.append(np.array([alpha]))
+
+    def add_cpw(self, cpw, avoid_points=[], avoid_distances=[]):
+        """
+            Adds bridges of the coplanar `cpw` with the same rules as
+        `Bridge1.bridgify_CPW` does.
+
+        Parameters
+        ----------
+        cpw : Union[CPW, CPWArc, CPWRLPath, Coil_type_1, DPathCPW]
+            coplanar to be bridged. Straight segments of complex lines
+            are bridged.
         avoid_points : list[Union[DPoint,Point,Vector, DVector]]
             list points that you wish to keep bridges away
         avoid_distances : Union[list[float], float]
             distance in nm where there will be no bridges
             near the `avoid_points`. Each avoid distance correspond to
             avoid point.
-        Returns
-        -------
-        None
         """
-        # if avoid distance passed as float - it is interpreted as the
-        # same for all points
-        if not hasattr(avoid_distances, "__len__"):
-            avoid_distances = [avoid_distances] * len(avoid_points)
-
-        if isinstance(cpw, CPW):
-            # recursion base
-            alpha = atan2(cpw.dr.y, cpw.dr.x)
-            cpw_len = cpw.dr.abs()
-            if cpw_len < (self.bridge_width + self.surround_gap):
-                return
-
-            cpw_dir_unit_vector = cpw.dr / cpw.dr.abs()
-
-            # bridge with some initial dimensions
-            tmp_bridge = Bridge1(DPoint(0, 0), gnd2gnd_dy=gnd2gnd_dy)
-            bridge_width = tmp_bridge.gnd_touch_dx + 2 * tmp_bridge.surround_gap
-
-            # number of additional bridges on either side of center
-            additional_bridges_n = int(
-                (cpw_len / 2 - bridge_width / 2) // bridges_step)
-            bridge_centers = []
-            for i in range(-additional_bridges_n,
-                           additional_bridges_n + 1):
-                bridge_center = cpw.start + (
-                            cpw_len / 2 + i * bridges_step) * cpw_dir_unit_vector
-
-                avoid = False
-                for avoid_point, avoid_distance in zip(avoid_points,
-                                                       avoid_distances):
-                    if (
-                            avoid_point - bridge_center).abs() < avoid_distance:
-                        avoid = True
-                        break
-
-                if not avoid:
-                    bridge_centers.append(bridge_center)
-
-            bridges = []
-            for center in bridge_centers:
-                bridges.append(
-                    Bridge1(
-                        center, gnd2gnd_dy=gnd2gnd_dy,
-                        trans_in=DCplxTrans(1, alpha / pi * 180, False, 0,
-                                            0)
-                    )
-                )
-            for bridge in bridges:
-                bridge.place(dest=dest, layer_i=bridge_layer1,
-                             region_id="bridges_1")
-                if dest2 is not None:
-                    bridge.place(dest=dest2, layer_i=bridge_layer2,
-                                 region_id="bridges_2")
-                else:
-                    bridge.place(dest=dest, layer_i=bridge_layer2,
-                                 region_id="bridges_2")
-        elif isinstance(cpw, CPWArc):
+        if isinstance(cpw, CPWArc):
             # only 1 bridge is placed, in the middle of an arc
-
             alpha_mid = cpw.alpha_start + cpw.delta_alpha / 2 - np.pi / 2
-
             # unit vector from a center of the arc to its mid point
             v_arc_mid = DVector(np.cos(alpha_mid), np.sin(alpha_mid))
             arc_mid = cpw.center + cpw.R * v_arc_mid
             # tangent vector to the center of a bridge
             v_arc_mid_tangent = DCplxTrans(1, 90, False, 0, 0) * v_arc_mid
-            alpha = np.arctan2(v_arc_mid_tangent.y, v_arc_mid_tangent.x)
-            bridge = Bridge1(
-                center=arc_mid, gnd2gnd_dy=gnd2gnd_dy,
-                trans_in=DCplxTrans(1, alpha / pi * 180, False, 0, 0)
+            self.add_bridge(
+                arc_mid,
+                np.arctan2(v_arc_mid_tangent.y, v_arc_mid_tangent.x)
             )
-            bridge.place(dest=dest, layer_i=bridge_layer1,
-                         region_id="bridges_1")
-            if dest2 is not None:
-                bridge.place(dest=dest2, layer_i=bridge_layer2,
-                             region_id="bridges_2")
-            else:
-                bridge.place(dest=dest, layer_i=bridge_layer2,
-                             region_id="bridges_2")
-        elif isinstance(cpw, CPWRLPath) or isinstance(cpw, Coil_type_1) \
-                or isinstance(cpw, DPathCPW):
-            for name, primitive in cpw.primitives.items():
-                if isinstance(primitive, CPW):
-                    Bridge1.bridgify_CPW(
-                        cpw=primitive, bridges_step=bridges_step,
-                        dest=dest, bridge_layer1=bridge_layer1,
-                        gnd2gnd_dy=gnd2gnd_dy,
-                        bridge_layer2=bridge_layer2,
-                        dest2=dest2,
-                        avoid_points=avoid_points,
-                        avoid_distances=avoid_distances
-                    )
+            return
+
+        if isinstance(cpw, CPW):
+            cpws = [cpw]
+        elif isinstance(cpw, (CPWRLPath, Coil_type_1, DPathCPW)):
+            cpws = [primitive for primitive in cpw.primitives.values()
+                    if isinstance(primitive, CPW)]
         else:
             # do nothing for other shapes
             return
+        if len(cpws) == 0:
+            return
+
+        starts = np.array([(p.start.x, p.start.y) for p in cpws])
+        drs = np.array([(p.dr.x, p.dr.y) for p in cpws])
+        lengths = np.hypot(drs[:, 0], drs[:, 1])
+        mask = lengths >= (Bridge1.bridge_width + Bridge1.surround_gap)
+        starts, drs, lengths = starts[mask], drs[mask], lengths[mask]
+        alphas = np.arctan2(drs[:, 1], drs[:, 0])
+        units = drs / lengths[:, None]
+
+        # number of additional bridges on either side of center
+        additional_n = ((lengths / 2 - self._bridge_dx / 2) //
+                        self.bridges_step).astype(int)
+        # segments shorter than the bridge have no bridges
+        counts = np.maximum(2 * additional_n + 1, 0)
+        seg_idxs = np.repeat(np.arange(len(counts)), counts)
+        # bridge index relative to the segment's center
+        offsets = np.arange(counts.sum()) - \
+            np.repeat(np.cumsum(counts) - counts, counts) - \
+            additional_n[seg_idxs]
+        centers = starts[seg_idxs] + \
+            (lengths[seg_idxs] / 2 + offsets * self.bridges_step)[:, None] * \
+            units[seg_idxs]
+
+        if len(avoid_points) > 0:
+            if not hasattr(avoid_distances, "__len__"):
+                avoid_distances = [avoid_distances] * len(avoid_points)
+            avoid_pts_arr = np.array([(pt.x, pt.y) for pt in avoid_points],
+                                     dtype=float)
+            keep = ~points_near(
+                centers, avoid_pts_arr,
+                np.asarray(avoid_distances, dtype=float)
+            )
+            centers, seg_idxs = centers[keep], seg_idxs[keep]
+
+        self._centers.append(centers)
+        self._alphas.append(alphas[seg_idxs])
+
+    def add_path(self, path, avoid_points=[], avoid_distances=[]):
+        """
+            Adds bridges along the whole center line of `path` with
+        uniform pitch `self.bridges_step`. Unlike `add_cpw`, turns of the
+        path are bridged as well. Bridges are distributed symmetrically
+        with respect to the middle of the path.
+
+        Parameters
+        ----------
+        path : Union[CPW, CPWArc, CPW2CPWArc, CPWRLPath, DPathCPW,
+                     Coil_type_1]
+            path to be bridged. See `ArcLengthParametrization`.
+        avoid_points : list[Union[DPoint,Point,Vector, DVector]]
+            list points that you wish to keep bridges away
+        avoid_distances : Union[list[float], float]
+            distance in nm where there will be no bridges
+            near the `avoid_points`. Each avoid distance correspond to
+            avoid point.
+        """
+        param = ArcLengthParametrization(path)
+        if param.length < (Bridge1.bridge_width + Bridge1.surround_gap):
+            return
+        # number of additional bridges on either side of the middle
+        additional_n = int((param.length / 2 - self._bridge_dx / 2) //
+                           self.bridges_step)
+        if additional_n < 0:
+            return
+        s = param.length / 2 + self.bridges_step * \
+            np.arange(-additional_n, additional_n + 1)
+        centers, alphas = param.evaluate(s)
+        if len(avoid_points) > 0:
+            if not hasattr(avoid_distances, "__len__"):
+                avoid_distances = [avoid_distances] * len(avoid_points)
+            avoid_pts_arr = np.array([(pt.x, pt.y) for pt in avoid_points],
+                                     dtype=float)
+            keep = ~points_near(
+                centers, avoid_pts_arr,
+                np.asarray(avoid_distances, dtype=float)
+            )
+            centers, alphas = centers[keep], alphas[keep]
+
+        self._centers.append(centers)
+        self._alphas.append(alphas)
+
+    def regions(self, region_id):
+        """
+        Returns metal and empty regions of all collected bridges.
+
+        Parameters
+        ----------
+        region_id : str
+            "bridges_1" or "bridges_2", see `Bridge1`
+
+        Returns
+        -------
+        Tuple[Region, Region]
+            metal and empty regions
+        """
+        metal = Region()
+        empty = Region()
+        if len(self) == 0:
+            return metal, empty
+        centers = np.concatenate(self._centers)
+        alphas = np.concatenate(self._alphas)
+        cos_a = np.cos(alphas)[:, None]
+        sin_a = np.sin(alphas)[:, None]
+
+        templates_metal, templates_empty = self._templates[region_id]
+        for dest, templates in ((metal, templates_metal),
+                                (empty, templates_empty)):
+            for tpl in templates:
+                # shape (bridges_n, points_n, 2)
+                pts = np.stack(
+                    (cos_a * tpl[:, 0] - sin_a * tpl[:, 1],
+                     sin_a * tpl[:, 0] + cos_a * tpl[:, 1]),
+                    axis=-1
+                ) + centers[:, None, :]
+                dest.insert([array_to_simple_polygon(poly) for poly in pts])
+        return metal, empty
+
+    def place(self, dest, layer_i=-1, region_id="bridges_1"):
+        """
+        Places all collected bridges into `dest` as `Bridge1.place()`
+        does.
+
+        Parameters
+        ----------
+        dest : Union[Region, Cell]
+            destination
+        layer_i : int
+            layer index if `dest` is a `Cell`
+        region_id : str
+            "bridges_1" or "bridges_2", see `Bridge1`
+        """
+        metal, empty = self.regions(region_id)
+        batch = PlacementBatch.find(dest, layer_i)
+        if batch is not None:
+            batch.add(dest, layer_i, metal - empty, empty)
+            return
+
+        if layer_i != -1:
+            # `dest` is interpreted as `pya.Cell` object
+            r_cell = cell_layer_region(dest, layer_i)
+            r_cell += metal
+            r_cell -= empty
+            write_cell_layer(dest, layer_i, r_cell)
+        else:
+            # `dest` is interpreted as `pya.Region` object
+            full_layer_boolean(dest, metal, "+")
+            full_layer_boolean(dest, empty, "-")
@@ -9,6 +9,39 @@ reload(pinning_grid)
 from classLib.helpers import region_manipulation
 reload(region_manipulation)
 
+from classLib.helpers import path_routing
+reload(path_routing)
+
+from classLib.helpers import meander_solver
+reload(meander_solver)
+
+from classLib.helpers import element_index
+reload(element_index)
+
+from classLib.helpers import tiled_pipeline
+reload(tiled_pipeline)
+
 fill_holes = pinning_grid.fill_holes
+PinningGrid = pinning_grid.PinningGrid
+pinning_holes = pinning_grid.pinning_holes
+holes_to_cell_arrays = pinning_grid.holes_to_cell_arrays
 split_polygons = polygon_splitting.split_polygons
-extended_region = region_manipulation.extended_region
\ No newline at end of file
+split_region = polygon_splitting.split_region
+split_layers = polygon_splitting.split_layers
+extended_region = region_manipulation.extended_region
+sized_region = region_manipulation.sized_region
+resolved_region = region_manipulation.resolved_region
+regions_to_bytes = region_manipulation.regions_to_bytes
+regions_from_bytes = region_manipulation.regions_from_bytes
+GridRouter = path_routing.GridRouter
+obstacles_from_region = path_routing.obstacles_from_region
+frequency_to_length = meander_solver.frequency_to_length
+length_to_frequency = meander_solver.length_to_frequency
+rl_path_length = meander_solver.rl_path_length
+worm3_length = meander_solver.worm3_length
+worm_rl_tail_length = meander_solver.worm_rl_tail_length
+solve_worm3 = meander_solver.solve_worm3
+solve_worm_rl_tail = meander_solver.solve_worm_rl_tail
+solve_cpw_resonator2_periods = meander_solver.solve_cpw_resonator2_periods
+ElementIndex = element_index.ElementIndex
+TiledPipeline = tiled_pipeline.TiledPipeline
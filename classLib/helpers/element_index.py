@@ -0,0 +1,349 @@
+"""
+    Spatial index over placed elements.
+    Elements are stored by name together with their bounding boxes and
+    connection points. Boxes are kept as numpy arrays sorted by their
+    left edge, hence box queries and candidate pairs search
+    (sweep-and-prune) are done with `np.searchsorted` and vectorized
+    comparisons instead of python loops over every element.
+    Geometry of elements is used only to confirm candidate pairs in
+    `ElementIndex.clearance_violations`.
+
+    Typical usage in the draw loop of the design:
+    ```python
+    index = self.index_elements()
+    for name_a, name_b, reg in index.clearance_violations(20e3):
+        print(f"{name_a} and {name_b} are too close")
+        self.region_el += reg
+    ```
+"""
+from typing import Dict, List, Tuple, Iterable
+
+import numpy as np
+from pya import DBox, Region
+
+# connection points closer than this distance (nm) are coincident
+_CONNECTION_TOL = 1
+
+
+class ElementIndex:
+    """
+        Boxes, connections and geometry of the elements are cached on
+    the first query. Index does not track elements transformed after
+    insertion (e.g. by `make_trans()` or by moving to the final
+    position), so `refresh()` has to be called for them.
+    `ChipDesign.index_elements()` rebuilds the index on every call.
+    """
+
+    def __init__(self):
+        # name -> element
+        self.elements: Dict[str, object] = {}
+        # `(name, region_id)` -> merged geometry of the element
+        self._footprints: Dict[Tuple[str, str], Region] = {}
+        self._dirty = True
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        # (N, 4) array of `left, bottom, right, top`
+        self._boxes = np.empty((0, 4))
+        self._order = np.empty(0, dtype=int)
+        self._lefts = np.empty(0)
+        # maximal right edge of the elements up to the position in
+        # sorted by `left` order. Elements before the first position
+        # with `self._max_rights >= left` end before `left`.
+        self._max_rights = np.empty(0)
+        # (M, 2) array of connection points, their owners and
+        # indexes in owner's `connections` list
+        self._conn_pts = np.empty((0, 2))
+        self._conn_owner = np.empty(0, dtype=int)
+        self._conn_idx = np.empty(0, dtype=int)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __contains__(self, name):
+        return name in self.elements
+
+    def insert(self, name, element):
+        """
+        Adds `element` to the index. Element with the same `name` is
+        replaced.
+
+        Parameters
+        ----------
+        name : str
+        element : ElementBase
+        """
+        self.elements[name] = element
+        self._invalidate(name)
+
+    def remove(self, name):
+        del self.elements[name]
+        self._invalidate(name)
+
+    def clear(self):
+        self.elements.clear()
+        self._invalidate()
+
+    def refresh(self, name=None):
+        """
+        Drops cached boxes, connections and geometry of element `name`
+        (or of all elements). Has to be called if element was
+        transformed after insertion.
+        """
+        self._invalidate(name)
+
+    def _invalidate(self, name=None):
+        self._dirty = True
+        if name is None:
+            self._footprints.clear()
+        else:
+            for key in [key for key in self._footprints if key[0] == name]:
+                del self._footprints[key]
+
+    def _build(self):
+        if not self._dirty:
+            return
+        self._names = list(self.elements.keys())
+        self._ids = {name: i for i, name in enumerate(self._names)}
+        boxes = np.full((len(self._names), 4), np.nan)
+        conn_pts = []
+        conn_owner = []
+        conn_idx = []
+        for i, element in enumerate(self.elements.values()):
+            box = element.bbox()
+            if not box.empty():
+                boxes[i] = (box.left, box.bottom, box.right, box.top)
+            for j, pt in enumerate(element.connections):
+                conn_pts.append((pt.x, pt.y))
+                conn_owner.append(i)
+                conn_idx.append(j)
+        # elements without geometry never intersect anything
+        valid = ~np.isnan(boxes[:, 0])
+        self._boxes = boxes
+        self._order = np.flatnonzero(valid)[
+            np.argsort(boxes[valid, 0], kind="stable")
+        ]
+        self._lefts = boxes[self._order, 0]
+        self._max_rights = np.maximum.accumulate(boxes[self._order, 2]) \
+            if len(self._order) > 0 else np.empty(0)
+        self._conn_pts = np.array(conn_pts, dtype=float).reshape(-1, 2)
+        self._conn_owner = np.array(conn_owner, dtype=int)
+        self._conn_idx = np.array(conn_idx, dtype=int)
+        self._dirty = False
+
+    def bbox(self, name):
+        """
+        Returns cached bounding box of element `name`.
+
+        Returns
+        -------
+        DBox
+        """
+        self._build()
+        left, bottom, right, top = self._boxes[self._ids[name]]
+        if np.isnan(left):
+            return DBox()
+        return DBox(left, bottom, right, top)
+
+    def _query_ids(self, left, bottom, right, top):
+        # only elements that start before `right` and are not preceded
+        # in sorted order only by elements that end before `left`
+        # are checked
+        start = np.searchsorted(self._max_rights, left, side="left")
+        end = np.searchsorted(self._lefts, right, side="right")
+        ids = self._order[start:end]
+        boxes = self._boxes[ids]
+        mask = (boxes[:, 2] >= left) & (boxes[:, 1] <= top) & \
+               (boxes[:, 3] >= bottom)
+        return ids[mask]
+
+    def query_box(self, box, distance=0):
+        """
+        Returns names of elements which bounding boxes intersect or
+        touch `box` enlarged by `distance`.
+
+        Parameters
+        ----------
+        box : DBox
+        distance : float
+            in nm
+
+        Returns
+        -------
+        List[str]
+        """
+        self._build()
+        ids = self._query_ids(box.left - distance, box.bottom - distance,
+                              box.right + distance, box.top + distance)
+        return [self._names[i] for i in np.sort(ids)]
+
+    def query_point(self, pt, distance=0):
+        """
+        Returns names of elements which bounding boxes are not
+        further than `distance` from `pt`.
+
+        Parameters
+        ----------
+        pt : DPoint
+        distance : float
+            in nm
+
+        Returns
+        -------
+        List[str]
+        """
+        return self.query_box(DBox(pt, pt), distance)
+
+    def nearest_connection(self, pt, exclude: Iterable[str] = ()):
+        """
+        Finds connection point closest to `pt` over all indexed
+        elements.
+
+        Parameters
+        ----------
+        pt : DPoint
+        exclude : Iterable[str]
+            names of elements which connections are skipped
+
+        Returns
+        -------
+        Tuple[str, int, float]
+            `name, connection_idx, distance` of the closest connection
+            or `None` if there are no connections in the index.
+        """
+        self._build()
+        mask = np.ones(len(self._conn_owner), dtype=bool)
+        exclude = set(exclude)
+        if exclude:
+            # names that are not indexed have no connections to skip
+            excluded_ids = [self._ids[name] for name in exclude
+                            if name in self._ids]
+            mask &= ~np.isin(self._conn_owner, excluded_ids)
+        if not mask.any():
+            return None
+        ids = np.flatnonzero(mask)
+        d = np.hypot(self._conn_pts[ids, 0] - pt.x,
+                     self._conn_pts[ids, 1] - pt.y)
+        k = ids[np.argmin(d)]
+        return (self._names[self._conn_owner[k]], int(self._conn_idx[k]),
+                float(d.min()))
+
+    def candidate_pairs(self, distance=0, names: Iterable[str] = None):
+        """
+        Returns pairs of elements which bounding boxes are closer
+        than `distance` to each other.
+
+        Parameters
+        ----------
+        distance : float
+            in nm
+        names : Iterable[str]
+            only pairs of these elements are returned.
+            All elements are used if `None`.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            pairs follow insertion order of the elements
+        """
+        self._build()
+        order = self._order
+        if names is not None:
+            names = set(names)
+            order = np.array(
+                [i for i in order if self._names[i] in names], dtype=int
+            )
+        boxes = self._boxes[order]
+        # every element is paired with the elements following it in
+        # sorted by `left` order that start before its `right`
+        ends = np.searchsorted(boxes[:, 0], boxes[:, 2] + distance,
+                               side="right")
+        counts = ends - np.arange(len(order)) - 1
+        first = np.repeat(np.arange(len(order)), counts)
+        second = np.arange(counts.sum()) - \
+            np.repeat(np.cumsum(counts) - counts, counts) + first + 1
+        mask = (boxes[first, 1] <= boxes[second, 3] + distance) & \
+               (boxes[second, 1] <= boxes[first, 3] + distance)
+        first = order[first[mask]]
+        second = order[second[mask]]
+        pairs = np.sort(np.stack([first, second], axis=1), axis=1)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        return [(self._names[i], self._names[j]) for i, j in pairs]
+
+    def footprint(self, name, region_id="default"):
+        """
+        Returns merged metal and empty regions of element `name`.
+        Both are taken from the element's placement contribution, so
+        simple elements and elements composed of primitives (whose
+        aggregate `empty_regions` are not filled) have footprints
+        of the same content.
+        Result is cached until `refresh(name)` is called.
+
+        Returns
+        -------
+        Region
+        """
+        key = (name, region_id)
+        if key not in self._footprints:
+            metal, empty = \
+                self.elements[name]._placement_contribution(region_id)
+            self._footprints[key] = (metal + empty).merged()
+        return self._footprints[key]
+
+    def connected(self, name_a, name_b):
+        """
+        Returns `True` if elements share at least one connection
+        point.
+        """
+        self._build()
+        a = self._ids[name_a]
+        b = self._ids[name_b]
+        pts_a = self._conn_pts[self._conn_owner == a]
+        pts_b = self._conn_pts[self._conn_owner == b]
+        if len(pts_a) == 0 or len(pts_b) == 0:
+            return False
+        d = np.hypot(pts_a[:, None, 0] - pts_b[None, :, 0],
+                     pts_a[:, None, 1] - pts_b[None, :, 1])
+        return bool((d <= _CONNECTION_TOL).any())
+
+    def clearance_violations(self, clearance=0, names: Iterable[str] = None,
+                             region_id="default", skip_connected=True):
+        """
+        Finds pairs of elements which geometry is closer than
+        `clearance` to each other. `clearance=0` reports overlapping
+        elements only.
+        Candidate pairs are found from bounding boxes, and only they
+        are checked with boolean operations on element regions.
+
+        Parameters
+        ----------
+        clearance : float
+            minimal allowed distance between elements in nm
+        names : Iterable[str]
+            only pairs of these elements are checked.
+            All elements are checked if `None`.
+        region_id : str
+            regions of elements that are checked
+        skip_connected : bool
+            pairs that share a connection point (e.g. consecutive
+            parts of a line) are not reported
+
+        Returns
+        -------
+        List[Tuple[str, str, Region]]
+            names of elements and region where geometry of the second
+            element violates clearance of the first one.
+        """
+        violations = []
+        for name_a, name_b in self.candidate_pairs(clearance, names):
+            if skip_connected and self.connected(name_a, name_b):
+                continue
+            reg_a = self.footprint(name_a, region_id)
+            reg_b = self.footprint(name_b, region_id)
+            if reg_a.is_empty() or reg_b.is_empty():
+                continue
+            if clearance > 0:
+                reg_a = reg_a.sized(int(round(clearance)))
+            overlap = reg_a & reg_b
+            if not overlap.is_empty():
+                violations.append((name_a, name_b, overlap))
+        return violations
@@ -0,0 +1,355 @@
+"""
+    This helper calculates meander parameters of the resonators from
+    their target length without drawing any polygons.
+    Lengths of `EMResonator_TL2Qbit_worm3`,
+    `EMResonatorTL3QbitWormRLTail` (and its `XmonFork` descendant) and
+    `CPWResonator2` are written in closed form. They are linear in
+    the length of the meander segments, hence the latter is found
+    directly for every number of meander periods.
+    Fit of the resonator into the given dimensions is checked by its
+    bounding box that is calculated analytically (see
+    `classLib.baseClasses.SkeletonMode`), so the whole resonator
+    including its coupling part and tail has to fit.
+
+    If you need to tune resonator frequency in your job, just write:
+    ```python
+    from classLib.helpers import frequency_to_length, solve_worm_rl_tail
+    length = frequency_to_length(7.5, refractive_index=np.sqrt(6.26423))
+    L1, N = solve_worm_rl_tail(
+        length, Z0=Z_res, L_coupling=L_coupling, L0=L0, r=r,
+        tail_shape=tail_shape, tail_turn_radiuses=r,
+        tail_segment_lengths=tail_segment_lengths,
+        tail_turn_angles=tail_turn_angles, open_end=False,
+        bbox=DBox(DPoint(0, 0), DPoint(1200e3, 1500e3))
+    )
+    ```
+"""
+from math import pi, tan
+
+from pya import DPoint
+
+from classLib.baseClasses import SkeletonMode
+from classLib.resonators import EMResonator_TL2Qbit_worm3, \
+    EMResonatorTL3QbitWormRLTail, EMResonatorTL3QbitWormRLTailXmonFork
+
+# light speed in vacuum, m/s
+_C = 299792458
+
+
+def frequency_to_length(frequency, refractive_index, n=0):
+    """
+    Returns length of the quarter-wave resonator which `n`-th mode has
+    `frequency`. Inverse of `get_approx_frequency` of the resonators.
+
+    Parameters
+    ----------
+    frequency : float
+        frequency in GHz
+    refractive_index : float
+        absolute refractive index of CPW waveguide.
+    n : int
+        number of the mode
+
+    Returns
+    -------
+    float
+        length in nm
+    """
+    return _C / refractive_index * (2 * n + 1) / (4 * frequency)
+
+
+def length_to_frequency(length, refractive_index, n=0):
+    """
+    Returns frequency of the `n`-th mode of the quarter-wave resonator
+    of `length`. Same as `get_approx_frequency` of the resonators.
+
+    Parameters
+    ----------
+    length : float
+        length in nm
+    refractive_index : float
+        absolute refractive index of CPW waveguide.
+    n : int
+        number of the mode
+
+    Returns
+    -------
+    float
+        frequency in GHz
+    """
+    return _C / refractive_index * (2 * n + 1) / (4 * length)
+
+
+def rl_path_length(shape, turn_radiuses, segment_lengths, turn_angles):
+    """
+    Returns length of the `CPWRLPath` with given parameters.
+    Parameters have the same meaning as for `CPWRLPath`.
+
+    Parameters
+    ----------
+    shape : str
+    turn_radiuses : Union[float, List[float]]
+    segment_lengths : Union[float, List[float]]
+    turn_angles : Union[float, List[float]]
+
+    Returns
+    -------
+    float
+        length in nm
+    """
+    turns_n = shape.count("R")
+    straights_n = shape.count("L")
+    if not hasattr(turn_radiuses, "__len__"):
+        turn_radiuses = [turn_radiuses] * turns_n
+    if not hasattr(segment_lengths, "__len__"):
+        segment_lengths = [segment_lengths] * straights_n
+    if not hasattr(turn_angles, "__len__"):
+        turn_angles = [turn_angles] * turns_n
+
+    length = 0
+    idx_r = 0
+    idx_l = 0
+    for i, symbol in enumerate(shape):
+        if symbol == "R":
+            length += abs(turn_radiuses[idx_r] * turn_angles[idx_r])
+            idx_r += 1
+        elif symbol == "L":
+            dl = segment_lengths[idx_l]
+            # straight segments are shortened by adjacent turns the same
+            # way as in `CPWRLPath.init_primitives`
+            if (i + 1 < len(shape) and shape[i + 1] == "R"
+                    and abs(turn_angles[idx_r]) < pi):
+                dl -= turn_radiuses[idx_r] * abs(tan(turn_angles[idx_r] / 2))
+            if (i - 1 > 0 and shape[i - 1] == "R"
+                    and abs(turn_angles[idx_r - 1]) < pi):
+                dl -= turn_radiuses[idx_r - 1] * \
+                      abs(tan(turn_angles[idx_r - 1] / 2))
+            length += dl
+            idx_l += 1
+    return length
+
+
+def worm3_length(Z0, L_coupling, L0, L1, r, L2, N):
+    """
+    Returns length of the `EMResonator_TL2Qbit_worm3` with given
+    parameters including its open end.
+
+    Returns
+    -------
+    float
+        length in nm
+    """
+    # tail arc has radius `L1/2`
+    return (pi * r / 2 + L0 + L_coupling + 2 * pi * r * (N + 1) +
+            L1 * (2 * N + 1 + pi / 4) + L2 + Z0.b)
+
+
+def worm_rl_tail_length(Z0, L_coupling, L0, L1, r, N,
+                        tail_shape, tail_turn_radiuses,
+                        tail_segment_lengths, tail_turn_angles,
+                        open_end=True):
+    """
+    Returns length of the `EMResonatorTL3QbitWormRLTail` with given
+    parameters.
+
+    Parameters
+    ----------
+    open_end : bool
+        whether the open end of the resonator is taken into account.
+        Use `False` for `EMResonatorTL3QbitWormRLTailXmonFork` that is
+        equivalent to its `length(exception="fork")`.
+
+    Returns
+    -------
+    float
+        length in nm
+    """
+    tail_length = rl_path_length(tail_shape, tail_turn_radiuses,
+                                 tail_segment_lengths, tail_turn_angles)
+    return (pi * r / 2 + L0 + L_coupling + 2 * pi * r * (N + 1) +
+            L1 * (2 * N + 1) + tail_length + (Z0.b if open_end else 0))
+
+
+def _fits(build_func, L1, N, bbox):
+    """
+    Returns `True` if resonator `build_func(L1, N)` (constructed without
+    rotation) fits into dimensions of `bbox`.
+    """
+    with SkeletonMode():
+        box = build_func(L1, N).bbox()
+    return box.width() <= bbox.width() and box.height() <= bbox.height()
+
+
+def _solve_linear(length_func, build_func, length, bbox, N, r, Z0):
+    """
+    Finds `(L1, N)` for `length_func(L1, N) == length` that is linear
+    in `L1`. Resonator `build_func(L1, N)` has to fit into `bbox` if it
+    is given. Minimal number of meander periods is chosen if `N` is
+    `None`.
+    """
+    if N is not None:
+        Ns = [N]
+    elif bbox is None:
+        raise ValueError("Either `N` or `bbox` has to be given.")
+    else:
+        # meander coils alone span `4*r*(N+1)` along `y`
+        Ns = range(int((bbox.height() - Z0.b) // (4 * r)))
+
+    for N in Ns:
+        l_0 = length_func(0, N)
+        L1 = (length - l_0) / (length_func(1, N) - l_0)
+        if L1 < 0:
+            break
+        if bbox is not None and not _fits(build_func, L1, N, bbox):
+            continue
+        return L1, N
+    raise ValueError(
+        "Resonator of the requested length does not fit into given "
+        "dimensions."
+    )
+
+
+def solve_worm3(length, Z0, L_coupling, L0, r, L2, N=None, bbox=None):
+    """
+    Finds meander parameters `L1` and `N` of the
+    `EMResonator_TL2Qbit_worm3` of `length`.
+
+    Parameters
+    ----------
+    length : float
+        target length of the resonator in nm.
+        See `frequency_to_length`.
+    N : Optional[int]
+        number of meander periods. Chosen as small as possible to fit
+        `bbox` if `None`.
+    bbox : Optional[DBox]
+        only dimensions of the box are used. Resonator constructed
+        without `trans_in` has to fit into it.
+    other parameters are the same as for `EMResonator_TL2Qbit_worm3`
+
+    Returns
+    -------
+    Tuple[float, int]
+        `L1, N`
+
+    Raises
+    ------
+    ValueError
+        if resonator does not fit into `bbox`
+    """
+    return _solve_linear(
+        lambda L1, N_: worm3_length(Z0, L_coupling, L0, L1, r, L2, N_),
+        lambda L1, N_: EMResonator_TL2Qbit_worm3(
+            Z0, DPoint(0, 0), L_coupling, L0, L1, r, L2, N_
+        ),
+        length, bbox, N, r, Z0
+    )
+
+
+def solve_worm_rl_tail(length, Z0, L_coupling, L0, r,
+                       tail_shape, tail_turn_radiuses,
+                       tail_segment_lengths, tail_turn_angles,
+                       N=None, bbox=None, open_end=True,
+                       tail_trans_in=None, fork_parameters=None):
+    """
+    Finds meander parameters `L1` and `N` of the
+    `EMResonatorTL3QbitWormRLTail` of `length`.
+
+    Parameters
+    ----------
+    length : float
+        target length of the resonator in nm.
+        See `frequency_to_length`.
+    N : Optional[int]
+        number of meander periods. Chosen as small as possible to fit
+        `bbox` if `None`.
+    bbox : Optional[DBox]
+        only dimensions of the box are used. Resonator constructed
+        without `trans_in` has to fit into it.
+    open_end : bool
+        see `worm_rl_tail_length`
+    fork_parameters : Optional[Tuple[float, float, float, float]]
+        `fork_x_span, fork_y_span, fork_metal_width, fork_gnd_gap` of
+        `EMResonatorTL3QbitWormRLTailXmonFork`. Fork is taken into
+        account in the resonator dimensions only.
+    other parameters are the same as for `EMResonatorTL3QbitWormRLTail`
+
+    Returns
+    -------
+    Tuple[float, int]
+        `L1, N`
+
+    Raises
+    ------
+    ValueError
+        if resonator does not fit into `bbox`
+    """
+    def build_func(L1, N_):
+        tail_args = (Z0, DPoint(0, 0), L_coupling, L0, L1, r, N_,
+                     tail_shape, tail_turn_radiuses,
+                     tail_segment_lengths, tail_turn_angles)
+        if fork_parameters is None:
+            return EMResonatorTL3QbitWormRLTail(
+                *tail_args, tail_trans_in=tail_trans_in
+            )
+        return EMResonatorTL3QbitWormRLTailXmonFork(
+            *tail_args, *fork_parameters, tail_trans_in=tail_trans_in
+        )
+
+    return _solve_linear(
+        lambda L1, N_: worm_rl_tail_length(
+            Z0, L_coupling, L0, L1, r, N_, tail_shape, tail_turn_radiuses,
+            tail_segment_lengths, tail_turn_angles, open_end=open_end
+        ),
+        build_func, length, bbox, N, r, Z0
+    )
+
+
+def solve_cpw_resonator2_periods(length, Z0, turn_radius, bbox,
+                                 coupling_length=200e3, neck_length=100e3,
+                                 no_neck=False, extra_neck_length=0):
+    """
+    Finds the least number of meander periods of `CPWResonator2` of
+    `length` that fits into `bbox`.
+    Length of `CPWResonator2` follows from its frequency, see
+    `CPWResonator2._calculate_total_length`.
+
+    Parameters
+    ----------
+    length : float
+        length of the resonator in nm
+    bbox : DBox
+        only dimensions of the box are used. Resonator spans
+        `4*turn_radius*(meander_periods + 1)` along `y`.
+    other parameters are the same as for `CPWResonator2`
+
+    Returns
+    -------
+    Tuple[int, float]
+        `meander_periods, meander_length`
+
+    Raises
+    ------
+    ValueError
+        if resonator does not fit into `bbox`
+    """
+    R = turn_radius
+    total_neck_length = pi * R / 2 + neck_length if not no_neck else 0
+    N = 0
+    while 4 * R * (N + 1) + Z0.b <= bbox.height():
+        # same expression as in `CPWResonator2.init_primitives`
+        meander_length = (length - coupling_length -
+                          2 * (1 + N) * pi * R - 3 * R -
+                          total_neck_length - extra_neck_length) / \
+                         (2 * N + 3 / 2)
+        if meander_length < 0:
+            break
+        x_span = coupling_length + 3 * R + extra_neck_length - \
+            min(0, coupling_length - meander_length - R)
+        if x_span + Z0.b <= bbox.width():
+            return N, meander_length
+        N += 1
+    raise ValueError(
+        "Resonator of the requested length does not fit into given "
+        "dimensions."
+    )
@@ -0,0 +1,620 @@
+"""
+    This helper routes coplanar lines around existing structures of the
+    design.
+    Obstacles region (e.g. empty areas of the photo layer) is rasterized
+    into occupancy grid once. Every route is found by shortest path
+    search with bend penalties over the grid and returned as anchor
+    points that are ready to be passed to `DPathCPW` with the requested
+    turn radius.
+    The search is performed by numpy over whole sets of grid cells.
+    Costs are spread along free runs of cells by a single prefix minimum
+    per run and every iteration adds one more turn to all routes at
+    once. Hence, dense obstacles with thousands of free runs are
+    processed without per-cell Python loops.
+    Routes are Manhattan: they consist of horizontal and vertical
+    segments with 90 degree turns. Straight route between terminals
+    that are slightly shifted across it has a shallow S-bend in the
+    middle.
+
+    If you need to route a line in your job, just write:
+    ```python
+    from classLib.helpers import GridRouter
+    router = GridRouter(obstacles, chip_box, cell_size=10e3,
+                        clearance=20e3)
+    pts = router.route(start, end, z_md, turn_radius=40e3,
+                       start_angle=pi/2)
+    md_line = DPathCPW(pts, z_md, 40e3)
+    router.block(md_line.metal_region + md_line.empty_region)
+    ```
+"""
+from math import ceil, pi, sqrt
+
+import numpy as np
+
+import pya
+from pya import Point, DPoint, Vector, Region, Box
+
+# directions of grid moves: +x, +y, -x, -y
+_DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+# cost of unreachable states
+_INF = np.iinfo(np.int64).max // 2
+
+
+def _free_segments(free, line_len):
+    """
+    Splits lines of the flattened grid into segments of consecutive free
+    cells.
+
+    Parameters
+    ----------
+    free : np.ndarray
+        flattened grid of free cells that consists of lines of
+        `line_len` cells
+    line_len : int
+        number of cells in every line
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        segment index of every cell (-1 for blocked cells), flat indexes
+        of the first cells of the segments and flat indexes that follow
+        the last cells of the segments
+    """
+    n = len(free)
+    prev_free = np.zeros(n, dtype=bool)
+    prev_free[1:] = free[:-1]
+    prev_free[::line_len] = False
+    next_free = np.zeros(n, dtype=bool)
+    next_free[:-1] = free[1:]
+    next_free[line_len - 1::line_len] = False
+    is_start = free & ~prev_free
+    seg = np.cumsum(is_start) - 1
+    seg[~free] = -1
+    return seg, np.flatnonzero(is_start), \
+        np.flatnonzero(free & ~next_free) + 1
+
+
+def _jump_offsets(pos, length, positive):
+    """
+    Returns offsets from every grid line to the nearest line that is
+    at least `length` away in positive (negative) direction together
+    with distances to it. Zero offset means there is no such line.
+    """
+    k = np.arange(len(pos))
+    if positive:
+        t = np.searchsorted(pos, pos + length, side="left")
+        t[t >= len(pos)] = k[t >= len(pos)]
+    else:
+        t = np.searchsorted(pos, pos - length, side="right") - 1
+        t[t < 0] = k[t < 0]
+    return t - k, np.abs(pos[t] - pos)
+
+
+def _propagate(entry, cost, pos, starts, ends, positive):
+    """
+    Updates costs of the states by straight moves along the segments of
+    free cells from the states that are entered with `entry` costs.
+    Every cell gets minimum of `entry[i] + |pos - pos[i]|` over cells
+    `i` of the same segment that precede it in the direction of moves.
+
+    Parameters
+    ----------
+    entry : np.ndarray
+        entry costs of the cells
+    cost : np.ndarray
+        costs of the cells. Updated in place.
+    pos : np.ndarray
+        positions of the cells along their lines
+    starts, ends : np.ndarray
+        flat ranges of the segments to process
+    positive : bool
+        direction of moves along the lines
+
+    Returns
+    -------
+    np.ndarray
+        flat indexes of the cells which costs were decreased
+    """
+    lens = ends - starts
+    # segments are processed by groups of similar length padded
+    # with copies of their last cells to the power of two
+    groups = np.ceil(np.log2(lens)).astype(int)
+    improved = []
+    for group in np.unique(groups):
+        in_group = groups == group
+        seg_starts, seg_lens = starts[in_group], lens[in_group]
+        cols = np.arange(1 << group)
+        idx = seg_starts[:, None] + \
+            np.minimum(cols[None, :], seg_lens[:, None] - 1)
+        seg_pos = pos[idx]
+        if positive:
+            new_cost = np.minimum.accumulate(
+                entry[idx] - seg_pos, axis=1) + seg_pos
+        else:
+            new_cost = np.minimum.accumulate(
+                (entry[idx] + seg_pos)[:, ::-1], axis=1)[:, ::-1] - seg_pos
+        mask = (cols[None, :] < seg_lens[:, None]) & (new_cost < cost[idx])
+        cells = idx[mask]
+        cost[cells] = new_cost[mask]
+        improved.append(cells)
+    return np.concatenate(improved)
+
+
+def obstacles_from_region(region, bbox):
+    """
+    Returns obstacles of the metal region `region` - its empty areas
+    inside the `bbox`.
+    Metal strips of the existing lines are surrounded by their gaps
+    and are covered by obstacles after clearance is applied.
+
+    Parameters
+    ----------
+    region : Region
+        metal region of the design (e.g. `ChipDesign.region_ph`)
+    bbox : DBox
+        routing area
+
+    Returns
+    -------
+    Region
+    """
+    return Region(Box().from_dbox(bbox)) - region
+
+
+class GridRouter:
+    def __init__(self, obstacles, bbox, cell_size=10e3, clearance=0):
+        """
+        Rasterizes obstacles into occupancy grid that covers `bbox`.
+
+        Parameters
+        ----------
+        obstacles : Region
+            polygons that routes have to avoid.
+            See `obstacles_from_region`.
+        bbox : DBox
+            routing area. Routes do not leave it.
+        cell_size : float
+            size of the square grid cell in nm
+        clearance : float
+            minimal distance between obstacles and routed lines
+            (edges of their gaps)
+        """
+        self.bbox = bbox
+        self.cell_size = cell_size
+        self.clearance = clearance
+        self.nx = int(ceil(bbox.width() / cell_size))
+        self.ny = int(ceil(bbox.height() / cell_size))
+        # blocked cells, `self.blocked[iy, ix]`
+        self.blocked = np.zeros((self.ny, self.nx), dtype=bool)
+        self.block(obstacles)
+
+    def _rasterize(self, region):
+        # cell is occupied if obstacle covers any part of it
+        origin = Point().from_dpoint(DPoint(self.bbox.left, self.bbox.bottom))
+        step = int(round(self.cell_size))
+        areas = region.rasterize(origin, Vector(step, step), self.nx, self.ny)
+        return np.asarray(areas, dtype=float) > 0
+
+    def block(self, region, clearance=None):
+        """
+        Marks cells covered by `region` with `clearance` around it as
+        occupied. Used to add obstacles, e.g. already routed lines.
+
+        Parameters
+        ----------
+        region : Region
+            new obstacles
+        clearance : Optional[float]
+            clearance around new obstacles. `self.clearance` by default.
+        """
+        if clearance is None:
+            clearance = self.clearance
+        region = region.dup()
+        if clearance > 0:
+            region.size(int(round(clearance)))
+        self.blocked |= self._rasterize(region)
+
+    def cell_of(self, pt):
+        """
+        Returns indexes `(ix, iy)` of the cell that contains point `pt`.
+        """
+        ix = int((pt.x - self.bbox.left) // self.cell_size)
+        iy = int((pt.y - self.bbox.bottom) // self.cell_size)
+        return min(max(ix, 0), self.nx - 1), min(max(iy, 0), self.ny - 1)
+
+    def cell_center(self, ix, iy):
+        return DPoint(self.bbox.left + (ix + 0.5) * self.cell_size,
+                      self.bbox.bottom + (iy + 0.5) * self.cell_size)
+
+    @staticmethod
+    def _dilated(blocked, k):
+        """
+        Returns `blocked` grid dilated by `k` cells in every direction.
+        """
+        if k <= 0:
+            return blocked
+        ny, nx = blocked.shape
+        # window sums over (2k+1) x (2k+1) squares by 2D prefix sums
+        csum = np.zeros((ny + 1, nx + 1), dtype=np.int64)
+        np.cumsum(np.cumsum(blocked, axis=0), axis=1, out=csum[1:, 1:])
+        y = np.arange(ny)
+        x = np.arange(nx)
+        y1 = np.clip(y - k, 0, ny)[:, None]
+        y2 = np.clip(y + k + 1, 0, ny)[:, None]
+        x1 = np.clip(x - k, 0, nx)[None, :]
+        x2 = np.clip(x + k + 1, 0, nx)[None, :]
+        return (csum[y2, x2] - csum[y1, x2] - csum[y2, x1] +
+                csum[y1, x1]) > 0
+
+    @staticmethod
+    def _angle_to_dir(angle):
+        if angle is None:
+            return None
+        return int(round(angle / (pi / 2))) % 4
+
+    def route(self, start, end, cpw_params, turn_radius, start_angle=None,
+              end_angle=None, bend_penalty=None):
+        """
+        Finds Manhattan route from `start` to `end` that avoids
+        obstacles.
+
+        Parameters
+        ----------
+        start : DPoint
+            starting point of the line
+        end : DPoint
+            ending point of the line
+        cpw_params : CPWParameters
+            parameters of the routed line. Its full width `b` is taken
+            into account together with clearance.
+        turn_radius : float
+            turn radius of the line. Straight segments are long enough
+            to be rounded by `DPathCPW` with this radius.
+        start_angle : Optional[float]
+            direction of the line at `start` in radians. Multiple of
+            pi/2. Any direction is allowed if `None`.
+        end_angle : Optional[float]
+            direction of the line at `end` in radians. Multiple of pi/2.
+            Any direction is allowed if `None`.
+        bend_penalty : Optional[float]
+            additional cost of every turn in nm. Equals to
+            `2*turn_radius` by default.
+
+        Returns
+        -------
+        Optional[List[DPoint]]
+            anchor points of the route or `None` if there is no route.
+        """
+        nx, ny = self.nx, self.ny
+        cs = self.cell_size
+        # route center line has to keep away from obstacles
+        # by half of its width
+        free = ~self._dilated(self.blocked, int(ceil(cpw_params.b / 2 / cs)))
+        start_ix, start_iy = self.cell_of(start)
+        end_ix, end_iy = self.cell_of(end)
+        start_dir = self._angle_to_dir(start_angle)
+        end_dir = self._angle_to_dir(end_angle)
+
+        # line leaves its start and enters its end through obstacles
+        # that surround terminals (e.g. gaps of the connected element)
+        escape_n = int(ceil((self.clearance + cpw_params.b) / cs)) + 1
+        for ix, iy, d, sign in ((start_ix, start_iy, start_dir, 1),
+                                (end_ix, end_iy, end_dir, -1)):
+            free[iy, ix] = True
+            if d is None:
+                continue
+            dx, dy = _DIRS[d]
+            for i in range(1, escape_n + 1):
+                cx, cy = ix + sign * i * dx, iy + sign * i * dy
+                if not (0 <= cx < nx and 0 <= cy < ny):
+                    break
+                free[cy, cx] = True
+
+        # Consecutive identical columns (rows) of the grid are merged.
+        # Route can turn only at the representative column (row) of
+        # every merged group, that is equivalent to turning at any
+        # other column (row) of the group.
+        col_reps = self._representatives(
+            np.any(free[:, 1:] != free[:, :-1], axis=0), (start_ix, end_ix)
+        )
+        row_reps = self._representatives(
+            np.any(free[1:, :] != free[:-1, :], axis=1), (start_iy, end_iy)
+        )
+        free = free[np.ix_(row_reps, col_reps)]
+        xs = (self.bbox.left + (col_reps + 0.5) * cs).tolist()
+        ys = (self.bbox.bottom + (row_reps + 0.5) * cs).tolist()
+        cnx = len(xs)
+        start_idx = int(np.searchsorted(col_reps, start_ix)) + \
+            cnx * int(np.searchsorted(row_reps, start_iy))
+        goal = int(np.searchsorted(col_reps, end_ix)) + \
+            cnx * int(np.searchsorted(row_reps, end_iy))
+
+        # minimal straight lengths between turns and at the ends of the
+        # line. One extra cell compensates snapping of the route's
+        # terminals to the grid.
+        l_turn = 2 * turn_radius + cs
+        l_end = turn_radius + cs
+        if bend_penalty is None:
+            bend_penalty = 2 * turn_radius
+        bend = int(round(bend_penalty))
+
+        if start_idx == goal:
+            d = start_dir
+            if d is None:
+                d = 0 if abs(end.x - start.x) >= abs(end.y - start.y) else 1
+            return self._jogged(start, end, d, turn_radius)
+
+        # State is a cell together with direction of the line in it.
+        # States of horizontal (vertical) directions are stored row by
+        # row (column by column), so every free run of cells along the
+        # direction is a contiguous range of flat indexes. Costs are
+        # integer nanometers.
+        cny = len(ys)
+        n = cnx * cny
+        line_lens = (cnx, cny)
+        lines_pos = (np.round(xs).astype(np.int64),
+                     np.round(ys).astype(np.int64))
+        cells_pos = (np.tile(lines_pos[0], cny), np.tile(lines_pos[1], cnx))
+        segments = (_free_segments(free.ravel(), cnx),
+                    _free_segments(free.T.ravel(), cny))
+        turn_jumps = [_jump_offsets(lines_pos[d & 1], l_turn, d < 2)
+                      for d in range(4)]
+
+        def transposed(f, axis):
+            # flat index of the cell in the layout of the other axis
+            line_len = line_lens[axis]
+            return (f % line_len) * line_lens[1 - axis] + f // line_len
+
+        start_f = (start_idx, transposed(start_idx, 0))
+        goal_f = (goal, transposed(goal, 0))
+        goal_x, goal_y = lines_pos[0][goal % cnx], lines_pos[1][goal // cnx]
+
+        def h(f, d):
+            # Manhattan distance and the least number of turns that are
+            # required to reach the goal from the states
+            if d & 1:
+                ix, iy = np.divmod(f, cny)
+            else:
+                iy, ix = np.divmod(f, cnx)
+            gx = goal_x - lines_pos[0][ix]
+            gy = goal_y - lines_pos[1][iy]
+            dx, dy = _DIRS[d]
+            turns_n = np.where(gx * dx + gy * dy >= 0,
+                               gx * dy - gy * dx != 0, 2).astype(np.int64)
+            if end_dir is not None:
+                # every turn rotates direction by pi/2
+                rotation = (end_dir - d) & 3
+                rotation = 2 if rotation == 2 else rotation & 1
+                turns_n = np.maximum(turns_n, rotation)
+                turns_n += (turns_n - rotation) & 1
+            return np.abs(gx) + np.abs(gy) + turns_n * bend
+
+        # costs of entering the states by turns (or from the start) and
+        # costs of the states. Entered state keeps its source state
+        # `4*f + d` (-1 for the start).
+        entry = [np.full(n, _INF, dtype=np.int64) for _ in range(4)]
+        cost = [np.full(n, _INF, dtype=np.int64) for _ in range(4)]
+        source = [np.full(n, -1, dtype=np.int64) for _ in range(4)]
+        # the cheapest route found: its cost and its last segment
+        best_cost = _INF
+        best = None
+
+        changed = [None] * 4
+        for d in (range(4) if start_dir is None else [start_dir]):
+            axis = d & 1
+            seg, starts, ends = segments[axis]
+            f, f_goal = start_f[axis], goal_f[axis]
+            dist = abs(int(cells_pos[axis][f_goal] - cells_pos[axis][f]))
+            if seg[f] == seg[f_goal] and (f_goal > f) == (d < 2) and \
+                    (end_dir is None or d == end_dir) and dist < best_cost:
+                # straight route to the goal
+                best_cost, best = dist, ("ray", d)
+            # the first segment before the first turn
+            off, dists = _jump_offsets(lines_pos[axis], l_end, d < 2)
+            k = f % line_lens[axis]
+            if off[k] != 0 and starts[seg[f]] <= f + off[k] < ends[seg[f]]:
+                entry[d][f + off[k]] = dists[k]
+                changed[d] = np.array([f + off[k]])
+
+        # every iteration propagates decreased entry costs along free
+        # runs and turns from the states which costs were decreased
+        while True:
+            frontier = [None] * 4
+            for d in range(4):
+                if changed[d] is None or len(changed[d]) == 0:
+                    continue
+                axis = d & 1
+                seg, starts, ends = segments[axis]
+                segs = np.unique(seg[changed[d]])
+                cells = _propagate(entry[d], cost[d], cells_pos[axis],
+                                   starts[segs], ends[segs], d < 2)
+                if (end_dir is None or d == end_dir) and \
+                        cost[d][goal_f[axis]] < best_cost:
+                    best_cost = int(cost[d][goal_f[axis]])
+                    best = ("straight", d)
+                # states that can not improve the route are dropped
+                frontier[d] = cells[cost[d][cells] + h(cells, d) < best_cost]
+            if all(cells is None or len(cells) == 0 for cells in frontier):
+                break
+
+            candidates = [[] for _ in range(4)]
+            for d in range(4):
+                cells = frontier[d]
+                if cells is None or len(cells) == 0:
+                    continue
+                cells_cost = cost[d][cells]
+                axis = 1 - (d & 1)
+                seg, starts, ends = segments[axis]
+                cells_t = transposed(cells, 1 - axis)
+                cells_seg = seg[cells_t]
+                k = cells_t % line_lens[axis]
+                for d2 in ((d + 1) & 3, (d + 3) & 3):
+                    f_goal = goal_f[axis]
+                    if end_dir is None or d2 == end_dir:
+                        # turn towards the goal along free ray
+                        dist = np.abs(cells_pos[axis][f_goal] -
+                                      cells_pos[axis][cells_t])
+                        to_goal = (cells_seg == seg[f_goal]) & \
+                            ((cells_t < f_goal) == (d2 < 2)) & \
+                            (cells_t != f_goal) & (dist >= l_end)
+                        if to_goal.any():
+                            goal_cost = cells_cost[to_goal] + \
+                                dist[to_goal] + bend
+                            i = np.argmin(goal_cost)
+                            if goal_cost[i] < best_cost:
+                                best_cost = int(goal_cost[i])
+                                best = ("turn", d2,
+                                        int(cells[to_goal][i]) * 4 + d)
+                    # every turn is followed by a straight segment that
+                    # is long enough for rounding of this turn and the
+                    # next one
+                    off, dists = turn_jumps[d2]
+                    targets = cells_t + off[k]
+                    valid = (off[k] != 0) & (
+                        (targets < ends[cells_seg]) if d2 < 2 else
+                        (targets >= starts[cells_seg])
+                    )
+                    targets = targets[valid]
+                    targets_cost = cells_cost[valid] + dists[k[valid]] + bend
+                    keep = targets_cost + h(targets, d2) < best_cost
+                    candidates[d2].append((targets[keep], targets_cost[keep],
+                                           cells[valid][keep] * 4 + d))
+
+            changed = [None] * 4
+            for d2 in range(4):
+                if not candidates[d2]:
+                    continue
+                targets, targets_cost, sources = (
+                    np.concatenate(arrs) for arrs in zip(*candidates[d2])
+                )
+                # the cheapest candidate for every state
+                order = np.lexsort((targets_cost, targets))
+                targets = targets[order]
+                first = np.ones(len(targets), dtype=bool)
+                first[1:] = targets[1:] != targets[:-1]
+                targets = targets[first]
+                targets_cost = targets_cost[order][first]
+                sources = sources[order][first]
+                better = targets_cost < entry[d2][targets]
+                targets = targets[better]
+                entry[d2][targets] = targets_cost[better]
+                source[d2][targets] = sources[better]
+                changed[d2] = targets
+
+        if best is None:
+            return None
+
+        # cells of the turns from the end of the route to its start
+        turns = []
+        if best[0] == "ray":
+            return self._jogged(start, end, best[1], turn_radius)
+        elif best[0] == "turn":
+            last_d, state = best[1], best[2]
+            f, d = state >> 2, state & 3
+            turns.append(f if (d & 1) == 0 else transposed(f, 1))
+        else:
+            last_d = d = best[1]
+            f = goal_f[d & 1]
+        while True:
+            # state that starts straight segment leading to the cell
+            axis = d & 1
+            seg, starts, ends = segments[axis]
+            if d < 2:
+                entries = np.arange(f, starts[seg[f]] - 1, -1)
+            else:
+                entries = np.arange(f, ends[seg[f]])
+            entries_cost = entry[d][entries] + np.abs(
+                cells_pos[axis][f] - cells_pos[axis][entries])
+            f_entry = entries[np.argmax(entries_cost == cost[d][f])]
+            state = source[d][f_entry]
+            if state < 0:
+                first_d = d
+                break
+            f, d = state >> 2, state & 3
+            turns.append(f if (d & 1) == 0 else transposed(f, 1))
+        turns.reverse()
+        return self._anchor_points(turns, first_d, last_d, xs, ys, start,
+                                   end, turn_radius)
+
+    @staticmethod
+    def _representatives(changes, keep):
+        """
+        Returns indexes of the representative lines of the groups of
+        identical consecutive grid lines.
+
+        Parameters
+        ----------
+        changes : np.ndarray
+            `changes[i]` is `True` if line `i+1` differs from line `i`
+        keep : Tuple[int]
+            lines that form groups on their own
+
+        Returns
+        -------
+        np.ndarray
+        """
+        changes = changes.copy()
+        n = len(changes) + 1
+        for i in keep:
+            if i > 0:
+                changes[i - 1] = True
+            if i < n - 1:
+                changes[i] = True
+        starts = np.concatenate(([0], np.flatnonzero(changes) + 1))
+        ends = np.concatenate((starts[1:] - 1, [n - 1]))
+        return (starts + ends) // 2
+
+    @staticmethod
+    def _jogged(start, end, d, turn_radius):
+        """
+        Returns anchor points of the straight route along direction
+        `d` between terminals that are shifted across it, e.g.
+        terminals in the same grid row with different `y`.
+        Terminal segments are kept along `d` and the shift is made
+        by a shallow S-bend in the middle of the route.
+        """
+        along = (end.x - start.x) if d in (0, 2) else (end.y - start.y)
+        shift = (end.y - start.y) if d in (0, 2) else (end.x - start.x)
+        if shift == 0:
+            return [start, end]
+        # S-bend turns by angle `atan(|shift|/l)`. With the chosen `l`
+        # every turn takes at most `l/8` of the adjacent segments
+        # when rounded with `turn_radius`
+        l = 2 * sqrt(turn_radius * abs(shift))
+        if abs(along) < 1.25 * l:
+            # too short for the bend, terminals are joined directly
+            return [start, end]
+        l = l if along > 0 else -l
+        mid = along / 2
+        if d in (0, 2):
+            return [start, DPoint(start.x + mid - l / 2, start.y),
+                    DPoint(start.x + mid + l / 2, end.y), end]
+        return [start, DPoint(start.x, start.y + mid - l / 2),
+                DPoint(end.x, start.y + mid + l / 2), end]
+
+    @staticmethod
+    def _anchor_points(turns, first_d, last_d, xs, ys, start, end,
+                       turn_radius):
+        """
+        Returns anchor points of the route with turns at the grid
+        cells `turns` (flat indexes of the row-major grid with grid
+        lines at `xs` and `ys`) that starts in direction `first_d` and
+        ends in direction `last_d`.
+        """
+        cnx = len(xs)
+        pts = [DPoint(xs[idx % cnx], ys[idx // cnx]) for idx in turns]
+        if not pts:
+            # straight route between terminals in the same grid row
+            # (column)
+            return GridRouter._jogged(start, end, first_d, turn_radius)
+
+        # first and last segments are aligned with terminals
+        if first_d in (0, 2):
+            pts[0].y = start.y
+        else:
+            pts[0].x = start.x
+        if last_d in (0, 2):
+            pts[-1].y = end.y
+        else:
+            pts[-1].x = end.x
+        return [start] + pts + [end]
@@ -7,20 +7,278 @@
     from classLib.helpers import fill_holes
     and call the function with desired arguments.
     ```
+    Full-chip ground planes are better processed by `pinning_holes(...)`:
+    ```python
+    from classLib.helpers import PinningGrid, pinning_holes
+    grid = PinningGrid(dx=40e3, dy=40e3, width=15e3, height=15e3)
+    holes = pinning_holes(ground_reg, grid, d=40e3,
+                          exclude=squids_reg, exclude_d=100e3)
+    ground_reg -= holes
+    ```
 """
 
 import pya
 from math import sqrt, cos, sin, atan2, pi, copysign
 from pya import Point, DPoint, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region, Path
 from pya import Trans, DTrans, CplxTrans, DCplxTrans, ICplxTrans
+from pya import Box, Vector, CellInstArray
+
+from classLib._PROG_SETTINGS import BOOLEAN_ENGINE
 
+from math import floor, ceil
 import sys
+import numpy as np
+
+
+class PinningGrid:
+    """
+    Regular lattice of rectangular pinning holes.
+    Lower left corner of the hole `(i, j)` is located at
+    `origin + DPoint(i*dx, j*dy)`. All values are rounded to database
+    units (nm).
+    """
+
+    def __init__(self, dx=40e3, dy=40e3, width=15e3, height=15e3,
+                 origin=DPoint(0, 0)):
+        """
+        Parameters
+        ----------
+        dx : float
+            period of the grid in horizontal direction
+        dy : float
+            period of the grid in vertical direction
+        width : float
+            width of the hole
+        height : float
+            height of the hole
+        origin : DPoint
+            lower left corner of one of the holes
+        """
+        self.dx = int(round(dx))
+        self.dy = int(round(dy))
+        self.width = int(round(width))
+        self.height = int(round(height))
+        self.origin = Point(int(round(origin.x)), int(round(origin.y)))
+        if (self.width >= self.dx) or (self.height >= self.dy):
+            raise ValueError("Pinning holes have to be separated by gaps.")
+
+    def indexes_range(self, box):
+        """
+        Returns ranges of hole indexes `(i0, i1), (j0, j1)` that cover
+        `box`. Upper bounds are exclusive.
+        """
+        i0 = floor((box.left - self.origin.x - self.width) / self.dx)
+        i1 = ceil((box.right - self.origin.x) / self.dx) + 1
+        j0 = floor((box.bottom - self.origin.y - self.height) / self.dy)
+        j1 = ceil((box.top - self.origin.y) / self.dy) + 1
+        return (i0, i1), (j0, j1)
+
+
+def _lattice_layout(grid, box, indexes_range=None):
+    """
+    Returns layout with lattice of holes that covers `box` placed as a
+    single cell array instance, together with top cell and layer
+    index of the holes. Holes with indexes `indexes_range` (see
+    `PinningGrid.indexes_range`) are placed instead if it is given.
+    """
+    layout = pya.Layout()
+    layout.dbu = 0.001
+    layer_i = layout.layer(pya.LayerInfo(1, 0))
+    hole_cell = layout.create_cell("pinning_hole")
+    hole_cell.shapes(layer_i).insert(Box(0, 0, grid.width, grid.height))
+    top_cell = layout.create_cell("pinning_lattice")
+    if indexes_range is None:
+        indexes_range = grid.indexes_range(box)
+    (i0, i1), (j0, j1) = indexes_range
+    top_cell.insert(CellInstArray(
+        hole_cell.cell_index(),
+        Trans(Vector(grid.origin.x + i0 * grid.dx,
+                     grid.origin.y + j0 * grid.dy)),
+        Vector(grid.dx, 0), Vector(0, grid.dy), i1 - i0, j1 - j0
+    ))
+    return layout, top_cell, layer_i
+
+
+def _lattice_holes(region, grid, d, include, exclude, exclude_d,
+                   tile_size, threads):
+    box = region.bbox()
+    if include is not None:
+        box &= include.bbox()
+    if box.empty():
+        return Region()
+    layout, top_cell, layer_i = _lattice_layout(grid, box)
+
+    tp = pya.TilingProcessor()
+    tp.dbu = layout.dbu
+    tp.threads = threads
+    tp.input("ground", region)
+    tp.input("holes", top_cell.begin_shapes_rec(layer_i))
+    # tiles are multiples of the grid period and their boundaries lie
+    # in gaps between holes, so every hole belongs to a single tile
+    nx = max(1, int(round(tile_size / grid.dx)))
+    ny = max(1, int(round(tile_size / grid.dy)))
+    x0 = grid.origin.x - (grid.dx - grid.width) / 2
+    y0 = grid.origin.y - (grid.dy - grid.height) / 2
+    tile_w = nx * grid.dx
+    tile_h = ny * grid.dy
+    x0 += floor((box.left - x0) / tile_w) * tile_w
+    y0 += floor((box.bottom - y0) / tile_h) * tile_h
+    nx_tiles = ceil((box.right - x0) / tile_w)
+    ny_tiles = ceil((box.top - y0) / tile_h)
+    tp.tile_size(tile_w * tp.dbu, tile_h * tp.dbu)
+    tp.tile_origin(x0 * tp.dbu, y0 * tp.dbu)
+    tp.tiles(nx_tiles, ny_tiles)
+    # `_tile` is `nil` if the whole region fits into a single tile
+    # region is referenced until processing is finished
+    whole = Region(Box(
+        int(x0), int(y0),
+        int(x0 + nx_tiles * tile_w), int(y0 + ny_tiles * tile_h)
+    ))
+    tp.var("whole", whole)
+    # ground is clipped by the tile frame and then shrunk. Border
+    # keeps artificial frame edges away from the tile.
+    border = int(d + exclude_d + max(grid.dx, grid.dy))
+    tp.tile_border(border * tp.dbu, border * tp.dbu)
+    tp.var("d", int(round(d)))
+    tp.var("b", border)
+    allowed = "(ground & tile.sized(b)).sized(-d)"
+    if include is not None:
+        tp.input("include", include)
+        allowed = f"({allowed} & include)"
+    if exclude is not None:
+        tp.input("exclude", exclude)
+        tp.var("exclude_d", int(round(exclude_d)))
+        allowed = f"({allowed} - (exclude & tile.sized(b))" \
+                  f".sized(exclude_d))"
+    # holes that are not clipped by `allowed` area keep their area.
+    # This is much faster than `holes.inside(allowed)`.
+    hole_area = grid.width * grid.height
+    tp.var("hole_area", hole_area)
+    holes = Region()
+    tp.output("holes_out", holes)
+    # output is not clipped, since holes of the tile border are
+    # cut off by the tile itself
+    tp.queue(
+        f"var tile = _tile ? _tile : whole; "
+        f"_output(holes_out, (holes & ({allowed} & tile))"
+        f".with_area(hole_area, hole_area + 1, false), false)"
+    )
+    tp.execute("pinning holes")
+    return holes
+
+
+def pinning_holes(region, grid=None, d=40e3, zones=None, exclude=None,
+                  exclude_d=0, tile_size=1e6, threads=None):
+    """
+        Returns pinning holes that fit into `region` shrunk by `d`.
+    Lattice of holes is placed as a cell array and selected by tiles
+    of `tile_size` processed in `threads` threads by
+    `pya.TilingProcessor`, hence no python loop over holes is done.
+        Unlike `fill_holes` lattice is common for all polygons of the
+    region.
+
+    Parameters
+    ----------
+    region : Region
+        ground plane to be filled
+    grid : PinningGrid
+        default grid of holes. `PinningGrid()` is used if `None`.
+    d : float
+        padding from polygon boundaries (both external and internal)
+    zones : List[Tuple[Region, PinningGrid]]
+        areas that are filled with their own grids instead of `grid`
+    exclude : Region
+        areas that have to stay solid, e.g. CPWs and SQUIDs
+    exclude_d : float
+        padding from `exclude` areas
+    tile_size : float
+        approximate tile size in nm. Tiles are made multiples of the
+        grid periods.
+    threads : int
+        number of threads. `BOOLEAN_ENGINE.THREADS` is used if `None`.
+
+    Returns
+    -------
+    Region
+        holes to be subtracted from `region`
+    """
+    if grid is None:
+        grid = PinningGrid()
+    if threads is None:
+        threads = BOOLEAN_ENGINE.THREADS
+    zones = list(zones) if zones is not None else []
+
+    # default grid fills everything outside the zones
+    rest = None
+    if len(zones) > 0:
+        rest = region.dup()
+        for zone_reg, _ in zones:
+            rest -= zone_reg
+    jobs = [(grid, rest)] + [(zone_grid, zone_reg)
+                             for zone_reg, zone_grid in zones]
+    holes = Region()
+    for job_grid, include in jobs:
+        holes += _lattice_holes(region, job_grid, d, include, exclude,
+                                exclude_d, tile_size, threads)
+    return holes
+
+
+def holes_to_cell_arrays(holes, grid, cell, layer_i):
+    """
+        Places `holes` generated for `grid` into `cell` as instances
+    of a single-hole cell. Every run of consecutive holes in a row
+    becomes a single cell array. Holes are placed on `layer_i` of
+    the new cell, so they have to be subtracted from the ground
+    layer by the caller (e.g. by negative layer of the mask).
+
+    Parameters
+    ----------
+    holes : Region
+        result of `pinning_holes` for the `grid`
+    grid : PinningGrid
+    cell : pya.Cell
+    layer_i : int
+
+    Returns
+    -------
+    pya.Cell
+        cell of a single hole
+    """
+    layout = cell.layout()
+    hole_cell = layout.create_cell("pinning_hole")
+    hole_cell.shapes(layer_i).insert(Box(0, 0, grid.width, grid.height))
+    if holes.is_empty():
+        return hole_cell
+    corners = np.array(
+        [(box.left, box.bottom) for box in
+         (poly.bbox() for poly in holes.each())],
+        dtype=np.int64
+    )
+    ij = (corners - [grid.origin.x, grid.origin.y]) // [grid.dx, grid.dy]
+    # sorted by rows, then by columns. Run breaks where row changes or
+    # column index is not consecutive
+    ji = np.unique(ij[:, ::-1], axis=0)
+    j, i = ji[:, 0], ji[:, 1]
+    breaks = np.flatnonzero((np.diff(j) != 0) | (np.diff(i) != 1)) + 1
+    starts = np.concatenate(([0], breaks))
+    counts = np.diff(np.concatenate((starts, [len(i)])))
+    for start, n in zip(starts, counts):
+        cell.insert(CellInstArray(
+            hole_cell.cell_index(),
+            Trans(Vector(grid.origin.x + int(i[start]) * grid.dx,
+                         grid.origin.y + int(j[start]) * grid.dy)),
+            Vector(grid.dx, 0), Vector(0, grid.dy), int(n), 1
+        ))
+    return hole_cell
 
 
 def fill_holes(obj, dx=40e3, dy=40e3, width=32e3, height=32e3, d=150e3):
     """
     Fills an object with width grid of holes
     Warning: don't use this method for the same region twice
+    Lattice of holes is anchored to the bounding box of every polygon
+    separately. Use `pinning_holes` for the lattice common for the
+    whole region.
 
     Parameters
     ----------
@@ -62,23 +320,45 @@ def fill_holes(obj, dx=40e3, dy=40e3, width=32e3, height=32e3, d=150e3):
         boundary = Path(points, 2 * d)
         poly_reg -= Region(boundary)
 
-        # Fill the boundary box with holes
-        y = bbox.p1.y + height
-        while y < bbox.p2.y - height:
-            x = bbox.p1.x + width
-            while x < bbox.p2.x - width:
-                box = pya.Box().from_dbox(pya.DBox(DPoint(x, y), DPoint(x + width, y + height)))
-                x += dx
-                t_reg.insert(box)
-            y += dy
-            
-        # Select only inner holes
-        holes_inside = t_reg.select_inside(poly_reg)
+        if all(float(v).is_integer() for v in (dx, dy, width, height)) \
+                and (width < dx) and (height < dy):
+            # the same holes are placed as a cell array lattice
+            grid = PinningGrid(dx=dx, dy=dy, width=width, height=height,
+                               origin=bbox.p1 + Vector(width, height))
+            nx = max(0, ceil((bbox.width() - 2 * grid.width) / grid.dx))
+            ny = max(0, ceil((bbox.height() - 2 * grid.height) / grid.dy))
+            layout, top_cell, layer_i = _lattice_layout(
+                grid, bbox, ((0, nx), (0, ny))
+            )
+            t_reg = Region(top_cell.begin_shapes_rec(layer_i))
+            # holes are separated by gaps, hence holes that are not
+            # clipped by `poly_reg` keep their area. This is much
+            # faster than `t_reg.select_inside(poly_reg)`.
+            hole_area = grid.width * grid.height
+            holes_inside = (t_reg & poly_reg).with_area(
+                hole_area, hole_area + 1, False
+            )
+        else:
+            # Fill the boundary box with holes
+            y = bbox.p1.y + height
+            while y < bbox.p2.y - height:
+                x = bbox.p1.x + width
+                while x < bbox.p2.x - width:
+                    box = pya.Box().from_dbox(pya.DBox(DPoint(x, y), DPoint(x + width, y + height)))
+                    x += dx
+                    t_reg.insert(box)
+                y += dy
+
+            # Select only inner holes
+            holes_inside = t_reg.select_inside(poly_reg)
         for box in holes_inside.each():
             poly.insert_hole(list(box.each_point_hull()))
 
         return poly
-    if isinstance(obj, pya.ObjectInstPath):
+    # `pya.ObjectInstPath` (GUI selection) is absent in standalone
+    # `klayout` package
+    if hasattr(pya, "ObjectInstPath") and \
+            isinstance(obj, pya.ObjectInstPath):
         # print("obj inst")
         if (obj.is_cell_inst()):
             return None
@@ -13,6 +13,13 @@
     Circle with width lot of vertices that is devided such that it has
     no more than 200 points per polygon.
     ```
+    Layers of the whole chip are split in place by a single native
+    pass per layer:
+    ```python
+    from classLib.helpers import split_layers
+    split_layers({"photo": self.region_ph,
+                  "bridges2": self.region_bridges2}, max_pts=180)
+    ```
 """
 
 import pya
@@ -26,7 +33,11 @@ reload(classLib)
 from classLib.chipDesign import ChipDesign
 from classLib.shapes import Circle
 
-from typing import Union, List
+from classLib._PROG_SETTINGS import BOOLEAN_ENGINE
+
+from math import ceil
+from collections import OrderedDict
+from typing import Union, List, Dict, Tuple
 
 split_shift_str = ""
 
@@ -51,13 +62,8 @@ def split_polygons(obj, max_pts=200, print_tree=False):
     """
     # global split_shift_str
     if isinstance(obj, pya.Region):
-        result_reg = Region()
-        reg_to_split = obj
-        # if print_tree:
-        #     print(split_shift_str + "got reg")
-        for poly in reg_to_split:
-            result_reg.insert(split_polygons([poly.dup()], max_pts, print_tree))
-        return result_reg
+        # whole region is split natively, see `split_region`
+        return split_region(obj, max_pts)
     elif isinstance(obj, list):
         if isinstance(obj[0], pya.Polygon):
             # if this is list of polygons
@@ -87,6 +93,93 @@ def split_polygons(obj, max_pts=200, print_tree=False):
                          "only `pya.Region` or `list[pya.Polygons]` are supported")
 
 
+def split_region(reg, max_pts=200, tile_size=None, threads=None):
+    """
+        Returns copy of `reg` where every polygon has less than
+    `max_pts` points (including points of holes). Polygons are broken
+    by KLayout in a single native pass over the region.
+        If `tile_size` is given, region is processed by square tiles in
+    `threads` threads. Polygons crossing tile boundaries are
+    additionally cut by these boundaries.
+
+    Parameters
+    ----------
+    reg : Region
+    max_pts : int
+        polygons will have at most `max_pts - 1` points
+    tile_size : Optional[float]
+        tile size in nm
+    threads : Optional[int]
+        number of threads. `BOOLEAN_ENGINE.THREADS` is used if `None`.
+
+    Returns
+    -------
+    Region
+    """
+    box = reg.bbox()
+    if (tile_size is None) or box.empty() or \
+            (max(box.width(), box.height()) <= tile_size):
+        result = reg.dup()
+        result.break_(max_pts - 1, 0)
+        return result
+
+    tp = pya.TilingProcessor()
+    tp.dbu = 0.001
+    tp.threads = BOOLEAN_ENGINE.THREADS if threads is None else threads
+    tp.input("input", reg)
+    tp.tile_size(tile_size * tp.dbu, tile_size * tp.dbu)
+    tp.tiles(ceil(box.width() / tile_size), ceil(box.height() / tile_size))
+    tp.tile_origin(box.left * tp.dbu, box.bottom * tp.dbu)
+    tp.var("max_pts", max_pts - 1)
+    result = Region()
+    tp.output("output", result)
+    # broken polygons are not clipped by output, because clipping
+    # merges them back
+    tp.queue("var r = input & _tile; r.break(max_pts, 0); "
+             "_output(output, r, false)")
+    tp.execute("split polygons")
+    return result
+
+
+def split_layers(regions: Dict[str, Region], max_pts=200, tile_size=None,
+                 threads=None, verbose=True):
+    """
+        Splits polygons of every region in `regions` in place by
+    `split_region`.
+        Returns statistics of the layers: number of polygons before and
+    after splitting. Every resulting polygon is guaranteed to have
+    less than `max_pts` points, so polygons are not scanned again.
+
+    Parameters
+    ----------
+    regions : Dict[str, Region]
+        layer name -> region of the layer
+    max_pts : int
+        polygons will have at most `max_pts - 1` points
+    tile_size : Optional[float]
+        see `split_region`
+    threads : Optional[int]
+        see `split_region`
+    verbose : bool
+        print statistics
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        layer name -> `(polygons_n_before, polygons_n_after)`
+    """
+    stats = OrderedDict()
+    for name, reg in regions.items():
+        polygons_n = reg.count()
+        reg.assign(split_region(reg, max_pts, tile_size, threads))
+        stats[name] = (polygons_n, reg.count())
+        if verbose:
+            print(f"{name}: {polygons_n} polygons are split into "
+                  f"{stats[name][1]} polygons with less than {max_pts} "
+                  f"points")
+    return stats
+
+
 class MyDesign(ChipDesign):
     def draw(self):
         origin = DPoint(0, 0)
@@ -1,6 +1,17 @@
 import pya
 from pya import Region
 
+from classLib._PROG_SETTINGS import BOOLEAN_ENGINE
+
+from math import ceil, cos, radians
+from collections import OrderedDict
+import hashlib
+
+# results of `resolved_region` by fingerprints of source regions
+_RESOLVED_CACHE = OrderedDict()
+_RESOLVED_CACHE_SIZE = 16
+
+
 def extended_region(reg, extension=0):
     """
     extends region in outer direction by `extension` value.
@@ -16,21 +27,240 @@ def extended_region(reg, extension=0):
     Region
         extended version of region
     """
-    tmp_reg = Region()
-    ep = pya.EdgeProcessor()
-    for poly in reg.each():
-        tmp_reg.insert(
-            ep.simple_merge_p2p(
-                [
-                    poly.sized(
-                        extension,
-                        extension,
-                        2
-                    )
-                ],
-                False,
-                False,
-                1
-            )
+    return sized_region(reg, extension)
+
+
+def sizing_passes(dx, dy):
+    """
+    Returns list of `(dx, dy)` sizings that are applied one by one.
+    `Region.sized` ignores sign of one of the values if they have
+    different signs, hence such sizing is split into passes along `x`
+    and along `y` axes.
+    """
+    if dx * dy < 0:
+        return [(dx, 0), (0, dy)]
+    return [(dx, dy)]
+
+
+# `Region.sized` mode -> maximal bending angle (degrees) of the corner
+# that is extended without cut off
+_SIZING_MODE_ANGLES = {0: 0, 1: 45, 2: 90, 3: 135, 4: 168}
+
+
+def sizing_reach(dx, dy, mode=2):
+    """
+    Returns maximal distance in nm the polygon boundary moves by the
+    sizing passes of `(dx, dy)`. Extended corners move by
+    `d/cos(angle/2)` where `angle` is the bending angle limited
+    by `mode`.
+    """
+    angle = _SIZING_MODE_ANGLES.get(mode, 179)
+    return sum(ceil(max(abs(pass_dx), abs(pass_dy)) / cos(radians(angle / 2)))
+               for pass_dx, pass_dy in sizing_passes(dx, dy))
+
+
+def sized_region(reg, dx, dy=None, mode=2, tile_size=None, threads=None):
+    """
+        Returns `reg` which polygon edges are shifted outwards by `dx`
+    along `x` axis and by `dy` along `y` axis (inwards for negative
+    values). Whole region is sized by a single native operation
+    instead of sizing and merging its polygons one by one.
+    `dx` and `dy` of different signs are applied by two consecutive
+    passes (see `sizing_passes`).
+        If `tile_size` is given, region is processed by square tiles
+    in `threads` threads. Tiles overlap by the distance corners are
+    moved (see `sizing_reach`), so the result does not depend on
+    tiling, but its polygons are cut by tile boundaries (cut points
+    are rounded to the database grid).
+
+    Parameters
+    ----------
+    reg : Region
+    dx : float
+        sizing along `x` axis in nm
+    dy : Optional[float]
+        sizing along `y` axis in nm. Equals to `dx` if `None`.
+    mode : int
+        corner interpolation mode of `Region.sized`
+    tile_size : Optional[float]
+        tile size in nm
+    threads : Optional[int]
+        number of threads. `BOOLEAN_ENGINE.THREADS` is used if `None`.
+
+    Returns
+    -------
+    Region
+    """
+    dx = int(round(dx))
+    dy = dx if dy is None else int(round(dy))
+    passes = sizing_passes(dx, dy)
+    box = reg.bbox()
+    if (tile_size is None) or box.empty() or \
+            (max(box.width(), box.height()) <= tile_size):
+        result = reg
+        for pass_dx, pass_dy in passes:
+            result = result.sized(pass_dx, pass_dy, mode)
+        return result
+
+    tp = pya.TilingProcessor()
+    tp.dbu = 0.001
+    tp.threads = BOOLEAN_ENGINE.THREADS if threads is None else threads
+    tp.input("input", reg)
+    # tiles overlap by the distance corners are extended by
+    border = sizing_reach(dx, dy, mode) + 1
+    # tiles have to cover sized polygons
+    box = box.enlarged(border, border)
+    tp.tile_size(tile_size * tp.dbu, tile_size * tp.dbu)
+    tp.tiles(ceil(box.width() / tile_size), ceil(box.height() / tile_size))
+    tp.tile_origin(box.left * tp.dbu, box.bottom * tp.dbu)
+    tp.tile_border(border * tp.dbu, border * tp.dbu)
+    tp.var("mode", mode)
+    result = Region()
+    tp.output("output", result)
+    tp.var("border", border)
+    # input polygons are clipped by the tile frame, frame edges are
+    # kept away from the tile by the border
+    sizing = "".join(f".sized({pass_dx}, {pass_dy}, mode)"
+                     for pass_dx, pass_dy in passes)
+    tp.queue(f"_output(output, (input & _tile.sized(border)){sizing})")
+    tp.execute("sized region")
+    return result
+
+
+def _region_fingerprint(reg):
+    # digest of the polygons themselves. Storage id of the region is
+    # kept by in-place `insert`, `merge` and `transform`, so it can't
+    # be used.
+    return (hashlib.sha1(regions_to_bytes([reg])).hexdigest(),
+            reg.merged_semantics)
+
+
+def _resolved_polygon(poly, min_vertices=True):
+    resolved = poly.resolved_holes()
+    if min_vertices:
+        # cut lines are drawn along one axis, so the other axis is
+        # tried in the rotated frame
+        rotated = poly.transformed(pya.Trans.R90).resolved_holes().\
+            transformed(pya.Trans.R270)
+        if rotated.num_points() < resolved.num_points():
+            resolved = rotated
+    return resolved
+
+
+def _resolved_polygons(poly, min_vertices=True, max_pts=None):
+    resolved = _resolved_polygon(poly, min_vertices)
+    if (max_pts is None) or (resolved.num_points() < max_pts):
+        return [resolved]
+    # cut lines added too many points, polygon is halved and its parts
+    # are resolved separately
+    return [part_resolved for part in poly.split()
+            for part_resolved in _resolved_polygons(part, min_vertices,
+                                                    max_pts)]
+
+
+def resolved_region(reg, min_vertices=True, max_pts=None, cache=False):
+    """
+        Returns `reg` which polygons have no holes. Holes are
+    connected to the hulls of their polygons by cut lines, as required
+    by GDS and Sonnet.
+        Region is merged (unless its `merged_semantics` is off) and
+    polygons without holes are passed natively. Only polygons with
+    holes are resolved one by one. Cut lines of every such polygon
+    are drawn both horizontally and vertically and the variant with
+    less vertices is kept if `min_vertices` is `True`.
+        Any following boolean operation or merge of the result restores
+    holes, hence resolution is better done last, right before export.
+
+    Parameters
+    ----------
+    reg : Region
+    min_vertices : bool
+        choose cut lines direction that adds less vertices
+    max_pts : Optional[int]
+        resolved polygons that get `max_pts` points or more are
+        split in halves that are resolved separately. Polygons without
+        holes are not checked.
+    cache : bool
+        results are cached by digest of polygons of `reg`.
+        Repeated calls for the region with the same polygons return
+        copy of the cached result. Digest costs serialization of the
+        region, so caching pays off only for repeated calls.
+
+    Returns
+    -------
+    Region
+    """
+    key = None
+    if cache:
+        key = (_region_fingerprint(reg), min_vertices, max_pts)
+        if key in _RESOLVED_CACHE:
+            _RESOLVED_CACHE.move_to_end(key)
+            return _RESOLVED_CACHE[key].dup()
+
+    with_holes, result = reg.split_with_holes(1, None)
+    if not with_holes.is_empty():
+        result.insert(
+            [resolved for poly in with_holes.each()
+             for resolved in _resolved_polygons(poly, min_vertices,
+                                                max_pts)]
         )
-    return tmp_reg
\ No newline at end of file
+
+    if cache:
+        _RESOLVED_CACHE[key] = result.dup()
+        if len(_RESOLVED_CACHE) > _RESOLVED_CACHE_SIZE:
+            _RESOLVED_CACHE.popitem(last=False)
+    return result
+
+
+def regions_to_bytes(regions):
+    """
+    Serializes regions into compact OASIS byte stream.
+    Region `i` is stored on layer `(i, 0)`.
+
+    Parameters
+    ----------
+    regions : List[Region]
+        regions to serialize
+
+    Returns
+    -------
+    bytes
+        OASIS stream. See `regions_from_bytes` for deserialization.
+    """
+    layout = pya.Layout()
+    cell = layout.create_cell("regions")
+    for i, reg in enumerate(regions):
+        layer_i = layout.layer(pya.LayerInfo(i, 0))
+        cell.shapes(layer_i).insert(reg)
+    options = pya.SaveLayoutOptions()
+    options.format = "OASIS"
+    return layout.write_bytes(options)
+
+
+def regions_from_bytes(data, regions_n):
+    """
+    Restores regions serialized by `regions_to_bytes`.
+
+    Parameters
+    ----------
+    data : bytes
+        OASIS stream
+    regions_n : int
+        number of serialized regions. Empty regions are not
+        present in the stream.
+
+    Returns
+    -------
+    List[Region]
+    """
+    layout = pya.Layout()
+    layout.read_bytes(data)
+    cell = layout.top_cell()
+    regions = []
+    for i in range(regions_n):
+        reg = Region()
+        layer_i = layout.find_layer(pya.LayerInfo(i, 0))
+        if (cell is not None) and (layer_i is not None):
+            reg.insert(cell.shapes(layer_i))
+        regions.append(reg)
+    return regions
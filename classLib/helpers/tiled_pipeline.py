@@ -0,0 +1,230 @@
+"""
+    Chain of full-chip post-processing stages (crop, inversion,
+    overetching, pinning holes, splitting and hole resolution) that is
+    executed tile by tile by `pya.TilingProcessor`.
+    Every tile is processed by a single script in one of the
+    `threads` threads, so intermediate regions of the whole layer are
+    never created and memory consumption is bounded by the tile size.
+    Tiles overlap by the border that covers interaction range of all
+    stages, hence the result does not depend on tiling, but its
+    polygons are cut by tile boundaries.
+
+    Typical usage at the end of the `draw()` of the design:
+    ```python
+    pipeline = self.tiled_pipeline(tile_size=2e6)
+    pipeline.sized(*FABRICATION.overetching("photo"))
+    pipeline.inverse()
+    pipeline.split(max_pts=180)
+    pipeline.resolve_holes()
+    self.region_ph = pipeline.run(self.region_ph)
+    ```
+"""
+import pya
+from pya import Region, Box
+
+from classLib._PROG_SETTINGS import BOOLEAN_ENGINE
+from classLib.helpers.pinning_grid import PinningGrid, _lattice_layout
+from classLib.helpers.region_manipulation import resolved_region, \
+    sizing_passes, sizing_reach
+
+from math import ceil
+
+
+def _box(box):
+    return Box(box) if isinstance(box, pya.DBox) else box
+
+
+class _ResolvingReceiver(pya.TileOutputReceiver):
+    """
+    Resolves holes of every tile output and collects result.
+    """
+
+    def __init__(self, result, min_vertices, max_pts):
+        self.result = result
+        self.min_vertices = min_vertices
+        self.max_pts = max_pts
+
+    def put(self, ix, iy, tile, obj, dbu, clip):
+        # polygons of the tile are already broken and must not be
+        # merged back
+        reg = obj.dup()
+        reg.merged_semantics = False
+        self.result.insert(resolved_region(reg, self.min_vertices,
+                                           self.max_pts, cache=False))
+
+
+class TiledPipeline:
+    def __init__(self, box, tile_size=2e6, border=None, threads=None):
+        """
+        Parameters
+        ----------
+        box : Union[Box, DBox]
+            processed area, e.g. chip box or reticle box.
+            Geometry outside the box is dropped.
+        tile_size : float
+            tile size in nm
+        border : Optional[float]
+            tiles overlap in nm. Calculated from the stages if `None`.
+        threads : Optional[int]
+            number of threads. `BOOLEAN_ENGINE.THREADS` is used if `None`.
+        """
+        self.box = _box(box)
+        self.tile_size = tile_size
+        self.border = border
+        self.threads = threads
+        # script statements of the stages that transform `r` and
+        # their interaction ranges in nm
+        self._stages = []
+        # `name -> object` that are passed to the tiling processor
+        self._inputs = {}
+        self._vars = {}
+        self.max_pts = None
+        self.resolve = False
+        self.min_vertices = True
+
+    def _stage(self, statement, reach=0):
+        self._stages.append((statement, reach))
+        return self
+
+    def crop(self, box=None):
+        """
+        Erases everything outside the `box` (pipeline box if `None`).
+        """
+        name = f"crop_{len(self._stages)}"
+        self._vars[name] = Region(self.box if box is None else _box(box))
+        return self._stage(f"r = r & {name}")
+
+    def inverse(self, box=None):
+        """
+        Inverses empty regions and solid polygons inside the `box`
+        (pipeline box if `None`). See `ChipDesign.inverse_destination`.
+        """
+        name = f"inverse_{len(self._stages)}"
+        self._vars[name] = Region(self.box if box is None else _box(box))
+        return self._stage(f"r = r ^ ({name} & frame)")
+
+    def sized(self, dx, dy=None, mode=2):
+        """
+        Shifts polygon edges outwards by `dx` along `x` axis and by
+        `dy` along `y` axis. See `sized_region`.
+        """
+        dx = int(round(dx))
+        dy = dx if dy is None else int(round(dy))
+        passes = sizing_passes(dx, dy)
+        sizing = "".join(f".sized({pass_dx}, {pass_dy}, {mode})"
+                         for pass_dx, pass_dy in passes)
+        return self._stage(f"r = r{sizing}", sizing_reach(dx, dy, mode))
+
+    def pinning_holes(self, grid: PinningGrid = None, d=40e3,
+                      exclude=None, exclude_d=0):
+        """
+        Erases pinning holes of the `grid` from the polygons. Holes
+        fit into polygons shrunk by `d` and keep away from `exclude`
+        areas by `exclude_d`. See `pinning_holes`.
+        """
+        if grid is None:
+            grid = PinningGrid()
+        i = len(self._stages)
+        layout, top_cell, layer_i = _lattice_layout(grid, self.box)
+        # layout is referenced until processing is finished
+        self._inputs[f"holes_{i}"] = (
+            layout, top_cell.begin_shapes_rec(layer_i)
+        )
+        allowed = f"r.sized({-int(round(d))})"
+        if exclude is not None:
+            self._inputs[f"exclude_{i}"] = (None, exclude)
+            allowed = f"({allowed} - (exclude_{i} & frame)" \
+                      f".sized({int(round(exclude_d))}))"
+        # holes that are not clipped by `allowed` area keep their area
+        hole_area = grid.width * grid.height
+        return self._stage(
+            f"r = r - (holes_{i} & ({allowed} & frame))"
+            f".with_area({hole_area}, {hole_area + 1}, false)",
+            int(d + exclude_d) + max(grid.width, grid.height)
+        )
+
+    def split(self, max_pts=200):
+        """
+        Result polygons will have less than `max_pts` points.
+        Splitting is done after all other stages except hole
+        resolution. See `split_region`.
+        """
+        self.max_pts = max_pts
+        return self
+
+    def resolve_holes(self, min_vertices=True):
+        """
+        Holes of the result polygons are resolved last.
+        See `resolved_region`.
+        """
+        self.resolve = True
+        self.min_vertices = min_vertices
+        return self
+
+    def _script(self):
+        statements = [
+            # tiles cover the box with excess
+            "var tile = _tile ? _tile & whole : whole",
+            "var frame = tile.sized(border)",
+            # input is clipped by the tile frame, frame edges are kept
+            # away from the tile by the border
+            "var r = input & frame"
+        ]
+        statements += [statement for statement, _ in self._stages]
+        statements.append("r = r & tile")
+        if self.max_pts is not None:
+            statements.append(f"r.break({self.max_pts - 1}, 0)")
+        # broken polygons are not clipped by output, because clipping
+        # merges them back
+        statements.append("_output(output, r, false)")
+        return "; ".join(statements)
+
+    def run(self, reg):
+        """
+        Processes `reg` by all stages.
+
+        Parameters
+        ----------
+        reg : Region
+
+        Returns
+        -------
+        Region
+        """
+        box = self.box
+        border = self.border
+        if border is None:
+            border = sum(reach for _, reach in self._stages)
+        border = int(ceil(border)) + 1
+
+        tp = pya.TilingProcessor()
+        tp.dbu = 0.001
+        tp.threads = BOOLEAN_ENGINE.THREADS if self.threads is None \
+            else self.threads
+        tp.input("input", reg)
+        for name, (_, obj) in self._inputs.items():
+            tp.input(name, obj)
+        nx = max(1, ceil(box.width() / self.tile_size))
+        ny = max(1, ceil(box.height() / self.tile_size))
+        tp.tile_size(ceil(box.width() / nx) * tp.dbu,
+                     ceil(box.height() / ny) * tp.dbu)
+        tp.tiles(nx, ny)
+        tp.tile_origin(box.left * tp.dbu, box.bottom * tp.dbu)
+        tp.tile_border(border * tp.dbu, border * tp.dbu)
+        # `_tile` is `nil` if the whole box is a single tile
+        whole = Region(box)
+        tp.var("whole", whole)
+        tp.var("border", border)
+        for name, obj in self._vars.items():
+            tp.var(name, obj)
+
+        result = Region()
+        if self.resolve:
+            receiver = _ResolvingReceiver(result, self.min_vertices,
+                                          self.max_pts)
+            tp.output("output", receiver)
+        else:
+            tp.output("output", result)
+        tp.queue(self._script())
+        tp.execute("tiled pipeline")
+        return result
@@ -108,12 +108,10 @@ class CPWResonator():
         # print("Primitive_start:", )
         # print("Connections[0] 2:", self._line.connections[0])
 
-        self.start = list(self._line.primitives.values())[0].connections[0]
-        self.end = list(self._line.primitives.values())[-1].connections[-1]
-        self.alpha_start =\
-                    list(self._line.primitives.values())[0].angle_connections[0]
-        self.alpha_end =\
-                    list(self._line.primitives.values())[-1].angle_connections[-1]
+        self.start = self._line.start
+        self.end = self._line.end
+        self.alpha_start = self._line.alpha_start
+        self.alpha_end = self._line.alpha_end
 
 #        print(line.get_total_length())
 #        print(line._segment_lengths)
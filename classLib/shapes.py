@@ -394,7 +394,7 @@ class TmonT(ComplexBase):
 
 
 class Circle(ElementBase):
-    def __init__(self, center, r, trans_in=None, n_pts=50, inverse=False,
+    def __init__(self, center, r, trans_in=None, n_pts=None, inverse=False,
                  offset_angle=0):
         """
 
@@ -406,8 +406,10 @@ class Circle(ElementBase):
             circle radius
         trans_in : DcplxTrans
             initial transformation, None by default
-        n_pts : int
-            number of points comprising the circumference of the ring (50 by default)
+        n_pts : Optional[int]
+            number of points comprising the circumference of the circle.
+            If `None`, it is chosen according to `PROGRAM.ARC_CHORD_ERROR`
+            (see `classLib._PROG_SETTINGS.arc_pts_n`).
         inverse : bool
             if True then the ring is subtracted from width layer (False by default)
         offset_angle : float
@@ -417,6 +419,8 @@ class Circle(ElementBase):
         self.center = center
         self._offset_angle = offset_angle
         self.r = r
+        if n_pts is None:
+            n_pts = circle_pts_n(r)
         self.n_pts = n_pts
         super().__init__(center, trans_in, inverse=inverse)
 
@@ -439,6 +443,9 @@ class Circle(ElementBase):
     def _refresh_named_connections(self):
         self.center = self.connections[0]
 
+    def _geometry_cache_key(self):
+        return self.r, self.n_pts, self._offset_angle, self.inverse
+
 
 class Kolbaska(ElementBase):
     """
@@ -506,7 +513,7 @@ class DPathCL(DPath, ElementBase):
         # TODO: implement connection angles
         DPath.__init__(self, pts, width, bgn_ext, end_ext, round)
         self.polygon = self.round_corners(
-            bendings_r, PROGRAM.ARC_PTS_N, 1
+            bendings_r, circle_pts_n(bendings_r + width / 2), 1
         ).polygon()
         ElementBase.__init__(self, DPoint(0, 0), trans_in=trans_in)
 
@@ -524,11 +531,13 @@ class DPathCL(DPath, ElementBase):
 
 class Circle_arc(ElementBase):
     def __init__(self, center, r, alpha_start=0, alpha_end=pi,
-                 trans_in=None, n_pts=50, solid=True):
+                 trans_in=None, n_pts=None, solid=True):
         self.center = center
         self.r = r
         self.alpha_start = alpha_start
         self.alpha_end = alpha_end
+        if n_pts is None:
+            n_pts = arc_pts_n(r, alpha_end - alpha_start)
         self.n_pts = n_pts
         self.solid = solid
         super(Circle_arc, self).__init__(center, trans_in)
@@ -553,7 +562,7 @@ class Circle_arc(ElementBase):
 
 
 class Ring(ElementBase):
-    def __init__(self, origin, outer_r, thickness, n_pts=50, trans_in=None,
+    def __init__(self, origin, outer_r, thickness, n_pts=None, trans_in=None,
                  inverse=False):
         """
 
@@ -565,8 +574,10 @@ class Ring(ElementBase):
             outer radius of the ring
         thickness : float
             thickness of the ring
-        n_pts : int
-            number of points comprising the circumference of the ring (50 by default)
+        n_pts : Optional[int]
+            number of points comprising the circumference of the ring.
+            If `None`, it is chosen according to `PROGRAM.ARC_CHORD_ERROR`
+            (see `classLib._PROG_SETTINGS.arc_pts_n`).
         trans_in : DCplxTrans
             initial transformation (None by default)
         inverse : bool
@@ -574,6 +585,8 @@ class Ring(ElementBase):
         """
         self.r = outer_r
         self.t = thickness
+        if n_pts is None:
+            n_pts = circle_pts_n(outer_r)
         self.n_pts = n_pts
         super().__init__(origin, trans_in, inverse)
 
@@ -596,6 +609,9 @@ class Ring(ElementBase):
         else:
             self.metal_region.insert(ring_poly)
 
+    def _geometry_cache_key(self):
+        return self.r, self.t, self.n_pts, self.inverse
+
 
 class IsoTrapezoid(ElementBase):
     """@brief: class represents an isosceles trapezoid
@@ -1,6 +1,7 @@
 import pya
 from pya import Point, DPoint, Vector, DVector, DSimplePolygon, SimplePolygon, DPolygon, Polygon, Region
 from classLib import *
+from classLib.helpers import resolved_region
 from sonnetSim.matlabClient import MatlabClient
 from sonnetSim.pORT_TYPES import PORT_TYPES
 
@@ -92,14 +93,12 @@ class SonnetLab(MatlabClient):
         else:
             r_cell = Region(cell.begin_shapes_rec(layer_i))
 
-        for poly in r_cell:
-            # print("sending polygon")
-
-            # No internal holes are allowed. This is
-            # only KLayout specific internal representation.
-            # So there is cuts in the polygon with internal
-            # holes introduced by `resolved_holes()`.
-            self.send_polygon(poly.resolved_holes())
+        # No internal holes are allowed. This is
+        # only KLayout specific internal representation.
+        # So there is cuts in the polygon with internal
+        # holes introduced by `resolved_region()`.
+        for poly in resolved_region(r_cell).each():
+            self.send_polygon(poly)
 
     def start_simulation(self, wait=True):
         '''